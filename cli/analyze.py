@@ -0,0 +1,122 @@
+import json
+import time
+from collections import Counter
+from lexer.lexical_analyzer import LexicalAnalyzer, map_file
+from models.token import TokenType, TOKEN_TYPES, TOKEN_TYPE_CODES, KIND_TYPES
+from parser.topdown_parser import TopDownParser
+
+ERROR_CODE = TOKEN_TYPE_CODES[TokenType.ERROR]
+EOF_CODE = TOKEN_TYPE_CODES[TokenType.EOF]
+
+def analyze_path(path: str, parse: bool = False, max_errors: int = 20, cache=None) -> dict:
+    """Dosyayı mmap ile analiz et; token sayıları, hatalar ve süreleri döndür
+
+    cache (cli.disk_cache.DiskCache) verilirse içeriği daha önce analiz
+    edilmiş dosyaların sonucu özet ve tek okuma ile diskten gelir.
+    """
+    source = map_file(path)
+    key = None
+    if cache is not None:
+        key = cache.key(source)
+        entry = cache.load(key)
+        if entry is not None and (entry.parsed or not parse):
+            return limit_result(path, entry.result, parse, max_errors, cached=True)
+
+    lexer = LexicalAnalyzer()
+
+    start = time.perf_counter()
+    buffer = lexer.analyze_bytes(source)
+    lex_time = time.perf_counter() - start
+
+    counts = Counter()  # Tür kodu -> sayı
+    for kind, count in Counter(buffer.kinds).items():
+        counts[TOKEN_TYPE_CODES[KIND_TYPES[kind]]] += count
+    counts.pop(EOF_CODE, None)
+    lex_errors = []
+    if counts.get(ERROR_CODE):
+        for index, kind in enumerate(buffer.kinds):
+            if kind == ERROR_CODE:
+                lex_errors.append({'line': buffer.lines[index], 'column': buffer.columns[index],
+                                   'value': buffer.value(index)})
+                if cache is None and len(lex_errors) >= max_errors:
+                    break
+
+    result = {
+        'bytes': len(source),
+        'tokens': sum(counts.values()),
+        'token_counts': {TOKEN_TYPES[kind].value: count for kind, count in sorted(counts.items())},
+        'lexical_errors': counts.get(ERROR_CODE, 0),
+        'lexical_error_samples': lex_errors,
+        'lex_seconds': lex_time,
+    }
+
+    if parse:
+        start = time.perf_counter()
+        parser = TopDownParser(buffer)
+        parser.parse()
+        result['parse_seconds'] = time.perf_counter() - start
+        result['parse_errors'] = len(parser.errors)
+        errors = parser.errors if cache is not None else parser.errors[:max_errors]
+        result['parse_error_samples'] = [{'code': error.code, 'start': error.start, 'end': error.end,
+                                          'message': error.message} for error in errors]
+
+    if cache is not None:
+        cache.store(key, result, parse)  # Önbellekte tüm hata örnekleri tutulur
+    return limit_result(path, result, parse, max_errors)
+
+def limit_result(path: str, result: dict, parse: bool, max_errors: int, cached: bool = False) -> dict:
+    """Sonucu yola bağla, hata örneklerini max_errors ile sınırla (parse istenmediyse parse alanları atılır)"""
+    limited = {'path': path}
+    for name, value in result.items():
+        if name.startswith('parse_') and not parse:
+            continue
+        limited[name] = value[:max_errors] if name.endswith('_samples') else value
+    if cached:
+        # Süreler özgün çalıştırmaya aittir; bu çalıştırmada lex/parse yapılmadı
+        for name in ('lex_seconds', 'parse_seconds'):
+            if name in limited:
+                limited[name] = 0.0
+        limited['cached'] = True
+    return limited
+
+def print_report(result: dict):
+    """Analiz sonucunu okunabilir biçimde yazdır"""
+    print(f"Dosya: {result['path']} ({result['bytes']} bayt)")
+    print(f"Token sayısı: {result['tokens']}")
+    for name, count in result['token_counts'].items():
+        print(f"  {name:12s} {count}")
+
+    print(f"Lexical hatalar: {result['lexical_errors']}")
+    for error in result['lexical_error_samples']:
+        print(f"  Satır {error['line']}, Sütun {error['column']}: {error['value']!r}")
+
+    if 'parse_errors' in result:
+        print(f"Syntax hataları: {result['parse_errors']}")
+        for error in result['parse_error_samples']:
+            print(f"  {error['message']}")
+
+    if result.get('cached'):
+        print("Süre: önbellekten (lex/parse yapılmadı)")
+        return
+    timing = f"Süre: lex {result['lex_seconds']:.3f} s"
+    if 'parse_seconds' in result:
+        timing += f", parse {result['parse_seconds']:.3f} s"
+    print(timing)
+
+def run(args) -> int:
+    """analyze komutu"""
+    result = analyze_path(args.file, parse=args.parse, max_errors=args.max_errors)
+    if args.json:
+        print(json.dumps(result, ensure_ascii=False))
+    else:
+        print_report(result)
+    return 0
+
+def add_parser(subparsers):
+    """analyze alt komutunu kaydet"""
+    command = subparsers.add_parser('analyze', help="Dosyayı GUI olmadan (mmap ile) analiz et")
+    command.add_argument('file', help="Analiz edilecek C kaynak dosyası")
+    command.add_argument('--parse', action='store_true', help="Token'ları parser ile de çözümle")
+    command.add_argument('--json', action='store_true', help="Sonucu JSON olarak yazdır")
+    command.add_argument('--max-errors', type=int, default=20, help="Listelenecek en fazla hata sayısı")
+    command.set_defaults(handler=run)
@@ -0,0 +1,127 @@
+import json
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import islice
+from cli.analyze import analyze_path
+from cli.disk_cache import DiskCache
+
+SOURCE_EXTENSIONS = ('.c', '.h')
+
+def iter_source_files(root: str):
+    """Dizin ağacındaki .c/.h dosyalarını sıralı olarak üret"""
+    for directory, subdirectories, files in os.walk(root):
+        subdirectories.sort()
+        for name in sorted(files):
+            if name.endswith(SOURCE_EXTENSIONS):
+                yield os.path.join(directory, name)
+
+def iter_chunks(iterable, size: int):
+    """Öğeleri size uzunluğunda listeler halinde grupla"""
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+def analyze_chunk(paths, parse: bool, max_errors: int, cache_dir: str = None):
+    """Bir grup dosyayı işçi süreçte analiz et (hatalar sonuç olarak döner)"""
+    cache = DiskCache(cache_dir) if cache_dir else None
+    results = []
+    for path in paths:
+        start = time.perf_counter()
+        try:
+            result = analyze_path(path, parse=parse, max_errors=max_errors, cache=cache)
+        except Exception as e:
+            result = {'path': path, 'error': f"{type(e).__name__}: {e}"}
+        result['seconds'] = time.perf_counter() - start
+        results.append(result)
+    return results
+
+def run_batch(root: str, output, jobs: int = None, chunk_size: int = 16,
+              parse: bool = True, max_errors: int = 20, cache_dir: str = None,
+              cache_max_bytes: int = None) -> dict:
+    """Dizindeki dosyaları süreç havuzunda analiz et, sonuçları JSON Lines olarak akıt
+
+    cache_dir verilirse içeriği değişmemiş dosyalar disk önbelleğinden okunur;
+    cache_max_bytes verilirse çalışma sonunda önbellek bu boyuta budanır.
+    """
+    jobs = jobs or os.cpu_count() or 1
+    max_pending = jobs * 2  # Bellek sınırı için aynı anda bekleyen grup sayısı
+    summary = {'files': 0, 'failed': 0, 'cached': 0, 'tokens': 0, 'lexical_errors': 0,
+               'parse_errors': 0, 'bytes': 0, 'cpu_seconds': 0.0}
+    start = time.perf_counter()
+
+    def collect(future):
+        for result in future.result():
+            output.write(json.dumps(result, ensure_ascii=False) + '\n')
+            summary['files'] += 1
+            summary['cpu_seconds'] += result['seconds']
+            if 'error' in result:
+                summary['failed'] += 1
+                continue
+            summary['cached'] += result.get('cached', False)
+            summary['bytes'] += result['bytes']
+            summary['tokens'] += result['tokens']
+            summary['lexical_errors'] += result['lexical_errors']
+            summary['parse_errors'] += result.get('parse_errors', 0)
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        pending = set()
+        for chunk in iter_chunks(iter_source_files(root), chunk_size):
+            pending.add(executor.submit(analyze_chunk, chunk, parse, max_errors, cache_dir))
+            if len(pending) >= max_pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    collect(future)
+        for future in pending:
+            collect(future)
+
+    if cache_dir and cache_max_bytes is not None:
+        summary['cache_pruned'] = DiskCache(cache_dir).prune(cache_max_bytes)
+    summary['wall_seconds'] = time.perf_counter() - start
+    summary['jobs'] = jobs
+    return summary
+
+def print_summary(summary: dict, stream):
+    """Toplu analiz özetini yazdır"""
+    wall = summary['wall_seconds']
+    rate = summary['files'] / wall if wall else 0.0
+    print(f"Dosya: {summary['files']} (başarısız {summary['failed']}, önbellekten {summary['cached']}), "
+          f"{summary['bytes']} bayt, {summary['tokens']} token", file=stream)
+    print(f"Lexical hatalar: {summary['lexical_errors']}, syntax hataları: {summary['parse_errors']}", file=stream)
+    print(f"Süre: {wall:.2f} s duvar, {summary['cpu_seconds']:.2f} s işlem "
+          f"({summary['jobs']} süreç, {rate:.1f} dosya/s)", file=stream)
+
+def run(args) -> int:
+    """batch komutu"""
+    cache_max_bytes = args.cache_max_mb * 1024 * 1024 if args.cache_max_mb is not None else None
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as output:
+            summary = run_batch(args.directory, output, args.jobs, args.chunk_size,
+                                not args.no_parse, args.max_errors, args.cache_dir, cache_max_bytes)
+    else:
+        summary = run_batch(args.directory, sys.stdout, args.jobs, args.chunk_size,
+                            not args.no_parse, args.max_errors, args.cache_dir, cache_max_bytes)
+    print_summary(summary, sys.stderr)
+
+    if args.fail_on_errors and (summary['failed'] or summary['lexical_errors'] or summary['parse_errors']):
+        return 1
+    return 0
+
+def add_parser(subparsers):
+    """batch alt komutunu kaydet"""
+    command = subparsers.add_parser('batch', help="Dizin ağacındaki tüm .c/.h dosyalarını paralel analiz et")
+    command.add_argument('directory', help="Taranacak kök dizin")
+    command.add_argument('-j', '--jobs', type=int, default=None, help="İşçi süreç sayısı (varsayılan: çekirdek sayısı)")
+    command.add_argument('--chunk-size', type=int, default=16, help="Bir işçiye tek seferde gönderilen dosya sayısı")
+    command.add_argument('-o', '--output', help="JSON Lines çıktı dosyası (varsayılan: stdout)")
+    command.add_argument('--no-parse', action='store_true', help="Yalnızca lexical analiz yap")
+    command.add_argument('--max-errors', type=int, default=20, help="Dosya başına listelenecek en fazla hata sayısı")
+    command.add_argument('--fail-on-errors', action='store_true', help="Herhangi bir hata varsa çıkış kodu 1 olsun")
+    command.add_argument('--cache-dir', help="Değişmemiş dosyaların sonuçlarını saklayan disk önbelleği dizini")
+    command.add_argument('--cache-max-mb', type=int, default=None,
+                         help="Çalışma sonunda disk önbelleğini bu boyuta (MB) buda")
+    command.set_defaults(handler=run)
@@ -0,0 +1,161 @@
+import gc
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from collections import Counter
+from cli.corpus import generate_corpus
+from lexer.lexical_analyzer import LexicalAnalyzer
+from parser.topdown_parser import TopDownParser
+from parser.parse_tree import count_nodes
+
+FORMAT_VERSION = 1
+
+# Ad -> generate_corpus parametreleri
+DEFAULT_CASES = {
+    'small': {'size': 5_000, 'depth': 3, 'comment_density': 0.1, 'string_density': 0.1},
+    'medium': {'size': 50_000, 'depth': 3, 'comment_density': 0.1, 'string_density': 0.1},
+    'large': {'size': 400_000, 'depth': 3, 'comment_density': 0.1, 'string_density': 0.1},
+    'deep': {'size': 50_000, 'depth': 12, 'comment_density': 0.1, 'string_density': 0.1},
+    'comments': {'size': 50_000, 'depth': 3, 'comment_density': 0.8, 'string_density': 0.1},
+    'strings': {'size': 50_000, 'depth': 3, 'comment_density': 0.1, 'string_density': 0.8},
+}
+QUICK_CASES = ('small', 'medium')
+
+def measure(step, repeat: int, prepare=None) -> dict:
+    """step'i repeat kez ölç; prepare verilirse her ölçümden önce çağrılır ve sonucu step'e verilir
+
+    Her ölçümden önce çöp toplanır, ölçüm sırasında GC kapalıdır.
+    """
+    runs = []
+    for _ in range(repeat):
+        args = (prepare(),) if prepare is not None else ()
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            step(*args)
+            runs.append(time.perf_counter() - start)
+        finally:
+            gc.enable()
+    return {'best': min(runs), 'median': statistics.median(runs), 'runs': runs}
+
+def bench_case(name: str, params: dict, seed: int, repeat: int) -> dict:
+    """Bir korpus için lexer, parser ve GUI adımlarını ölç"""
+    from gui.headless import create_headless_gui  # tkinter yalnızca bu komutta gerekir
+
+    text = generate_corpus(seed=seed, **params)
+    lexer = LexicalAnalyzer()
+    tokens = lexer.analyze(text)
+    brackets = lexer.bracket_index()
+    parser = TopDownParser(tokens)
+    root = parser.parse()
+
+    steps = {
+        'lex': measure(lambda: LexicalAnalyzer().analyze(text), repeat),
+        'lex_regex': measure(lambda: LexicalAnalyzer(LexicalAnalyzer.ENGINE_REGEX).analyze(text), repeat),
+        'parse': measure(lambda: TopDownParser(tokens).parse(), repeat),
+    }
+
+    # GUI adımları her ölçümde yeni bir sahte arayüzde (ilk uygulamanın maliyeti);
+    # sayaç, adımın gerçek widget'ta yapacağı Tcl çağrılarıdır
+    calls = {}
+    for method in ('apply_syntax_highlighting', 'update_token_display', 'update_parse_tree_display'):
+        counter = Counter()
+
+        def prepare():
+            gui = create_headless_gui(counter)
+            gui.text_widget.set_text(text)
+            gui.current_tokens = tokens
+            gui.current_brackets = brackets
+            gui.parse_tree = root
+            counter.clear()
+            return gui
+
+        steps[method] = measure(lambda gui: getattr(gui, method)(), repeat, prepare)
+        calls[method] = dict(counter)
+
+    return {
+        'name': name,
+        'params': dict(params, seed=seed),
+        'chars': len(text),
+        'lines': text.count('\n') + 1,
+        'tokens': len(tokens),
+        'nodes': count_nodes(root),
+        'parse_errors': len(parser.errors),
+        'steps': steps,
+        'calls': calls,
+    }
+
+def git_revision():
+    """Çalışma dizininin git commit'i (yoksa None)"""
+    try:
+        return subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def run_benchmarks(case_names, seed: int = 0, repeat: int = 5) -> dict:
+    """Seçilen korpuslar için ölçüm sonuçlarını karşılaştırılabilir sözlük olarak döndür"""
+    return {
+        'format': FORMAT_VERSION,
+        'revision': git_revision(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'seed': seed,
+        'repeat': repeat,
+        'cases': [bench_case(name, DEFAULT_CASES[name], seed, repeat) for name in case_names],
+    }
+
+def print_results(results: dict, baseline: dict = None, stream=sys.stdout):
+    """Ölçümleri tablo olarak yazdır; baseline verilirse medyan oranını da göster"""
+    base_steps = {}
+    if baseline:
+        for case in baseline['cases']:
+            for step, timing in case['steps'].items():
+                base_steps[case['name'], step] = timing['median']
+    for case in results['cases']:
+        print(f"{case['name']}: {case['chars']} karakter, {case['tokens']} token, "
+              f"{case['nodes']} düğüm", file=stream)
+        for step, timing in case['steps'].items():
+            line = f"  {step:28s} medyan {timing['median'] * 1000:9.2f} ms  en iyi {timing['best'] * 1000:9.2f} ms"
+            base = base_steps.get((case['name'], step))
+            if base:
+                line += f"  ({timing['median'] / base:.2f}x)"
+            print(line, file=stream)
+
+def run(args) -> int:
+    """bench komutu"""
+    names = args.cases or (QUICK_CASES if args.quick else tuple(DEFAULT_CASES))
+    unknown = [name for name in names if name not in DEFAULT_CASES]
+    if unknown:
+        print(f"Bilinmeyen korpus: {', '.join(unknown)} (seçenekler: {', '.join(DEFAULT_CASES)})",
+              file=sys.stderr)
+        return 2
+    results = run_benchmarks(names, args.seed, args.repeat)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as file:
+            baseline = json.load(file)
+    print_results(results, baseline, sys.stderr if args.output is None else sys.stdout)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump(results, file, ensure_ascii=False, indent=1)
+    else:
+        print(json.dumps(results, ensure_ascii=False))
+    return 0
+
+def add_parser(subparsers):
+    """bench alt komutunu kaydet"""
+    command = subparsers.add_parser('bench', help="Sentetik korpusla lexer, parser ve GUI adımlarını ölç")
+    command.add_argument('cases', nargs='*', help=f"Korpuslar (varsayılan: hepsi; {', '.join(DEFAULT_CASES)})")
+    command.add_argument('--quick', action='store_true', help=f"Yalnızca {', '.join(QUICK_CASES)}")
+    command.add_argument('--seed', type=int, default=0, help="Korpus üreteci tohumu")
+    command.add_argument('-r', '--repeat', type=int, default=5, help="Adım başına ölçüm sayısı")
+    command.add_argument('-o', '--output', help="JSON sonuç dosyası (varsayılan: stdout)")
+    command.add_argument('--compare', help="Karşılaştırılacak önceki JSON sonuç dosyası")
+    command.set_defaults(handler=run)
@@ -0,0 +1,112 @@
+import random
+
+IDENTIFIERS = ['count', 'index', 'total', 'value', 'result', 'buffer', 'offset', 'limit', 'flag', 'temp']
+BINARY_OPERATORS = ['+', '-', '*', '/', '%', '<', '>', '<=', '>=', '==', '!=', '&&', '||', '&', '|', '<<']
+TYPES = ['int', 'char', 'float', 'double']
+WORDS = ['hata', 'deger', 'sonuc', 'toplam', 'dosya', 'satir', 'okundu', 'yazildi', 'bitti', 'giris']
+
+class CorpusGenerator:
+    """Tohumlu sentetik C kaynağı üreteci
+
+    Aynı parametreler ve tohum her zaman aynı metni üretir. size yaklaşık
+    karakter sayısı, depth blokların en fazla iç içe geçme derinliği,
+    comment_density ve string_density sırasıyla deyimlerden önce yorum ve
+    string literal içeren deyim olasılığıdır. Üretilen kod parser'ın
+    desteklediği yapılarla (bildirim, atama, çağrı, if/while/for/return)
+    sınırlıdır.
+    """
+
+    def __init__(self, size: int = 20000, depth: int = 3, comment_density: float = 0.1,
+                 string_density: float = 0.1, seed: int = 0):
+        self.size = size
+        self.depth = depth
+        self.comment_density = comment_density
+        self.string_density = string_density
+        self.random = random.Random(seed)
+
+    def generate(self) -> str:
+        parts = ['#include <stdio.h>\n', '#include <stdlib.h>\n', '#define LIMIT 100\n', '\n']
+        length = sum(map(len, parts))
+        function_index = 0
+        while length < self.size:
+            function = self.function(function_index)
+            parts.append(function)
+            length += len(function)
+            function_index += 1
+        return ''.join(parts)
+
+    def function(self, index: int) -> str:
+        lines = []
+        if self.random.random() < self.comment_density:
+            lines.append(f"/* f{index}: {self.sentence()} */")
+        lines.append(f"{self.random.choice(TYPES)} f{index}(int a, int b) {{")
+        self.block(lines, 1)
+        lines.append(f"    return {self.expression(2)};")
+        lines.append("}")
+        return '\n'.join(lines) + '\n\n'
+
+    def block(self, lines, level: int):
+        """Bloğun deyimleri; her blokta en fazla bir iç içe kontrol yapısı (boyut derinlikle doğrusal)"""
+        indent = '    ' * level
+        statements = self.random.randint(2, 5)
+        nested_at = self.random.randrange(statements) if level < self.depth else -1
+        for position in range(statements):
+            if self.random.random() < self.comment_density:
+                lines.append(f"{indent}// {self.sentence()}")
+            if position == nested_at:
+                self.control(lines, level)
+            else:
+                lines.append(indent + self.statement())
+
+    def control(self, lines, level: int):
+        indent = '    ' * level
+        kind = self.random.choice(('if', 'while', 'for'))
+        if kind == 'if':
+            lines.append(f"{indent}if ({self.expression(2)}) {{")
+        elif kind == 'while':
+            lines.append(f"{indent}while ({self.expression(2)}) {{")
+        else:
+            name = self.random.choice(IDENTIFIERS)
+            lines.append(f"{indent}for ({name} = 0; {name} < LIMIT; {name}++) {{")
+        self.block(lines, level + 1)
+        if kind == 'if' and self.random.random() < 0.4:
+            lines.append(f"{indent}}} else {{")
+            lines.append(indent + '    ' + self.statement())
+        lines.append(f"{indent}}}")
+
+    def statement(self) -> str:
+        if self.random.random() < self.string_density:
+            return f'printf("{self.sentence()} %d\\n", {self.random.choice(IDENTIFIERS)});'
+        choice = self.random.random()
+        name = self.random.choice(IDENTIFIERS)
+        if choice < 0.3:
+            return f"{self.random.choice(TYPES)} {name} = {self.expression(3)};"
+        if choice < 0.8:
+            return f"{name} = {self.expression(3)};"
+        return f"{name} = f{self.random.randrange(4)}({self.expression(1)}, {self.expression(1)});"
+
+    def expression(self, depth: int) -> str:
+        if depth <= 0 or self.random.random() < 0.3:
+            return self.operand()
+        left = self.expression(depth - 1)
+        right = self.expression(depth - 1)
+        text = f"{left} {self.random.choice(BINARY_OPERATORS)} {right}"
+        return f"({text})" if self.random.random() < 0.3 else text
+
+    def operand(self) -> str:
+        choice = self.random.random()
+        if choice < 0.5:
+            return self.random.choice(IDENTIFIERS + ['a', 'b'])
+        if choice < 0.8:
+            return str(self.random.randrange(1000))
+        if choice < 0.9:
+            return f"{self.random.randrange(100)}.{self.random.randrange(100)}"
+        return f"'{self.random.choice('abcxyz')}'"
+
+    def sentence(self) -> str:
+        return ' '.join(self.random.choice(WORDS) for _ in range(self.random.randint(2, 6)))
+
+def generate_corpus(size: int = 20000, depth: int = 3, comment_density: float = 0.1,
+                    string_density: float = 0.1, seed: int = 0) -> str:
+    """Parametrelere göre sentetik C kaynağı üret (bkz. CorpusGenerator)"""
+    return CorpusGenerator(size, depth, comment_density, string_density, seed).generate()
@@ -0,0 +1,189 @@
+import functools
+import hashlib
+import json
+import os
+import re
+import tempfile
+import time
+from typing import Optional
+
+FORMAT_VERSION = 3  # Dosya biçimi değişince artırılır
+ANALYZER_PACKAGES = ('lexer', 'parser', 'models', 'cli')  # Kaynağı analiz sonucunu belirleyen paketler
+CACHE_DIRNAME = 'c-highlighter-cache'  # --cache-dir altındaki önbellek dizini
+MARKER_NAME = 'CACHEDIR.TAG'  # Dizinin önbelleğe ait olduğunu gösterir (yedekleme araçları da atlar)
+MARKER_CONTENT = ("Signature: 8a477f597d28d172789f06886806bc55\n"
+                  "# c-highlighter analiz önbelleği; silinebilir.\n")
+TEMP_PREFIX = '.tmp-'
+STALE_TEMP_SECONDS = 3600  # Bu süreden eski geçici dosyalar yarım kalmış yazıcılara aittir
+VERSION_PATTERN = re.compile(r'[0-9a-f]{16}')  # analyzer_version() dizinleri
+SHARD_PATTERN = re.compile(r'[0-9a-f]{2}')
+KEY_PATTERN = re.compile(r'[0-9a-f]{40}')  # key() özetleri
+
+@functools.lru_cache(maxsize=None)
+def analyzer_version() -> str:
+    """Analizör kaynak kodunun özeti: analiz davranışı ya da sonuç biçimi değişince önbellek geçersizleşir"""
+    digest = hashlib.blake2b(f"format-{FORMAT_VERSION}".encode(), digest_size=8)
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    for package in ANALYZER_PACKAGES:
+        directory = os.path.join(root, package)
+        for name in sorted(os.listdir(directory)):
+            if name.endswith('.py'):
+                digest.update(name.encode())
+                with open(os.path.join(directory, name), 'rb') as file:
+                    digest.update(file.read())
+    return digest.hexdigest()
+
+class CachedAnalysis:
+    """Diskteki bir analiz kaydı
+
+    Kayıt, özet sonucun tek bir JSON belgesidir. Kayıtlar pickle değildir:
+    paylaşılan bir önbellek dizinindeki dosyalar okunurken kod çalıştıramaz.
+    """
+
+    def __init__(self, header: dict):
+        self.result = header['result']  # cli.analyze sonucu (path hariç, tüm hata örnekleri)
+        self.parsed = header['parsed']  # Parse sonucu da var mı
+        if not isinstance(self.result, dict):
+            raise TypeError("Özet sonucu sözlük değil")
+
+class DiskCache:
+    """İçerik özeti ve analizör sürümüyle anahtarlanan kalıcı analiz önbelleği
+
+    Kayıtlar <dizin>/c-highlighter-cache/<sürüm>/<özetin ilk iki hanesi>/<özet>
+    yolundadır; önbellek dizinindeki CACHEDIR.TAG onu kullanıcı dosyalarından
+    ayırır. Yazıcılar aynı dizinde geçici bir dosyaya yazıp os.replace ile
+    atomik olarak yerine koyar; eşzamanlı süreçler aynı kaydı yazabilir ve
+    okuyucular hiçbir zaman yarım dosya görmez. Okunan kayıtların değiştirilme
+    zamanı güncellenir; prune() en uzun süredir kullanılmayanları siler.
+    """
+
+    def __init__(self, directory: str, version: Optional[str] = None):
+        self.directory = directory
+        self.root = os.path.join(directory, CACHE_DIRNAME)
+        self.version = version or analyzer_version()  # 16 haneli onaltılık özet
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(source) -> str:
+        """İçeriğin özeti (str, bytes veya mmap)"""
+        if isinstance(source, str):
+            source = source.encode('utf-8', 'surrogatepass')
+        return hashlib.blake2b(source, digest_size=20).hexdigest()
+
+    def path(self, key: str) -> str:
+        return os.path.join(self.root, self.version, key[:2], key)
+
+    def load(self, key: str) -> Optional[CachedAnalysis]:
+        """Kaydı oku; yoksa ya da okunamıyorsa None"""
+        path = self.path(key)
+        try:
+            with open(path, 'rb') as file:
+                entry = CachedAnalysis(json.load(file))
+            os.utime(path)  # prune() için son kullanım
+        except (OSError, ValueError, KeyError, TypeError):
+            # Okunamayan, bozuk ya da eksik alanlı kayıtlar ıska sayılır (sonraki yazım üzerine yazar)
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry
+
+    def store(self, key: str, result: dict, parsed: bool = False):
+        """Analiz sonucunu yaz (parsed: sonuç parse alanlarını da içeriyor mu); hatalar yok sayılır"""
+        data = json.dumps({'result': result, 'parsed': parsed}, ensure_ascii=False).encode('utf-8')
+        path = self.path(key)
+        try:
+            self.create_root()
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            descriptor, temp_path = tempfile.mkstemp(prefix=TEMP_PREFIX, dir=os.path.dirname(path))
+            try:
+                with os.fdopen(descriptor, 'wb') as file:
+                    file.write(data)
+                os.replace(temp_path, path)
+            except BaseException:
+                os.unlink(temp_path)
+                raise
+        except OSError:
+            pass  # Önbellek yazılamazsa analiz sonucu yine de döner
+
+    def create_root(self):
+        """Önbellek dizinini işaret dosyasıyla birlikte oluştur"""
+        marker = os.path.join(self.root, MARKER_NAME)
+        if os.path.exists(marker):
+            return
+        os.makedirs(self.root, exist_ok=True)
+        try:
+            with open(marker, 'x', encoding='utf-8') as file:
+                file.write(MARKER_CONTENT)
+        except FileExistsError:
+            pass
+
+    def prune(self, max_bytes: int) -> int:
+        """Eski sürümlerin kayıtlarını ve bayat geçici dosyaları sil, kalanı
+        en eski kullanılandan başlayarak max_bytes altına indir; silinen dosya sayısını döndür
+
+        Yalnızca işaret dosyası olan önbellek dizininde, store()'un yazdığı
+        düzene (<sürüm>/<iki hane>/<özet> ya da geçici dosya) uyan dosyalar
+        silinir; başka dosya ve dizinlere dokunulmaz.
+        """
+        if not os.path.isfile(os.path.join(self.root, MARKER_NAME)):
+            return 0  # Önbellek dizini değil (ya da henüz yazılmamış)
+        removed = 0
+        entries = []  # (son kullanım, boyut, yol)
+        now = time.time()
+        for version in self.subdirectories(self.root, VERSION_PATTERN):
+            current = version.name == self.version
+            for shard in self.subdirectories(version.path, SHARD_PATTERN):
+                try:
+                    files = list(os.scandir(shard.path))
+                except OSError:
+                    continue
+                for file in files:
+                    temp = file.name.startswith(TEMP_PREFIX)
+                    if not (temp or KEY_PATTERN.fullmatch(file.name)) or not file.is_file(follow_symlinks=False):
+                        continue
+                    try:
+                        stat = file.stat(follow_symlinks=False)
+                    except OSError:
+                        continue
+                    if not current or (temp and now - stat.st_mtime > STALE_TEMP_SECONDS):
+                        removed += self.remove(file.path)
+                    elif not temp:
+                        entries.append((stat.st_mtime, stat.st_size, file.path))
+                if not current:
+                    self.remove_directory(shard.path)
+            if not current:
+                self.remove_directory(version.path)
+
+        total = sum(size for _, size, _ in entries)
+        entries.sort()
+        for _, size, path in entries:
+            if total <= max_bytes:
+                break
+            removed += self.remove(path)
+            total -= size
+        return removed
+
+    @staticmethod
+    def subdirectories(directory: str, pattern) -> list:
+        """Adı pattern'e uyan alt dizinler (sembolik bağlar izlenmez)"""
+        try:
+            return [entry for entry in os.scandir(directory)
+                    if pattern.fullmatch(entry.name) and entry.is_dir(follow_symlinks=False)]
+        except OSError:
+            return []
+
+    @staticmethod
+    def remove(path: str) -> int:
+        try:
+            os.unlink(path)
+            return 1
+        except OSError:
+            return 0  # Başka bir süreç silmiş olabilir
+
+    @staticmethod
+    def remove_directory(path: str):
+        try:
+            os.rmdir(path)  # Yalnızca boşsa silinir
+        except OSError:
+            pass
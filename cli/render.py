@@ -0,0 +1,254 @@
+import html
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import TextIO
+from cli.batch import iter_chunks, iter_source_files
+from gui.theme import FONT_FAMILY, TAG_STYLES, rgb
+from lexer.lexical_analyzer import LexicalAnalyzer, DEFAULT_CHUNK_SIZE
+from models.token import TokenType
+
+CSS_PREFIX = 'ch-'  # HTML sınıf öneki: ch-keyword, ch-comment...
+FLUSH_PARTS = 2048  # Çıktıya tek seferde yazılan parça sayısı
+ANSI_RESET = '\x1b[0m'
+
+def stylesheet(prefix: str = CSS_PREFIX) -> str:
+    """Tk etiket renkleriyle aynı renkleri veren CSS"""
+    rules = [f"pre.{prefix}code {{ font-family: '{FONT_FAMILY}', monospace; }}"]
+    for tag, style in TAG_STYLES.items():
+        declarations = []
+        if 'foreground' in style:
+            declarations.append(f"color: {style['foreground']}")
+        if 'background' in style:
+            declarations.append(f"background-color: {style['background']}")
+        if style.get('style') == 'bold':
+            declarations.append("font-weight: bold")
+        elif style.get('style') == 'italic':
+            declarations.append("font-style: italic")
+        rules.append(f".{prefix}{tag.lower()} {{ {'; '.join(declarations)}; }}")
+    return '\n'.join(rules) + '\n'
+
+def ansi_sequence(style: dict) -> str:
+    """Stilin 24 bit renkli ANSI kaçış dizisi"""
+    codes = []
+    if style.get('style') == 'bold':
+        codes.append('1')
+    elif style.get('style') == 'italic':
+        codes.append('3')
+    if 'foreground' in style:
+        codes.append('38;2;%d;%d;%d' % rgb(style['foreground']))
+    if 'background' in style:
+        codes.append('48;2;%d;%d;%d' % rgb(style['background']))
+    return f"\x1b[{';'.join(codes)}m"
+
+class HtmlFormatter:
+    """Token'ları CSS sınıflı <span>'lere çeviren biçimlendirici
+
+    fragment True ise yalnızca <pre> bloğu yazılır (stil sayfası ayrıca
+    stylesheet() ile verilir); değilse tek başına açılabilen bir belge.
+    """
+
+    def __init__(self, title: str = "", fragment: bool = False, prefix: str = CSS_PREFIX):
+        self.title = title
+        self.fragment = fragment
+        self.prefix = prefix
+        # Token türü değeri -> açılış etiketi
+        self.open_tags = {tag: f'<span class="{prefix}{tag.lower()}">' for tag in TAG_STYLES}
+
+    def header(self) -> str:
+        pre = f'<pre class="{self.prefix}code">'
+        if self.fragment:
+            return pre
+        return (f'<!DOCTYPE html>\n<html>\n<head>\n<meta charset="utf-8">\n'
+                f'<title>{html.escape(self.title)}</title>\n<style>\n{stylesheet(self.prefix)}</style>\n'
+                f'</head>\n<body>\n{pre}')
+
+    def token(self, tag: str, value: str) -> str:
+        if '&' in value or '<' in value or '>' in value:
+            value = html.escape(value, quote=False)
+        return f"{self.open_tags[tag]}{value}</span>"
+
+    def gap(self, text: str) -> str:
+        return text  # Token aralarında yalnızca boşluk vardır
+
+    def footer(self) -> str:
+        return '</pre>\n' if self.fragment else '</pre>\n</body>\n</html>\n'
+
+class AnsiFormatter:
+    """Token'ları 24 bit renkli ANSI kaçış dizileriyle saran biçimlendirici (terminal için)"""
+
+    def __init__(self):
+        self.sequences = {tag: ansi_sequence(style) for tag, style in TAG_STYLES.items()}
+
+    def header(self) -> str:
+        return ""
+
+    def token(self, tag: str, value: str) -> str:
+        return f"{self.sequences[tag]}{value}{ANSI_RESET}"
+
+    def gap(self, text: str) -> str:
+        return text
+
+    def footer(self) -> str:
+        return ""
+
+EXTENSIONS = {'html': '.html', 'ansi': '.ansi'}
+
+class SourceWindow:
+    """Okunan metnin henüz çıktıya yazılmamış kısmını tutan akış sarmalayıcısı
+
+    Lexer akıştan read() ile okur; renderer token'ların arasındaki boşlukları
+    take() ile pencereden alır. Pencerede yalnızca son parça ve yazılmamış
+    kuyruk bulunur.
+    """
+
+    def __init__(self, stream: TextIO):
+        self.stream = stream
+        self.text = ""
+        self.offset = 0  # text[0]'ın akıştaki pozisyonu
+        self.emitted = 0  # text içinde yazılmış kısmın sonu
+
+    def read(self, size: int) -> str:
+        chunk = self.stream.read(size)
+        self.text = self.text[self.emitted:] + chunk
+        self.offset += self.emitted
+        self.emitted = 0
+        return chunk
+
+    def take(self, position: int) -> str:
+        """Son yazılan yerden akış pozisyonuna kadarki metin"""
+        end = position - self.offset
+        text = self.text[self.emitted:end]
+        self.emitted = end
+        return text
+
+def render_stream(stream: TextIO, output: TextIO, formatter, chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+    """Metin akışını token'lar geldikçe vurgulanmış olarak output'a yaz; token sayısını döndür
+
+    Belge bellekte kurulmaz: lexer akışı parça parça okur ve biçimlendirilmiş
+    parçalar FLUSH_PARTS'ta bir yazılır.
+    """
+    window = SourceWindow(stream)
+    lexer = LexicalAnalyzer(LexicalAnalyzer.ENGINE_REGEX)
+    token_text, gap_text = formatter.token, formatter.gap
+    parts = [formatter.header()]
+    count = 0
+    for token in lexer.iter_tokens(window, chunk_size):
+        gap = window.take(token.position)
+        if gap:
+            parts.append(gap_text(gap))
+        if token.type == TokenType.EOF:
+            break
+        parts.append(token_text(token.type.value, token.value))
+        window.take(token.position + len(token.value))
+        count += 1
+        if len(parts) >= FLUSH_PARTS:
+            output.write(''.join(parts))
+            parts = []
+    parts.append(formatter.footer())
+    output.write(''.join(parts))
+    return count
+
+def make_formatter(output_format: str, title: str = "", fragment: bool = False):
+    if output_format == 'html':
+        return HtmlFormatter(title, fragment)
+    return AnsiFormatter()
+
+def render_path(path: str, output: TextIO, output_format: str = 'html', fragment: bool = False) -> int:
+    """Dosyayı vurgulanmış olarak output'a yaz"""
+    with open(path, encoding='utf-8', errors='replace', newline='') as stream:
+        return render_stream(stream, output, make_formatter(output_format, os.path.basename(path), fragment))
+
+def render_chunk(jobs, output_format: str, fragment: bool):
+    """(kaynak, hedef) çiftlerini işçi süreçte yaz; (kaynak, token sayısı ya da hata) listesi döndür"""
+    results = []
+    for source, target in jobs:
+        try:
+            os.makedirs(os.path.dirname(target) or '.', exist_ok=True)
+            with open(target, 'w', encoding='utf-8', newline='') as output:
+                results.append((source, render_path(source, output, output_format, fragment), None))
+        except (OSError, UnicodeError) as e:
+            results.append((source, 0, f"{type(e).__name__}: {e}"))
+    return results
+
+def render_tree(root: str, output_dir: str, output_format: str = 'html', fragment: bool = False,
+                jobs: int = None, chunk_size: int = 32) -> dict:
+    """Dizin ağacındaki .c/.h dosyalarını süreç havuzunda output_dir altına aynı yapıyla yaz"""
+    jobs = jobs or os.cpu_count() or 1
+    extension = EXTENSIONS[output_format]
+    summary = {'files': 0, 'failed': 0, 'tokens': 0}
+    start = time.perf_counter()
+
+    def targets():
+        for path in iter_source_files(root):
+            yield path, os.path.join(output_dir, os.path.relpath(path, root) + extension)
+
+    def collect(future):
+        for source, tokens, error in future.result():
+            summary['files'] += 1
+            summary['tokens'] += tokens
+            if error is not None:
+                summary['failed'] += 1
+                print(f"{source}: {error}", file=sys.stderr)
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        pending = set()
+        for chunk in iter_chunks(targets(), chunk_size):
+            pending.add(executor.submit(render_chunk, chunk, output_format, fragment))
+            if len(pending) >= jobs * 2:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    collect(future)
+        for future in pending:
+            collect(future)
+
+    summary['wall_seconds'] = time.perf_counter() - start
+    summary['jobs'] = jobs
+    return summary
+
+def run(args) -> int:
+    """render komutu"""
+    if args.css:
+        sys.stdout.write(stylesheet())
+        return 0
+    if not args.paths:
+        print("Dosya ya da dizin verilmedi", file=sys.stderr)
+        return 2
+
+    failed = 0
+    for path in args.paths:
+        if os.path.isdir(path):
+            if not args.output_dir:
+                print(f"{path}: dizinler için --output-dir gerekir", file=sys.stderr)
+                return 2
+            summary = render_tree(path, args.output_dir, args.format, args.fragment, args.jobs)
+            failed += summary['failed']
+            wall = summary['wall_seconds']
+            print(f"{path}: {summary['files']} dosya ({summary['failed']} başarısız), "
+                  f"{summary['tokens']} token, {wall:.2f} s ({summary['files'] / wall if wall else 0.0:.1f} dosya/s)",
+                  file=sys.stderr)
+        elif args.output_dir:
+            target = os.path.join(args.output_dir, os.path.basename(path) + EXTENSIONS[args.format])
+            for source, _, error in render_chunk([(path, target)], args.format, args.fragment):
+                if error is not None:
+                    failed += 1
+                    print(f"{source}: {error}", file=sys.stderr)
+        else:
+            try:
+                render_path(path, sys.stdout, args.format, args.fragment)
+            except OSError as e:
+                failed += 1
+                print(f"{path}: {e}", file=sys.stderr)
+    return 1 if failed else 0
+
+def add_parser(subparsers):
+    """render alt komutunu kaydet"""
+    command = subparsers.add_parser('render', help="C kaynaklarını HTML ya da ANSI renkli metin olarak vurgula")
+    command.add_argument('paths', nargs='*', help="Dosyalar ya da dizinler (dizinlerdeki tüm .c/.h dosyaları)")
+    command.add_argument('-f', '--format', choices=tuple(EXTENSIONS), default='html', help="Çıktı biçimi")
+    command.add_argument('-o', '--output-dir', help="Çıktı dizini (verilmezse dosyalar stdout'a yazılır)")
+    command.add_argument('--fragment', action='store_true', help="HTML'de yalnızca <pre> bloğu (stil sayfası hariç)")
+    command.add_argument('--css', action='store_true', help="Yalnızca HTML stil sayfasını yazdır")
+    command.add_argument('-j', '--jobs', type=int, default=None, help="Dizinler için işçi süreç sayısı")
+    command.set_defaults(handler=run)
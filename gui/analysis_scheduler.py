@@ -0,0 +1,98 @@
+import queue
+import threading
+
+class AnalysisScheduler:
+    """Olayları birleştiren, iptal edilebilir arka plan analiz zamanlayıcısı
+
+    Her değişiklik tek bekleyen işin zamanlayıcısını sıfırlar. Süre dolunca
+    içerik Tk thread'inde alınır ve işçi thread'de analiz edilir; sonuç bir
+    kuyruk üzerinden Tk thread'ine döner. Daha yeni bir belge sürümü varsa
+    eski sonuç uygulanmadan atılır (discard_result verilmişse ona bildirilir).
+    """
+
+    def __init__(self, root, get_content, analyze, apply_result, delay=300, poll_interval=20,
+                 discard_result=None):
+        self.root = root
+        self.get_content = get_content  # Tk thread'inde: () -> içerik
+        self.analyze = analyze  # İşçi thread'de: (içerik) -> sonuç
+        self.apply_result = apply_result  # Tk thread'inde: (sonuç) -> None
+        self.discard_result = discard_result  # Tk thread'inde: (sonuç ya da None) -> None
+        self.delay = delay  # Son değişiklikten sonra bekleme (ms)
+        self.poll_interval = poll_interval  # Sonuç kuyruğu yoklama aralığı (ms)
+
+        self.version = 0  # En son belge sürümü
+        self._timer = None  # Bekleyen after() işi
+        self._poll_id = None
+        self._submitted_version = 0  # İşçiye verilen son sürüm
+        self._returned_version = 0  # Sonucu dönen son sürüm
+        self._pending_job = None  # (sürüm, içerik); yalnızca en yenisi tutulur
+        self._job_ready = threading.Condition()
+        self._results = queue.Queue()
+        self._result_taken = threading.Event()  # Sonuç Tk tarafında işlenene kadar işçi bekler
+        self._result_taken.set()
+
+        self._worker = threading.Thread(target=self._run_worker, name="analysis-worker", daemon=True)
+        self._worker.start()
+
+    def schedule(self, delay=None):
+        """Belge değişti: sürümü artır ve tek bekleyen işin zamanlayıcısını sıfırla"""
+        self.version += 1
+        if self._timer is not None:
+            self.root.after_cancel(self._timer)
+        self._timer = self.root.after(self.delay if delay is None else delay, self._submit)
+
+    def _submit(self):
+        """Zamanlayıcı doldu: içeriği al ve işçiye ver"""
+        self._timer = None
+        content = self.get_content()
+        with self._job_ready:
+            self._pending_job = (self.version, content)  # Henüz başlamamış eski işin yerine geçer
+            self._job_ready.notify()
+        self._submitted_version = self.version
+        if self._poll_id is None:
+            self._poll_id = self.root.after(self.poll_interval, self._poll)
+
+    def _run_worker(self):
+        """İşçi thread döngüsü"""
+        while True:
+            with self._job_ready:
+                while self._pending_job is None:
+                    self._job_ready.wait()
+                version, content = self._pending_job
+                self._pending_job = None
+
+            # Önceki sonuç Tk tarafında işlenmeden paylaşılan durumu değiştirme
+            self._result_taken.wait()
+            self._result_taken.clear()
+            try:
+                result = self.analyze(content)
+                error = None
+            except Exception as e:
+                result, error = None, e
+            self._results.put((version, result, error))
+
+    def _poll(self):
+        """Tk thread'inde sonuç kuyruğunu yokla"""
+        self._poll_id = None
+        try:
+            version, result, error = self._results.get_nowait()
+        except queue.Empty:
+            self._poll_id = self.root.after(self.poll_interval, self._poll)
+            return
+
+        self._returned_version = version
+        try:
+            if error is None and version == self.version:
+                self.apply_result(result)
+            else:
+                if error is not None:
+                    print(f"Gerçek zamanlı analiz hatası: {error}")
+                # Daha yeni sürüm varsa sonuç atılır; yeni iş zaten zamanlanmıştır
+                if self.discard_result is not None:
+                    self.discard_result(result)
+        finally:
+            self._result_taken.set()
+
+        # İşçide hâlâ bir iş varsa yoklamaya devam et
+        if self._returned_version < self._submitted_version:
+            self._poll_id = self.root.after(self.poll_interval, self._poll)
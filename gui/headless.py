@@ -0,0 +1,173 @@
+from collections import Counter
+from gui.highlighter_gui import CSyntaxHighlighterGUI
+from gui.viewport_highlighter import ViewportHighlighter
+from gui.virtual_token_list import VirtualTokenList
+from gui.parse_tree_view import ParseTreeView
+from gui.performance_monitor import PerformanceMonitor
+from lexer.lexical_analyzer import LexicalAnalyzer
+from parser.incremental_parser import IncrementalParser
+
+VISIBLE_LINES = 40  # Sahte editörde görünen satır sayısı
+VISIBLE_ROWS = 35  # Sahte token listesinde görünen satır sayısı
+
+class StubWidget:
+    """Ekransız çalışma için sahte Tk widget'ı
+
+    Tanımlanmamış her metot çağrıyı sayıp None döndürür; calls, gerçek
+    widget'ta yapılacak Tcl çağrılarının sayısıdır (widget'lar arasında
+    paylaşılabilir).
+    """
+
+    def __init__(self, calls: Counter = None):
+        self.calls = calls if calls is not None else Counter()
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        def call(*args, **kwargs):
+            self.calls[name] += 1
+        return call
+
+class StubText(StubWidget):
+    """Sahte Text: metni ve görünür satır aralığını bilir, etiket çağrılarını sayar"""
+
+    def __init__(self, calls: Counter = None):
+        super().__init__(calls)
+        self.text = ""
+        self.first_line = 1  # En üstte görünen satır
+
+    def set_text(self, text: str):
+        self.text = text
+
+    def get(self, start='1.0', end='end-1c'):
+        self.calls['get'] += 1
+        return self.text
+
+    def yview(self, *args):
+        self.calls['yview'] += 1
+        line_count = self.text.count('\n') + 1
+        first = (self.first_line - 1) / line_count
+        return first, min(1.0, first + VISIBLE_LINES / line_count)
+
+    def tag_add(self, tag, *indices):
+        self.calls['tag_add'] += 1
+        self.calls['tag_add_ranges'] += len(indices) // 2
+
+    def tag_remove(self, tag, *indices):
+        self.calls['tag_remove'] += 1
+
+    def count(self, start, end):
+        self.calls['count'] += 1
+        return None
+
+class StubListbox(StubWidget):
+    """Sahte Listbox: satırları tutar, sabit yükseklik bildirir"""
+
+    ROW_HEIGHT = 16
+
+    def __init__(self, calls: Counter = None):
+        super().__init__(calls)
+        self.rows = []
+
+    def delete(self, first, last=None):
+        self.calls['delete'] += 1
+        self.rows = []
+
+    def insert(self, index, *rows):
+        self.calls['insert'] += 1
+        self.rows.extend(rows)
+
+    def winfo_height(self):
+        self.calls['winfo_height'] += 1
+        return VISIBLE_ROWS * self.ROW_HEIGHT
+
+    def cget(self, option):
+        self.calls['cget'] += 1
+        return VISIBLE_ROWS if option == 'height' else 0
+
+class StubTreeview(StubWidget):
+    """Sahte Treeview: öğe hiyerarşisini tutar"""
+
+    def __init__(self, calls: Counter = None):
+        super().__init__(calls)
+        self.children = {'': []}  # Öğe -> alt öğeler
+        self.parents = {}  # Öğe -> üst öğe
+        self.next_id = 0
+        self.focused = ''
+
+    def insert(self, parent, index, text=''):
+        self.calls['insert'] += 1
+        self.next_id += 1
+        item = f"I{self.next_id:06X}"
+        self.children[parent].append(item)
+        self.children[item] = []
+        self.parents[item] = parent
+        return item
+
+    def get_children(self, item=''):
+        self.calls['get_children'] += 1
+        return tuple(self.children.get(item, ()))
+
+    def delete(self, *items):
+        self.calls['delete'] += 1
+        for item in items:
+            self.children[self.parents[item]].remove(item)
+            stack = [item]
+            while stack:
+                current = stack.pop()
+                del self.parents[current]
+                stack.extend(self.children.pop(current))
+
+    def focus(self, item=None):
+        self.calls['focus'] += 1
+        if item is None:
+            return self.focused
+        self.focused = item
+
+class StubTracker:
+    """Sahte TextInsertTracker: düzenleme aralığı bildirmez"""
+
+    def take_changed(self):
+        return None
+
+def create_headless_gui(calls: Counter = None) -> CSyntaxHighlighterGUI:
+    """Tk olmadan çalışan CSyntaxHighlighterGUI (sahte Text/Listbox/Treeview ile)
+
+    Pencere kurulmaz; yalnızca vurgulama ve görüntü güncelleme adımlarının
+    kullandığı alanlar doldurulur. Tüm widget'lar aynı calls sayacını paylaşır.
+    """
+    calls = calls if calls is not None else Counter()
+    gui = object.__new__(CSyntaxHighlighterGUI)
+    gui.root = StubWidget(calls)
+    gui.cache = None
+    gui.lexical_analyzer = LexicalAnalyzer()
+    gui.parser = IncrementalParser()
+    gui.parse_run = None
+    gui.parse_job = None
+    gui.current_tokens = []
+    gui.current_splice = None
+    gui.current_brackets = None
+    gui.symbol_highlighted = False
+    gui.parse_tree = None
+    gui.errors = []
+    # tag_add_ranges bir çağrı değil, tag_add'lerdeki aralık sayısıdır
+    gui.monitor = PerformanceMonitor(tcl_count=lambda: calls.total() - calls['tag_add_ranges'])
+    gui.show_performance = False
+
+    gui.text_widget = StubText(calls)
+    gui.highlighter = ViewportHighlighter(gui.text_widget, gui.monitor)
+    gui.insert_tracker = StubTracker()
+    gui.error_listbox = StubListbox(calls)
+
+    token_list = object.__new__(VirtualTokenList)
+    token_list.listbox = StubListbox(calls)
+    token_list.scrollbar = StubWidget(calls)
+    token_list.tokens = []
+    token_list.row_count = 0
+    token_list.first = 0
+    token_list.row_height = StubListbox.ROW_HEIGHT
+    gui.token_list = token_list
+
+    gui.parse_tree_widget = StubTreeview(calls)
+    gui.parse_tree_view = ParseTreeView(gui.parse_tree_widget)
+    return gui
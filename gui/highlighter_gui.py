@@ -1,31 +1,66 @@
 from lexer.lexical_analyzer import LexicalAnalyzer
-from parser.topdown_parser import TopDownParser
+from parser.incremental_parser import IncrementalParser
 from models.token import TokenType
-from parser.parse_tree import ParseNode
+from parser.parse_tree import ParseNode, count_nodes
+from models.analysis_cache import AnalysisCache
+from gui.analysis_scheduler import AnalysisScheduler
+from gui.viewport_highlighter import ViewportHighlighter, token_start_index, token_end_index
+from gui.text_insert_tracker import TextInsertTracker
+from gui.virtual_token_list import VirtualTokenList
+from gui.parse_tree_view import ParseTreeView
+from gui.performance_monitor import PerformanceMonitor
+from gui.performance_panel import PerformancePanel
+from gui.theme import TAG_STYLES, tk_tag_options
+import time
 import tkinter as tk
 from tkinter import ttk
 
+PARSE_SLICE_SECONDS = 0.015  # Tk olay döngüsüne dönmeden önce parse'a ayrılan süre
+
+class AnalysisResult:
+    """İşçi thread'de üretilen lexical analiz sonucu"""
+    def __init__(self, content, tokens, splice=None, brackets=None, lex_seconds=0.0):
+        self.content = content
+        self.tokens = tokens
+        self.splice = splice  # Lexer'ın TokenSplice kaydı (fark tabanlı vurgulama ve artımlı parse için)
+        self.brackets = brackets  # Token'ların BracketIndex'i (parantez hataları, eşine atlama)
+        self.lex_seconds = lex_seconds  # İşçi thread'de lex süresi (performans monitörü için)
+
 class CSyntaxHighlighterGUI:
     """Gerçek zamanlı C syntax highlighter GUI"""
     
-    def __init__(self, root):
+    def __init__(self, root, show_performance=False):
         self.root = root
         self.root.title("Programlama Dilleri - C Syntax Highlighter")
         self.root.geometry("1200x800")
         
-        # Bileşenler
-        self.lexical_analyzer = LexicalAnalyzer()
+        # Bileşenler; daha önce analiz edilmiş metinler (geri al/yinele) önbellekten gelir
+        self.cache = AnalysisCache()
+        # Kuyruk token'ları işçi thread'de değil, sonuç uygulanırken Tk thread'inde kaydırılır
+        self.lexical_analyzer = LexicalAnalyzer(cache=self.cache, defer_shift=True)
+        self.parser = IncrementalParser(cache=self.cache)  # Değişmeyen üst düzey alt ağaçlar yeniden kullanılır
+        self.parse_run = None  # Dilimler halinde ilerleyen parse
+        self.parse_job = None  # Bekleyen after_idle işi
         self.current_tokens = []
+        self.current_splice = None
+        self.current_brackets = None
+        self.symbol_highlighted = False  # SYMBOL_USE etiketi uygulanmış mı
         self.parse_tree = None
         self.errors = []
+        # Aşama süreleri: dinleyici eklenince (ör. Performans sekmesi) ölçülür
+        self.monitor = PerformanceMonitor()
+        self.show_performance = show_performance
         
         self.create_gui()
         self.configure_tags()
         
-        # Gerçek zamanlı vurgulama
-        self.text_widget.bind('<KeyRelease>', self.on_text_change)
-        self.text_widget.bind('<Button-1>', self.on_text_change)
-        self.text_widget.bind('<MouseWheel>', self.on_text_change)
+        # Gerçek zamanlı vurgulama: yalnızca metni değiştiren olaylar analizi zamanlar
+        self.scheduler = AnalysisScheduler(self.root, self.get_content, self.analyze_content,
+                                           self.apply_analysis, discard_result=self.discard_analysis)
+        self.text_widget.bind('<<Modified>>', self.on_text_change)
+        self.text_widget.bind('<Control-bracketright>', self.jump_to_matching_bracket)
+        self.text_widget.bind('<F12>', self.jump_to_definition)
+        self.text_widget.bind('<Shift-F12>', self.highlight_symbol_uses)
 
         # Renk açıklama paneli
         self.create_legend()
@@ -62,12 +97,16 @@ class CSyntaxHighlighterGUI:
         self.text_widget = tk.Text(text_frame, wrap='none', undo=True, font=('Courier New', 11))
         
         # Kaydırma çubukları
-        v_scrollbar = ttk.Scrollbar(text_frame, orient='vertical', command=self.text_widget.yview)
+        self.text_scrollbar = ttk.Scrollbar(text_frame, orient='vertical', command=self.text_widget.yview)
         h_scrollbar = ttk.Scrollbar(text_frame, orient='horizontal', command=self.text_widget.xview)
-        self.text_widget.configure(yscrollcommand=v_scrollbar.set, xscrollcommand=h_scrollbar.set)
+        self.text_widget.configure(yscrollcommand=self.on_text_scroll, xscrollcommand=h_scrollbar.set)
+        
+        # Yalnızca görünen satırları etiketleyen vurgulayıcı; eklenen metin ayrıca işaretlenir
+        self.highlighter = ViewportHighlighter(self.text_widget, self.monitor)
+        self.insert_tracker = TextInsertTracker(self.text_widget)
         
         # Kaydırma çubukları ve metin widget'ını yerleştir
-        v_scrollbar.pack(side='right', fill='y')
+        self.text_scrollbar.pack(side='right', fill='y')
         h_scrollbar.pack(side='bottom', fill='x')
         self.text_widget.pack(fill='both', expand=True)
         
@@ -85,16 +124,9 @@ class CSyntaxHighlighterGUI:
         
         ttk.Label(token_frame, text="Lexical Analyzer Sonuçları", font=('Arial', 10, 'bold')).pack(anchor='w')
         
-        # Kaydırma çubuklu token listesi
-        token_list_frame = ttk.Frame(token_frame)
-        token_list_frame.pack(fill='both', expand=True)
-        
-        self.token_listbox = tk.Listbox(token_list_frame, font=('Courier New', 9))
-        token_scrollbar = ttk.Scrollbar(token_list_frame, orient='vertical', command=self.token_listbox.yview)
-        self.token_listbox.configure(yscrollcommand=token_scrollbar.set)
-        
-        token_scrollbar.pack(side='right', fill='y')
-        self.token_listbox.pack(fill='both', expand=True)
+        # Kaydırma çubuklu token listesi (yalnızca görünen satırlar üretilir)
+        self.token_list = VirtualTokenList(token_frame, font=('Courier New', 9))
+        self.token_list.pack(fill='both', expand=True)
         
         # Parse tree sekmesi
         parse_frame = ttk.Frame(self.notebook)
@@ -115,6 +147,9 @@ class CSyntaxHighlighterGUI:
         tree_scrollbar_h.pack(side='bottom', fill='x')
         self.parse_tree_widget.pack(fill='both', expand=True)
         
+        # Alt düğümler yalnızca açıldıklarında eklenir
+        self.parse_tree_view = ParseTreeView(self.parse_tree_widget)
+        
         # Hatalar sekmesi
         error_frame = ttk.Frame(self.notebook)
         self.notebook.add(error_frame, text="Hatalar")
@@ -132,162 +167,243 @@ class CSyntaxHighlighterGUI:
         error_scrollbar.pack(side='right', fill='y')
         self.error_listbox.pack(fill='both', expand=True)
         
+        # Analiz aşamalarının Tcl çağrıları sayılır (editörünki yönlendirmeden sonra)
+        for widget in (self.text_widget, self.token_list.listbox, self.token_list.scrollbar,
+                       self.parse_tree_widget, self.error_listbox):
+            self.monitor.instrument(widget)
+        
+        # İsteğe bağlı performans sekmesi
+        if self.show_performance:
+            performance_frame = ttk.Frame(self.notebook)
+            self.notebook.add(performance_frame, text="Performans")
+            self.performance_panel = PerformancePanel(performance_frame, self.monitor)
+            self.performance_panel.pack(fill='both', expand=True)
+        
     def configure_tags(self):
         """Text widget etiketlerini yapılandır"""
-        # 5+ farklı token türü için renkler
-        self.text_widget.tag_configure('KEYWORD', foreground='#0000FF', font=('Courier New', 11, 'bold'))
-        self.text_widget.tag_configure('IDENTIFIER', foreground='#000080')
-        self.text_widget.tag_configure('NUMBER', foreground='#FF6600')
-        self.text_widget.tag_configure('STRING', foreground='#008000')
-        self.text_widget.tag_configure('CHAR', foreground='#008080')
-        self.text_widget.tag_configure('OPERATOR', foreground='#FF0080', font=('Courier New', 11, 'bold'))
-        self.text_widget.tag_configure('SEPARATOR', foreground='#800080', font=('Courier New', 11, 'bold'))
-        self.text_widget.tag_configure('COMMENT', foreground='#808080', font=('Courier New', 11, 'italic'))
-        self.text_widget.tag_configure('PREPROCESSOR', foreground='#804000', font=('Courier New', 11, 'bold'))
-        self.text_widget.tag_configure('ERROR', background='#FFCCCC', foreground='#CC0000')
-        
-        # Syntax hata vurgulama
-        self.text_widget.tag_configure('SYNTAX_ERROR', background='#FFE6E6')
-        self.text_widget.tag_configure('PAREN_ERROR', background='#FF9999', foreground='white')
+        # 5+ farklı token türü için renkler ve syntax hata vurgulama (gui/theme.py)
+        for tag in TAG_STYLES:
+            self.text_widget.tag_configure(tag, **tk_tag_options(tag))
     
     def on_text_change(self, event=None):
         """Metin değiştiğinde gerçek zamanlı analiz"""
-        # Kısa gecikme ile analiz et (performans için)
-        self.root.after(300, self.perform_real_time_analysis)
+        # Tıklama/kaydırma gibi metni değiştirmeyen olaylar bayrağı set etmez
+        if not self.text_widget.edit_modified():
+            return
+        self.text_widget.edit_modified(False)
+        if self.symbol_highlighted:
+            self.text_widget.tag_remove('SYMBOL_USE', '1.0', 'end')
+            self.symbol_highlighted = False
+        # Süren parse eski metne ait; iptal et
+        self.cancel_parse()
+        self.monitor.end(cancelled=True)
+        # Token konumları analiz gelene kadar eski: kaydırmada tembel etiketleme yapılmaz
+        self.highlighter.text_changed()
+        # Kısa gecikme ile analiz et; her yeni değişiklik bekleyen işi erteler
+        self.scheduler.schedule()
     
-    def perform_real_time_analysis(self):
-        """Gerçek zamanlı analiz gerçekleştir"""
-        try:
-            content = self.text_widget.get('1.0', 'end-1c')
-            
-            # Lexical analiz
-            self.current_tokens = self.lexical_analyzer.analyze(content)
-            
-            # Syntax vurgulama
-            self.apply_syntax_highlighting()
-            
-            # Görüntüleri güncelle
+    def get_content(self) -> str:
+        """Editördeki metni döndür"""
+        return self.text_widget.get('1.0', 'end-1c')
+    
+    def analyze_content(self, content: str) -> AnalysisResult:
+        """Lexical analiz yap (işçi thread'de çalışır, Tk'ye dokunmaz)"""
+        # Yalnızca değişen bölge yeniden taranır; parse Tk thread'inde dilimler halinde yapılır
+        start = time.perf_counter()
+        tokens = self.lexical_analyzer.analyze_incremental(content)
+        brackets = self.lexical_analyzer.bracket_index()
+        return AnalysisResult(content, tokens, splice=self.lexical_analyzer.last_splice,
+                              brackets=brackets, lex_seconds=time.perf_counter() - start)
+    
+    def apply_analysis(self, result: AnalysisResult):
+        """Analiz sonucunu arayüze uygula (Tk thread'inde)"""
+        self.lexical_analyzer.apply_pending_shift()  # İşçinin ertelediği kuyruk kaydırması
+        self.current_tokens = result.tokens
+        self.current_splice = result.splice
+        self.current_brackets = result.brackets
+        self.monitor.begin(tokens=len(result.tokens))
+        self.monitor.add('lex', result.lex_seconds)
+        
+        # Syntax vurgulama
+        self.apply_syntax_highlighting()
+        
+        # Görüntüleri güncelle
+        with self.monitor.phase('token_list'):
             self.update_token_display()
-
-            # Parse analizi (sadece çok büyük değilse)
-            if len(content) < 5000:  # Performans sınırı
-                try:
-                    parser = TopDownParser(self.current_tokens)
-                    self.parse_tree = parser.parse()
-                    self.errors = parser.errors
-                    self.update_parse_tree_display()
-                    self.update_error_display()
-                except Exception as e:
-                    self.errors = [f"Parser hatası: {str(e)}"]
-                    self.update_error_display()
         
+        # Parse analizi (boyut sınırı yok; sonuçlar ilerledikçe gösterilir)
+        self.start_parse(result.tokens, result.splice, result.brackets, result.content)
+    
+    def discard_analysis(self, result=None):
+        """Eskimiş analiz sonucu atıldı: lexer'ın ertelediği kaydırmayı yine de uygula (Tk thread'inde)"""
+        self.lexical_analyzer.apply_pending_shift()
+    
+    def start_parse(self, tokens, splice=None, brackets=None, text=None):
+        """Dilimli parse'ı başlat (süren parse iptal edilir)"""
+        self.cancel_parse()
+        self.parse_run = self.parser.start(tokens, splice, brackets, text)
+        self.parse_job = self.root.after_idle(self.continue_parse)
+    
+    def continue_parse(self):
+        """Bir zaman dilimi boyunca parse et, kısmi sonucu göster ve gerekirse devam et"""
+        self.parse_job = None
+        run = self.parse_run
+        if run is None:
+            return
+        monitor = self.monitor
+        with monitor.phase('parse'):
+            done = run.step(PARSE_SLICE_SECONDS)
+        
+        self.parse_tree = run.root
+        with monitor.phase('tree'):
+            self.update_parse_tree_display()
+        if done or len(run.errors) != len(self.errors):
+            self.errors = list(run.errors)
+            with monitor.phase('errors'):
+                self.update_error_display()
+        
+        if done:
+            self.parse_run = None
+            if monitor.current is not None:
+                monitor.count('nodes', count_nodes(run.root))
+                monitor.count('errors', len(run.errors))
+                monitor.count('reparsed', run.reparsed)
+                monitor.end()
+        else:
+            self.parse_job = self.root.after_idle(self.continue_parse)
+    
+    def cancel_parse(self):
+        """Süren dilimli parse'ı durdur (parser önbelleği değişmez)"""
+        if self.parse_job is not None:
+            self.root.after_cancel(self.parse_job)
+            self.parse_job = None
+        self.parse_run = None
+    
+    def perform_real_time_analysis(self):
+        """Gerçek zamanlı analizi zamanlayıcıyı beklemeden gerçekleştir"""
+        try:
+            self.apply_analysis(self.analyze_content(self.get_content()))
         except Exception as e:
             print(f"Gerçek zamanlı analiz hatası: {e}")
     
     def apply_syntax_highlighting(self):
-        """Syntax vurgulama uygula"""
-        # Mevcut etiketleri temizle
-        for tag in ['KEYWORD', 'IDENTIFIER', 'NUMBER', 'STRING', 'CHAR', 
-                   'OPERATOR', 'SEPARATOR', 'COMMENT', 'PREPROCESSOR', 'ERROR']:
-            self.text_widget.tag_remove(tag, '1.0', 'end')
-        
-        # Token'lara göre vurgulama uygula
-        for token in self.current_tokens:
-            if token.type == TokenType.EOF:
-                continue
-            
-            start_index = f"{token.line}.{token.column - 1}"
-            end_index = f"{token.line}.{token.column - 1 + len(token.value)}"
-            
-            try:
-                self.text_widget.tag_add(token.type.value, start_index, end_index)
-            except tk.TclError:
-                continue  # Geçersiz indeks, atla
+        """Syntax vurgulama uygula (yalnızca değişen token'lar, görünür aralık ve bir pay)"""
+        with self.monitor.phase('highlight'):
+            self.highlighter.update_tokens(self.current_tokens, self.current_splice,
+                                           self.insert_tracker.take_changed())
         
         # Parantez dengeleme kontrolü
-        self.check_parentheses_balance()
+        with self.monitor.phase('paren_check'):
+            self.check_parentheses_balance()
+    
+    def on_text_scroll(self, first, last):
+        """Editör kaydırıldığında kaydırma çubuğunu güncelle ve yeni görünen satırları etiketle"""
+        self.text_scrollbar.set(first, last)
+        self.highlighter.ensure_visible(first, last)
     
     def check_parentheses_balance(self):
-        """Parantez dengeleme kontrolü"""
-        # Önce eski parantez hata etiketlerini temizle
+        """Eşleşmeyen parantezleri işaretle (lexer'ın parantez tablosundan, tek Tcl çağrısı)
+
+        String, karakter ve yorum içindeki parantezler token olmadığından sayılmaz.
+        """
         self.text_widget.tag_remove('PAREN_ERROR', '1.0', 'end')
-        content = self.text_widget.get('1.0', 'end-1c')
-        stack = []
-        pairs = {'(': ')', '{': '}', '[': ']'}
-        opening = set(pairs.keys())
-        closing = set(pairs.values())
-        reverse_pairs = {v: k for k, v in pairs.items()}
-        
-        line = 1
-        col = 0
-        
-        for i, char in enumerate(content):
-            if char == '\n':
-                line += 1
-                col = 0
-            else:
-                col += 1
-            
-            if char in opening:
-                stack.append((char, line, col))
-            elif char in closing:
-                if stack and stack[-1][0] == reverse_pairs[char]:
-                    stack.pop()
-                else:
-                    # Eşleşmeyen kapanış
-                    index = f"{line}.{col-1}"
-                    self.text_widget.tag_add('PAREN_ERROR', index, f"{index}+1c")
-        
-        # Eşleşmeyen açılış
-        for char, line, col in stack:
-            index = f"{line}.{col-1}"
-            self.text_widget.tag_add('PAREN_ERROR', index, f"{index}+1c")
+        brackets = self.current_brackets
+        if brackets is None:
+            return
+        indices = []
+        for index in brackets.unmatched:
+            token = brackets.tokens[index]
+            indices.append(token_start_index(token))
+            indices.append(token_end_index(token))
+        if indices:
+            self.text_widget.tag_add('PAREN_ERROR', *indices)
+    
+    def jump_to_matching_bracket(self, event=None):
+        """İmleçteki (ya da hemen önündeki) parantezin eşine atla (Ctrl+])"""
+        brackets = self.current_brackets
+        if brackets is None:
+            return 'break'
+        position = (self.text_widget.count('1.0', 'insert') or (0,))[0]
+        for candidate in (position, position - 1):
+            index = brackets.token_at(candidate) if candidate >= 0 else None
+            other = brackets.match(index) if index is not None else None
+            if other is not None:
+                target = token_start_index(brackets.tokens[other])
+                self.text_widget.mark_set('insert', target)
+                self.text_widget.see(target)
+                break
+        return 'break'
+    
+    def symbol_at_insert(self):
+        """İmleçteki (ya da hemen önündeki) tanımlayıcının sembolü
+
+        Sembol tablosu son tamamlanan parse'tan gelir; parse sürüyorsa ya da
+        gösterilen token'lara ait değilse None döner.
+        """
+        brackets = self.current_brackets
+        if brackets is None or self.parse_run is not None or self.parser.source is not self.current_tokens:
+            return None
+        symbols = self.parser.symbol_index()
+        position = (self.text_widget.count('1.0', 'insert') or (0,))[0]
+        for candidate in (position, position - 1):
+            index = brackets.token_at(candidate) if candidate >= 0 else None
+            symbol = symbols.lookup(brackets.tokens[index]) if index is not None else None
+            if symbol is not None:
+                return symbol
+        return None
+
+    def jump_to_definition(self, event=None):
+        """İmleçteki tanımlayıcının tanımına atla (F12)"""
+        symbol = self.symbol_at_insert()
+        if symbol is not None and symbol.definition is not None:
+            target = token_start_index(symbol.definition)
+            self.text_widget.mark_set('insert', target)
+            self.text_widget.see(target)
+        return 'break'
+
+    def highlight_symbol_uses(self, event=None):
+        """İmleçteki tanımlayıcının kapsamındaki tüm kullanımlarını işaretle (Shift+F12, tek Tcl çağrısı)"""
+        self.text_widget.tag_remove('SYMBOL_USE', '1.0', 'end')
+        symbol = self.symbol_at_insert()
+        self.symbol_highlighted = symbol is not None
+        if symbol is not None:
+            indices = []
+            for token in symbol.uses:
+                indices.append(token_start_index(token))
+                indices.append(token_end_index(token))
+            self.text_widget.tag_add('SYMBOL_USE', *indices)
+        return 'break'
     
     def update_token_display(self):
         """Token listesini güncelle"""
-        self.token_listbox.delete(0, tk.END)
-        
-        for i, token in enumerate(self.current_tokens):
-            if token.type == TokenType.EOF:
-                continue
-            
-            display_text = f"{i+1:3d}: {token.type.value:12s} | {token.value:20s} | Satır {token.line:2d}, Sütun {token.column:2d}"
-            self.token_listbox.insert(tk.END, display_text)
+        self.token_list.set_tokens(self.current_tokens)
     
     def update_parse_tree_display(self):
-        """Parse tree görüntüsünü güncelle"""
-        # Mevcut ağacı temizle
-        for item in self.parse_tree_widget.get_children():
-            self.parse_tree_widget.delete(item)
-        
-        if self.parse_tree:
-            self.insert_tree_node(self.parse_tree, "")
-    
-    def insert_tree_node(self, node: ParseNode, parent: str):
-        """Parse tree düğümünü ekle"""
-        if not node:
-            return
-        
-        # Düğüm metni
-        display_text = node.name
-        if hasattr(node, 'token') and node.token:
-            display_text += f" ({node.token.value})"
-        
-        item_id = self.parse_tree_widget.insert(parent, 'end', text=display_text)
-        
-        # Alt düğümleri ekle
-        for child in node.children:
-            self.insert_tree_node(child, item_id)
+        """Parse tree görüntüsünü güncelle (üst düzey ve açık düğümler)"""
+        self.parse_tree_view.set_tree(self.parse_tree)
     
     def update_error_display(self):
         """Hata listesini güncelle"""
         self.error_listbox.delete(0, tk.END)
         
-        for error in self.errors:
-            self.error_listbox.insert(tk.END, error)
-        
-        if not self.errors:
+        # Mesajlar yalnızca burada, gösterilirken biçimlendirilir
+        if self.errors:
+            self.error_listbox.insert(tk.END, *[error.message for error in self.errors])
+        else:
             self.error_listbox.insert(tk.END, "Syntax hatası bulunamadı!")
+        
+        self.highlight_syntax_errors()
+    
+    def highlight_syntax_errors(self):
+        """Tanıların bölgelerini SYNTAX_ERROR etiketiyle işaretle (tek Tcl çağrısı)"""
+        self.text_widget.tag_remove('SYNTAX_ERROR', '1.0', 'end')
+        indices = []
+        for error in self.errors:
+            if error.first is not None:
+                indices.append(token_start_index(error.first))
+                indices.append(token_end_index(error.last))
+        if indices:
+            self.text_widget.tag_add('SYNTAX_ERROR', *indices)
     
     def load_sample_code(self):
         """Örnek kod yükle"""
@@ -338,15 +454,15 @@ int factorial(int n) {
         self.text_widget.delete('1.0', tk.END)
         self.text_widget.insert('1.0', sample_code)
         self.perform_real_time_analysis()
+        self.text_widget.edit_modified(False)  # Analiz edildi, zamanlayıcıya gerek yok
     
     def clear_text(self):
         """Metni temizle"""
         self.text_widget.delete('1.0', tk.END)
-        self.token_listbox.delete(0, tk.END)
+        self.token_list.set_tokens([])
         self.error_listbox.delete(0, tk.END)
         # Parse tree'yi temizle
-        for item in self.parse_tree_widget.get_children():
-            self.parse_tree_widget.delete(item)
+        self.parse_tree_view.set_tree(None)
 
     def create_legend(self):
         """Alt kısımda token renklerini gösteren açıklama paneli"""
@@ -354,17 +470,18 @@ int factorial(int n) {
         legend_frame.pack(fill=tk.X, padx=10, pady=(0, 10), side=tk.BOTTOM)
 
         colors_info = [
-            ("Anahtar Kelime", "#0000FF", "int, if, for"),
-            ("String", "#008000", '"Hello"'),
-            ("Sayı", "#FF6600", "42, 3.14"),
-            ("Yorum", "#808080", "// yorum"),
-            ("Operatör", "#FF0080", "+, ==, &&"),
-            ("Ayırıcı", "#800080", "( ) { } ;"),
-            ("Ön işlemci", "#804000", "#include"),
-            ("Karakter", "#008080", "'A'")
+            ("Anahtar Kelime", 'KEYWORD', "int, if, for"),
+            ("String", 'STRING', '"Hello"'),
+            ("Sayı", 'NUMBER', "42, 3.14"),
+            ("Yorum", 'COMMENT', "// yorum"),
+            ("Operatör", 'OPERATOR', "+, ==, &&"),
+            ("Ayırıcı", 'SEPARATOR', "( ) { } ;"),
+            ("Ön işlemci", 'PREPROCESSOR', "#include"),
+            ("Karakter", 'CHAR', "'A'")
         ]
 
-        for i, (label, color, example) in enumerate(colors_info):
+        for i, (label, tag, example) in enumerate(colors_info):
+            color = TAG_STYLES[tag]['foreground']
             frame = ttk.Frame(legend_frame)
             frame.grid(row=i//4, column=i%4, sticky='w', padx=10, pady=3)
 
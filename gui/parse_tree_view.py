@@ -0,0 +1,123 @@
+from parser.parse_tree import ParseNode
+
+PLACEHOLDER_TEXT = "..."  # Açılma okunun görünmesi için geçici alt öğe
+
+def node_text(node: ParseNode) -> str:
+    """Treeview'de gösterilen düğüm metni"""
+    display_text = node.name
+    if getattr(node, 'token', None):
+        display_text += f" ({node.token.value})"
+    return display_text
+
+def first_token_value(node: ParseNode):
+    """Düğümün altındaki ilk token değeri (düğüm kimliği için)"""
+    while node is not None:
+        if node.token is not None:
+            return node.token.value
+        node = node.children[0] if node.children else None
+    return None
+
+class ParseTreeView:
+    """Parse tree'yi talep üzerine dolduran Treeview sarmalayıcısı
+
+    Başlangıçta yalnızca kök ve üst düzey düğümler eklenir; alt düğümü olan
+    her öğeye bir yer tutucu konur ve gerçek alt düğümler <<TreeviewOpen>>
+    olayında eklenir. Açık düğümler (ad, ilk token, kardeşler arası sıra)
+    yolu ile hatırlanır ve yenilemeden sonra yeniden açılır.
+    """
+
+    def __init__(self, tree_widget):
+        self.tree_widget = tree_widget
+        self.nodes = {}  # Treeview öğesi -> ParseNode
+        self.keys = {}  # Treeview öğesi -> düğüm yolu
+        self.pending = set()  # Alt düğümleri henüz eklenmemiş öğeler
+        self.expanded = set()  # Açık düğüm yolları
+        self.root_node = None
+        self.root_item = None
+        self.child_counts = {}  # Öğe -> eklenmiş alt düğüm sayısı
+        self.child_ordinals = {}  # Öğe -> (ad, ilk token) -> sıra
+
+        tree_widget.bind('<<TreeviewOpen>>', self.on_open)
+        tree_widget.bind('<<TreeviewClose>>', self.on_close)
+
+    def set_tree(self, root):
+        """Ağacı yenile: yalnızca üst düzey ve daha önce açık olan düğümleri ekle
+
+        Aynı kök yeniden verilirse (ilerleyen parse) yalnızca sonradan eklenen
+        üst düzey düğümler eklenir.
+        """
+        if root is not None and root is self.root_node:
+            self.restore_expanded(self.populate(self.root_item))
+            return
+
+        children = self.tree_widget.get_children()
+        if children:
+            self.tree_widget.delete(*children)
+        self.nodes = {}
+        self.keys = {}
+        self.pending = set()
+        self.child_counts = {}
+        self.child_ordinals = {}
+        self.root_node = root
+        self.root_item = None
+        if root is None:
+            return
+
+        root_key = ((root.name, None, 0),)  # Kök, içeriği ne olursa olsun aynı yoldur
+        self.expanded.add(root_key)  # Kök her yenilemede açık: üst düzey düğümler görünür
+        self.root_item = self.insert_node('', root, root_key)
+        self.restore_expanded([self.root_item])
+
+    def restore_expanded(self, items):
+        """Açık yolları yeniden aç (yalnızca açık dallar doldurulur)"""
+        stack = list(items)
+        while stack:
+            item = stack.pop()
+            if self.keys[item] in self.expanded:
+                stack.extend(self.populate(item))
+                self.tree_widget.item(item, open=True)
+
+    def insert_node(self, parent: str, node: ParseNode, key) -> str:
+        """Tek düğümü ekle; alt düğümleri varsa yer tutucu koy"""
+        item = self.tree_widget.insert(parent, 'end', text=node_text(node))
+        self.nodes[item] = node
+        self.keys[item] = key
+        self.child_counts[item] = 0
+        self.child_ordinals[item] = {}
+        if node.children:
+            self.tree_widget.insert(item, 'end', text=PLACEHOLDER_TEXT)
+            self.pending.add(item)
+        return item
+
+    def populate(self, item: str):
+        """Yer tutucuyu kaldırıp öğenin henüz eklenmemiş alt düğümlerini ekle"""
+        if item in self.pending:
+            self.pending.discard(item)
+            self.tree_widget.delete(*self.tree_widget.get_children(item))
+        elif item != self.root_item:
+            return []  # Zaten dolduruldu (yalnızca kök sonradan büyüyebilir)
+
+        key = self.keys[item]
+        seen = self.child_ordinals[item]
+        children = self.nodes[item].children
+        items = []
+        for child in children[self.child_counts[item]:]:
+            identity = (child.name, first_token_value(child))
+            ordinal = seen.get(identity, 0)
+            seen[identity] = ordinal + 1
+            items.append(self.insert_node(item, child, key + (identity + (ordinal,),)))
+        self.child_counts[item] = len(children)
+        return items
+
+    def on_open(self, event=None):
+        """Açılan öğenin alt düğümlerini ekle"""
+        item = self.tree_widget.focus()
+        if item in self.keys:
+            self.populate(item)
+            self.expanded.add(self.keys[item])
+
+    def on_close(self, event=None):
+        """Kapatılan öğeyi açık yollardan çıkar"""
+        item = self.tree_widget.focus()
+        if item in self.keys:
+            self.expanded.discard(self.keys[item])
@@ -0,0 +1,157 @@
+import contextlib
+import math
+import time
+from collections import deque
+
+DEFAULT_HISTORY = 100  # Saklanan son çalıştırma sayısı
+PERCENTILES = (50, 90, 99)
+
+# Aşamalar gösterim sırasıyla; tag_remove ve tag_apply, highlight'ın içindedir
+PHASES = ('lex', 'highlight', 'tag_remove', 'tag_apply', 'paren_check', 'token_list', 'parse', 'tree', 'errors')
+
+NULL_PHASE = contextlib.nullcontext()
+
+def percentile(values, p: float):
+    """En yakın sıra yöntemiyle yüzdelik (değer yoksa None)"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[max(1, math.ceil(p / 100 * len(ordered))) - 1]
+
+class AnalysisProfile:
+    """Bir analiz çalıştırmasının (lex'ten parse tree'nin tamamlanmasına kadar) ölçümleri
+
+    phases ve tcl_calls iç içe aşamaları da içerir (highlight, tag_remove'u
+    kapsar); busy ve total_tcl_calls yalnızca en dış aşamaların toplamıdır.
+    Parse dilimler halinde ilerlediğinden elapsed, aradaki olay döngüsü
+    süresini de içerir.
+    """
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.elapsed = 0.0  # Başlangıçtan bitişe geçen süre (s)
+        self.busy = 0.0  # Aşamalarda geçen toplam süre (s)
+        self.phases = {}  # Aşama -> süre (s; aynı aşamanın tekrarları toplanır)
+        self.tcl_calls = {}  # Aşama -> Tcl çağrısı sayısı
+        self.total_tcl_calls = 0
+        self.counts = {}  # 'tokens', 'nodes', 'errors', 'reparsed'
+        self.cancelled = False  # Parse bitmeden yeni düzenleme geldi
+
+    def add(self, phase: str, seconds: float, calls: int = 0, outermost: bool = True):
+        self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+        self.tcl_calls[phase] = self.tcl_calls.get(phase, 0) + calls
+        if outermost:
+            self.busy += seconds
+            self.total_tcl_calls += calls
+
+class PhaseTimer:
+    """Bir aşamanın süresini ve Tcl çağrılarını ölçen bağlam yöneticisi"""
+    __slots__ = ('monitor', 'profile', 'name', 'start', 'calls')
+
+    def __init__(self, monitor: 'PerformanceMonitor', profile: AnalysisProfile, name: str):
+        self.monitor = monitor
+        self.profile = profile
+        self.name = name
+
+    def __enter__(self):
+        self.monitor.depth += 1
+        self.calls = self.monitor.tcl_count()
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        seconds = time.perf_counter() - self.start
+        self.monitor.depth -= 1
+        self.profile.add(self.name, seconds, self.monitor.tcl_count() - self.calls,
+                         outermost=self.monitor.depth == 0)
+        return False
+
+class CountingTk:
+    """Widget'ın Tcl yorumlayıcısı yerine konan, call() çağrılarını sayan vekil"""
+
+    def __init__(self, app, monitor: 'PerformanceMonitor'):
+        self.app = app
+        self.monitor = monitor
+
+    def call(self, *args):
+        self.monitor.tcl_calls += 1
+        return self.app.call(*args)
+
+    def __getattr__(self, name):
+        return getattr(self.app, name)
+
+class PerformanceMonitor:
+    """Gerçek zamanlı analiz aşamalarını ölçen hafif kancalar
+
+    Dinleyici yokken begin() kayıt başlatmaz ve phase() boş bağlam döndürür,
+    yani kancaların maliyeti bir öznitelik okumasıdır. Her çalıştırma
+    bittiğinde AnalysisProfile son çalıştırmalar geçmişine eklenir ve
+    dinleyicilere verilir. Tüm çağrılar Tk thread'inde yapılır; işçi
+    thread'deki lex süresi sonuçla birlikte taşınıp add() ile eklenir.
+    """
+
+    def __init__(self, history: int = DEFAULT_HISTORY, tcl_count=None):
+        self.history = deque(maxlen=history)
+        self.listeners = []
+        self.current = None  # Süren çalıştırmanın profili
+        self.depth = 0  # İç içe açık aşama sayısı
+        self.tcl_calls = 0  # CountingTk'lerden geçen çağrılar
+        self.tcl_count = tcl_count or (lambda: self.tcl_calls)  # () -> toplam Tcl çağrısı
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.listeners)
+
+    def add_listener(self, callback):
+        """callback(profile) her çalıştırma bittiğinde çağrılır; ölçümü etkinleştirir"""
+        self.listeners.append(callback)
+
+    def remove_listener(self, callback):
+        self.listeners.remove(callback)
+
+    def instrument(self, widget):
+        """Widget'ın Tcl çağrılarını say (yönlendirilmiş komutları olan widget'larda yönlendirmeden sonra çağrılmalı)"""
+        widget.tk = CountingTk(widget.tk, self)
+
+    def begin(self, **counts):
+        """Yeni çalıştırma başlat (bitmemiş önceki çalıştırma iptal edilmiş sayılır)"""
+        self.end(cancelled=True)
+        if self.enabled:
+            self.current = AnalysisProfile()
+            self.current.counts.update(counts)
+
+    def phase(self, name: str):
+        """with bloğu olarak kullanılan aşama ölçümü (süren çalıştırma yoksa hiçbir şey yapmaz)"""
+        if self.current is None:
+            return NULL_PHASE
+        return PhaseTimer(self, self.current, name)
+
+    def add(self, name: str, seconds: float):
+        """Başka yerde ölçülmüş aşama süresini ekle"""
+        if self.current is not None:
+            self.current.add(name, seconds)
+
+    def count(self, name: str, value: int):
+        if self.current is not None:
+            self.current.counts[name] = value
+
+    def end(self, cancelled: bool = False):
+        """Süren çalıştırmayı bitir, geçmişe ekle ve dinleyicilere bildir"""
+        profile = self.current
+        if profile is None:
+            return
+        self.current = None
+        self.depth = 0
+        profile.elapsed = time.perf_counter() - profile.started
+        profile.cancelled = cancelled
+        self.history.append(profile)
+        for callback in list(self.listeners):
+            callback(profile)
+
+    def percentiles(self, phase: str = None, points=PERCENTILES) -> dict:
+        """Geçmişteki çalıştırmalarda aşama süresinin (phase None ise busy) yüzdelikleri"""
+        if phase is None:
+            values = [profile.busy for profile in self.history]
+        else:
+            values = [profile.phases[phase] for profile in self.history if phase in profile.phases]
+        return {point: percentile(values, point) for point in points}
@@ -0,0 +1,69 @@
+from tkinter import ttk
+from gui.performance_monitor import PHASES, PERCENTILES, percentile
+
+DEFAULT_ROWS = 20  # Tabloda gösterilen son çalıştırma sayısı
+TIME_COLUMNS = ('busy',) + PHASES
+COUNT_COLUMNS = ('tcl', 'tokens', 'nodes')
+
+def format_ms(seconds) -> str:
+    return "" if seconds is None else f"{seconds * 1000:.1f}"
+
+class PerformancePanel:
+    """"Performans" sekmesi: son çalıştırmaların aşama süreleri (ms) ve yüzdelikler
+
+    Üstteki tabloda her satır bir çalıştırmadır (en yenisi başta); alttaki
+    tablo monitörün geçmişindeki tüm çalıştırmaların yüzdeliklerini gösterir.
+    Tablolar yalnızca bir çalıştırma bittiğinde, ölçüm dışında güncellenir.
+    """
+
+    def __init__(self, parent, monitor, rows: int = DEFAULT_ROWS):
+        self.monitor = monitor
+        self.rows = rows
+        self.run_number = 0
+        self.frame = ttk.Frame(parent)
+
+        ttk.Label(self.frame, text="Son Çalıştırmalar (ms)", font=('Arial', 10, 'bold')).pack(anchor='w')
+        self.table = self.create_table(rows)
+        ttk.Label(self.frame, text="Yüzdelikler (ms)", font=('Arial', 10, 'bold')).pack(anchor='w')
+        self.summary = self.create_table(len(PERCENTILES) + 1)
+        for point in PERCENTILES:
+            self.summary.insert('', 'end', iid=f"p{point}", text=f"p{point}")
+        self.summary.insert('', 'end', iid='max', text="en kötü")
+
+        monitor.add_listener(self.on_profile)
+
+    def create_table(self, height: int) -> ttk.Treeview:
+        columns = TIME_COLUMNS + COUNT_COLUMNS
+        table = ttk.Treeview(self.frame, columns=columns, height=height)
+        table.heading('#0', text="#")
+        table.column('#0', width=60, stretch=False)
+        for column in columns:
+            table.heading(column, text=column)
+            table.column(column, width=70, anchor='e', stretch=False)
+        table.pack(fill='x')
+        return table
+
+    def pack(self, **kwargs):
+        self.frame.pack(**kwargs)
+
+    def on_profile(self, profile):
+        """Monitör dinleyicisi: çalıştırmayı tabloya ekle, yüzdelikleri yenile"""
+        self.run_number += 1
+        label = f"{self.run_number} (iptal)" if profile.cancelled else str(self.run_number)
+        values = ([format_ms(profile.busy)] +
+                  [format_ms(profile.phases.get(phase)) for phase in PHASES] +
+                  [profile.total_tcl_calls, profile.counts.get('tokens', ''), profile.counts.get('nodes', '')])
+        self.table.insert('', 0, text=label, values=values)
+        excess = self.table.get_children()[self.rows:]
+        if excess:
+            self.table.delete(*excess)
+        self.update_summary()
+
+    def update_summary(self):
+        """Yüzdelik tablosunu monitörün tüm geçmişinden yeniden hesapla"""
+        points = PERCENTILES + (100,)
+        by_column = [self.monitor.percentiles(phase, points) for phase in (None,) + PHASES]
+        calls = [profile.total_tcl_calls for profile in self.monitor.history]
+        for point, item in [(point, f"p{point}") for point in PERCENTILES] + [(100, 'max')]:
+            values = [format_ms(column[point]) for column in by_column] + [percentile(calls, point), '', '']
+            self.summary.item(item, values=values)
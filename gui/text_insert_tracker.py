@@ -0,0 +1,88 @@
+class TextInsertTracker:
+    """Text widget'ının Tcl komutunu yönlendirerek düzenlenen aralığı izler
+
+    Tk, etiket listesi verilmeden eklenen karakterlere iki komşuda da bulunan
+    etiketleri verir; yönlendirme her eklemeye açık (boş) bir etiket listesi
+    ekler. Ayrıca son vurgulamadan bu yana eklenen/silinen metni kapsayan
+    aralık iki mark ile tutulur. Metin farkı aynı metnin silinip yeniden
+    eklendiğini göremez; vurgulayıcı bu aralığı kullanarak Tk'nin gerçekte
+    kaydırdığı karakterleri de yeniden etiketler.
+    """
+
+    START_MARK = 'changed_start'
+    END_MARK = 'changed_end'
+
+    def __init__(self, text_widget):
+        self.text_widget = text_widget
+        self.tk = text_widget.tk
+        self.original = text_widget._w + "_original"
+        self.changed = False
+        self.tk.call("rename", text_widget._w, self.original)
+        self.tk.createcommand(text_widget._w, self.dispatch)
+
+    def call(self, *args):
+        """Asıl widget komutunu çağır"""
+        return self.tk.call((self.original,) + args)
+
+    def dispatch(self, operation, *args):
+        """Widget komutunu asıl komuta ilet; insert/delete/replace aralığını kaydet"""
+        if operation == 'insert' and len(args) >= 2:
+            index = self.edit_index(args[0])
+            chunks = self.with_tag_lists(args[1:])
+            result = self.call(operation, index, *chunks)
+            self.mark_changed(index, f"{index}+{self.length(chunks)}c")
+            return result
+        if operation == 'delete' and args:
+            index = self.edit_index(args[0])
+            result = self.call(operation, *args)
+            self.mark_changed(index, index)
+            return result
+        if operation == 'replace' and len(args) >= 3:
+            index = self.edit_index(args[0])
+            chunks = self.with_tag_lists(args[2:])
+            result = self.call(operation, args[0], args[1], *chunks)
+            self.mark_changed(index, f"{index}+{self.length(chunks)}c")
+            return result
+        return self.call(operation, *args)
+
+    def edit_index(self, index) -> str:
+        """Düzenleme indeksini normalleştir ('end' son satır sonuna düşer)"""
+        index = self.call('index', index)
+        if self.tk.getboolean(self.call('compare', index, '==', 'end')):
+            index = self.call('index', 'end-1c')
+        return str(index)
+
+    @staticmethod
+    def with_tag_lists(chunks):
+        """Her (metin, etiket listesi) çiftinde etiket listesini açık hale getir"""
+        chunks = list(chunks)
+        if len(chunks) % 2 == 1:
+            chunks.append('')
+        return chunks
+
+    @staticmethod
+    def length(chunks) -> int:
+        """Eklenen toplam karakter sayısı"""
+        return sum(len(str(chars)) for chars in chunks[0::2])
+
+    def mark_changed(self, first: str, last: str):
+        """Değişen aralığı mark'larla genişlet (mark'lar sonraki düzenlemelerle kayar)"""
+        if not self.changed:
+            self.call('mark', 'set', self.START_MARK, first)
+            self.call('mark', 'gravity', self.START_MARK, 'left')
+            self.call('mark', 'set', self.END_MARK, last)
+            self.changed = True
+            return
+        if self.tk.getboolean(self.call('compare', first, '<', self.START_MARK)):
+            self.call('mark', 'set', self.START_MARK, first)
+        if self.tk.getboolean(self.call('compare', last, '>', self.END_MARK)):
+            self.call('mark', 'set', self.END_MARK, last)
+
+    def take_changed(self):
+        """Son çağrıdan bu yana değişen aralığı ('satır.sütun', 'satır.sütun') döndür ve sıfırla"""
+        if not self.changed:
+            return None
+        changed = (str(self.call('index', self.START_MARK)), str(self.call('index', self.END_MARK)))
+        self.call('mark', 'unset', self.START_MARK, self.END_MARK)
+        self.changed = False
+        return changed
@@ -0,0 +1,34 @@
+FONT_FAMILY = 'Courier New'
+FONT_SIZE = 11
+
+# Etiket -> stil; Tk etiketleri, HTML sınıfları ve ANSI renkleri bu tablodan üretilir
+# (foreground/background: '#RRGGBB', style: 'bold' / 'italic')
+TAG_STYLES = {
+    'KEYWORD': {'foreground': '#0000FF', 'style': 'bold'},
+    'IDENTIFIER': {'foreground': '#000080'},
+    'NUMBER': {'foreground': '#FF6600'},
+    'STRING': {'foreground': '#008000'},
+    'CHAR': {'foreground': '#008080'},
+    'OPERATOR': {'foreground': '#FF0080', 'style': 'bold'},
+    'SEPARATOR': {'foreground': '#800080', 'style': 'bold'},
+    'COMMENT': {'foreground': '#808080', 'style': 'italic'},
+    'PREPROCESSOR': {'foreground': '#804000', 'style': 'bold'},
+    'ERROR': {'background': '#FFCCCC', 'foreground': '#CC0000'},
+    # Syntax hata vurgulama
+    'SYNTAX_ERROR': {'background': '#FFE6E6'},
+    'PAREN_ERROR': {'background': '#FF9999', 'foreground': '#FFFFFF'},
+    # İmleçteki tanımlayıcının tüm kullanımları (Shift+F12)
+    'SYMBOL_USE': {'background': '#FFF2A8'},
+}
+
+def tk_tag_options(tag: str, size: int = FONT_SIZE) -> dict:
+    """Text.tag_configure seçenekleri"""
+    style = TAG_STYLES[tag]
+    options = {name: style[name] for name in ('foreground', 'background') if name in style}
+    if 'style' in style:
+        options['font'] = (FONT_FAMILY, size, style['style'])
+    return options
+
+def rgb(color: str) -> tuple:
+    """'#RRGGBB' -> (r, g, b)"""
+    return int(color[1:3], 16), int(color[3:5], 16), int(color[5:7], 16)
@@ -0,0 +1,281 @@
+import math
+import tkinter as tk
+from bisect import bisect_left, bisect_right
+from models.token import TokenType
+from gui.performance_monitor import PerformanceMonitor
+
+HIGHLIGHT_TAGS = ['KEYWORD', 'IDENTIFIER', 'NUMBER', 'STRING', 'CHAR',
+                  'OPERATOR', 'SEPARATOR', 'COMMENT', 'PREPROCESSOR', 'ERROR']
+
+
+def index_key(index: str):
+    """'satır.sütun' Tk indeksini karşılaştırılabilir demete çevir ('end' en sondadır)"""
+    if index == 'end':
+        return math.inf, 0
+    line, column = index.split('.')
+    return int(line), int(column)
+
+def token_key(token):
+    """Token başlangıcının (satır, sütun) demeti (Tk sütunları 0 tabanlıdır)"""
+    return token.line, token.column - 1
+
+def token_start_index(token) -> str:
+    """Token başlangıcının Tk indeksi"""
+    return f"{token.line}.{token.column - 1}"
+
+def token_end_index(token) -> str:
+    """Token sonunun Tk indeksi (çok satırlı token'lar karakter sayısıyla)"""
+    if '\n' in token.value:
+        return f"{token.line}.{token.column - 1}+{len(token.value)}c"
+    return f"{token.line}.{token.column - 1 + len(token.value)}"
+
+class ViewportHighlighter:
+    """Yalnızca görünen satırları (ve bir pay) etiketleyen vurgulayıcı
+
+    Token'lar değiştiğinde yalnızca görünür aralık etiketlenir; kaydırıldıkça
+    henüz etiketlenmemiş satırlar saklanan token pozisyonlarından tembelce
+    etiketlenir. Böylece tuş başına Tk maliyeti dosya boyutuna değil ekran
+    boyutuna bağlıdır.
+
+    Uygulanan etiketler token nesnesi bazında tutulur. Artımlı lexer'ın
+    TokenSplice kaydı varsa yalnızca değişen token'ların etiketleri kaldırılır
+    ve eklenir; kaydırılan token'ların etiketlerini Tk metinle birlikte taşır.
+    Etiket kaldırma ve ekleme monitörde tag_remove/tag_apply aşamalarıdır.
+    """
+
+    MARGIN_LINES = 100  # Görünür aralığın üstüne/altına eklenen satır sayısı
+
+    def __init__(self, text_widget, monitor: PerformanceMonitor = None):
+        self.text_widget = text_widget
+        self.monitor = monitor or PerformanceMonitor()
+        self.tokens = []
+        self.line_count = 1
+        self.tagged_ranges = []  # Etiketlenmiş satır aralıkları [(ilk, son)], sıralı ve birleşik
+        self.applied = {}  # Token -> Tk'de uygulanmış etiket adı
+        self.edit_pending = False  # Metin düzenlendi, yeni token'lar henüz gelmedi
+
+    def text_changed(self):
+        """Metin düzenlendi: token konumları yeni analiz gelene kadar eskidir
+
+        Bu arada kaydırmada etiketleme yapılmaz; eski konumlarla eklenen
+        etiketler uygulanmış sayılır ve düzenlemeden sonra onarılmazdı. Yeni
+        token'lar uygulanınca görünür aralık etiketlenir.
+        """
+        self.edit_pending = True
+
+    def set_tokens(self, tokens):
+        """Yeni token akışını uygula: eski etiketleri kaldır, görünür aralığı etiketle"""
+        self.edit_pending = False
+        with self.monitor.phase('tag_remove'):
+            for tag in set(self.applied.values()):
+                self.text_widget.tag_remove(tag, '1.0', 'end')
+        self.applied = {}
+        self.tokens = tokens
+        self.line_count = tokens[-1].line if tokens else 1  # EOF token'ı son satırdadır
+        self.tagged_ranges = []
+        self.ensure_visible(*self.text_widget.yview())
+
+    def update_tokens(self, tokens, splice=None, changed=None):
+        """Token akışını önceki uygulanan etiketlerle farkını alarak uygula
+
+        changed, son vurgulamadan bu yana Tk'de düzenlenen aralıktır
+        (TextInsertTracker); verilmezse metin farkının aralığı kullanılır.
+        """
+        if (splice is None or splice.previous_tokens is not self.tokens or
+                not self.tokens or not tokens):
+            self.set_tokens(tokens)
+            return
+        self.edit_pending = False
+
+        start = splice.start_index
+        removed = splice.removed
+        inserted = tokens[start:start + splice.inserted_count]
+        applied = self.applied
+
+        # Düzenlemeden önce aynı kalan token'ların etiketleri yerinde kalır
+        kept = 0
+        while (kept < len(removed) and kept < len(inserted) and
+               self.same_span(removed[kept], inserted[kept]) and
+               removed[kept].position + len(removed[kept].value) <= splice.edit_start):
+            tag = applied.pop(removed[kept], None)
+            if tag is not None:
+                applied[inserted[kept]] = tag
+            kept += 1
+        stale_tags = {applied.pop(token) for token in removed[kept:] if token in applied}
+
+        # Değişen bölge: ilk farklı token'dan kaydırılan ilk eski token'a kadar,
+        # Tk'de gerçekten düzenlenen aralıkla birleştirilmiş
+        tail_index = start + splice.inserted_count
+        tail_token = tokens[tail_index] if tail_index < len(tokens) - 1 else None
+        region_start = self.region_start(splice, removed[kept:], inserted[kept:])
+        region_end = token_start_index(tail_token) if tail_token else 'end'
+        if changed is not None:
+            region_start = min(region_start, changed[0], key=index_key)
+            region_end = max(region_end, changed[1], key=index_key)
+
+        self.tokens = tokens
+        self.line_count = tokens[-1].line
+        self.rebase_ranges(splice, tail_token)
+
+        # Bölgedeki eski karakterlerin etiketlerini kaldır, bölgeye değen token'ları yeniden etiketle
+        low, high = self.tokens_in_region(region_start, region_end)
+        touching = [token for token in tokens[low:high] if token in applied]
+        with self.monitor.phase('tag_remove'):
+            for tag in stale_tags | {applied[token] for token in touching}:
+                self.text_widget.tag_remove(tag, region_start, region_end)
+        self.add_tags(touching)
+        self.tag_tokens(token for token in inserted[kept:] if self.is_tagged_token(token))
+        self.ensure_visible(*self.text_widget.yview())
+
+    def tokens_in_region(self, region_start: str, region_end: str):
+        """Tk indeks aralığına değen token'ların indeks aralığı"""
+        tokens = self.tokens
+        low = max(0, bisect_right(tokens, index_key(region_start), key=token_key) - 1)
+        if region_end == 'end':
+            return low, len(tokens)
+        return low, bisect_left(tokens, index_key(region_end), lo=low, key=token_key)
+
+    @staticmethod
+    def same_span(old, new) -> bool:
+        """İki token aynı metin aralığında aynı etiketi mi taşıyor"""
+        return (old.position == new.position and old.type == new.type and
+                old.value == new.value)
+
+    @staticmethod
+    def region_start(splice, removed, inserted) -> str:
+        """Değişen bölgenin yeni metindeki başlangıç indeksi"""
+        candidates = []
+        if inserted:
+            candidates.append((inserted[0].position, token_start_index(inserted[0])))
+        if removed and removed[0].position < splice.edit_start:
+            candidates.append((removed[0].position, token_start_index(removed[0])))
+        candidates.append((splice.edit_start, f"{splice.edit_line}.{splice.edit_column - 1}"))
+        return min(candidates)[1]
+
+    def rebase_ranges(self, splice, tail_token):
+        """Etiketlenmiş satır aralıklarını düzenlemeye göre yeni satır numaralarına taşı"""
+        edit_line = splice.edit_line
+        if tail_token is None or splice.line_delta is None:
+            new_sync_line = self.line_count + 1
+            old_sync_line = None
+        else:
+            new_sync_line = tail_token.line
+            old_sync_line = new_sync_line - splice.line_delta
+
+        rebased = []
+        for first, last in self.tagged_ranges:
+            # Bölge içindeki satırlarda yalnızca yeni token'lar vardır; onları etiketleyeceğiz
+            # Düzenleme satırı aralıkta değilse (ilk > edit_line) birleşen satırlar da değildir
+            if first <= edit_line:
+                new_first = first
+            elif old_sync_line is not None and first >= old_sync_line:
+                new_first = max(first + splice.line_delta, edit_line + 1)
+            else:
+                new_first = edit_line + 1
+            if last <= edit_line:
+                new_last = last
+            elif old_sync_line is not None and last >= old_sync_line:
+                new_last = last + splice.line_delta
+            else:
+                new_last = new_sync_line - 1
+            if old_sync_line is not None and last < old_sync_line:
+                new_last = min(new_last, new_sync_line - 1)  # Kayan etiketsiz satır birleşmiş olabilir
+            new_last = min(new_last, self.line_count)
+            if new_first <= new_last:
+                rebased.append((new_first, new_last))
+        self.tagged_ranges = []
+        for first, last in rebased:
+            self.mark_tagged(first, last)
+
+    def is_tagged_token(self, token) -> bool:
+        """Token'ın satırlarından biri etiketlenmiş aralıklardan birinde mi"""
+        end_line = token.line + token.value.count('\n')
+        for first, last in self.tagged_ranges:
+            if first <= end_line and token.line <= last:
+                return True
+        return False
+
+    def visible_lines(self, first: float, last: float):
+        """yview kesirlerinden pay eklenmiş satır aralığını hesapla"""
+        first_line = int(first * self.line_count) + 1 - self.MARGIN_LINES
+        last_line = math.ceil(last * self.line_count) + 1 + self.MARGIN_LINES
+        return max(1, first_line), min(self.line_count, last_line)
+
+    def ensure_visible(self, first, last):
+        """yview aralığında henüz etiketlenmemiş satırları etiketle (kaydırmada çağrılır)"""
+        if not self.tokens or self.edit_pending:
+            return
+        start_line, end_line = self.visible_lines(float(first), float(last))
+        for start, end in self.missing_ranges(start_line, end_line):
+            self.tag_lines(start, end)
+            self.mark_tagged(start, end)
+
+    def missing_ranges(self, start_line: int, end_line: int):
+        """[start_line, end_line] içinde etiketlenmemiş alt aralıklar"""
+        missing = []
+        current = start_line
+        for first, last in self.tagged_ranges:
+            if last < current:
+                continue
+            if first > end_line:
+                break
+            if first > current:
+                missing.append((current, first - 1))
+            current = max(current, last + 1)
+        if current <= end_line:
+            missing.append((current, end_line))
+        return missing
+
+    def mark_tagged(self, start_line: int, end_line: int):
+        """Aralığı etiketlenmiş olarak kaydet (komşu aralıklarla birleştirerek)"""
+        merged = []
+        for first, last in self.tagged_ranges:
+            if last + 1 < start_line or first > end_line + 1:
+                merged.append((first, last))
+            else:
+                start_line, end_line = min(first, start_line), max(last, end_line)
+        merged.append((start_line, end_line))
+        merged.sort()
+        self.tagged_ranges = merged
+
+    def tokens_in_lines(self, start_line: int, end_line: int):
+        """Satır aralığına düşen token'ların indeks aralığı"""
+        tokens = self.tokens
+        low = bisect_left(tokens, start_line, key=lambda t: t.line)
+        high = bisect_right(tokens, end_line, lo=low, key=lambda t: t.line)
+        # Aralıktan önce başlayıp içine uzanan çok satırlı token
+        if low > 0 and '\n' in tokens[low - 1].value:
+            previous = tokens[low - 1]
+            if previous.line + previous.value.count('\n') >= start_line:
+                low -= 1
+        return low, high
+
+    def tag_lines(self, start_line: int, end_line: int):
+        """Satır aralığındaki token'ları etiketle"""
+        low, high = self.tokens_in_lines(start_line, end_line)
+        self.tag_tokens(self.tokens[low:high])
+
+    def tag_tokens(self, tokens):
+        """Henüz etiketlenmemiş token'ları etiketle"""
+        applied = self.applied
+        pending = []
+        for token in tokens:
+            if token.type == TokenType.EOF or token in applied:
+                continue
+            applied[token] = token.type.value
+            pending.append(token)
+        self.add_tags(pending)
+
+    def add_tags(self, tokens):
+        """Uygulanmış etiketleri Tk'ye ekle (etiket başına tek Tcl çağrısı)"""
+        ranges = {}
+        for token in tokens:
+            indices = ranges.setdefault(self.applied[token], [])
+            indices.append(token_start_index(token))
+            indices.append(token_end_index(token))
+        with self.monitor.phase('tag_apply'):
+            for tag, indices in ranges.items():
+                try:
+                    self.text_widget.tag_add(tag, *indices)
+                except tk.TclError:
+                    continue  # Geçersiz indeks, atla
@@ -0,0 +1,88 @@
+import tkinter as tk
+from tkinter import font as tkfont
+from tkinter import ttk
+from models.token import TokenType
+
+def format_token_row(index: int, token) -> str:
+    """Token listesi satırının metni"""
+    return f"{index+1:3d}: {token.type.value:12s} | {token.value:20s} | Satır {token.line:2d}, Sütun {token.column:2d}"
+
+class VirtualTokenList:
+    """Yalnızca görünen satırları biçimlendiren sanal token listesi
+
+    Listbox'ta her zaman yalnızca ekrana sığan satırlar bulunur; kaydırma
+    çubuğu toplam satır sayısına göre ayrıca yönetilir. Kaydırıldıkça
+    görünen satırlar token deposundan yeniden üretilir, böylece yenileme
+    maliyeti token sayısından bağımsızdır.
+    """
+
+    def __init__(self, parent, font=('Courier New', 9)):
+        self.frame = ttk.Frame(parent)
+        self.listbox = tk.Listbox(self.frame, font=font, activestyle='none')
+        self.scrollbar = ttk.Scrollbar(self.frame, orient='vertical', command=self.on_scrollbar)
+
+        self.scrollbar.pack(side='right', fill='y')
+        self.listbox.pack(fill='both', expand=True)
+
+        self.tokens = []
+        self.row_count = 0  # EOF hariç toplam satır sayısı
+        self.first = 0  # En üstte görünen satırın indeksi
+        self.row_height = (tkfont.Font(font=self.listbox.cget('font')).metrics('linespace') + 1 +
+                           2 * int(self.listbox.cget('selectborderwidth')))
+
+        self.listbox.bind('<Configure>', lambda event: self.render())
+        self.listbox.bind('<MouseWheel>', self.on_mouse_wheel)
+        self.listbox.bind('<Button-4>', lambda event: self.scroll(-3))
+        self.listbox.bind('<Button-5>', lambda event: self.scroll(3))
+
+    def pack(self, **kwargs):
+        self.frame.pack(**kwargs)
+
+    def set_tokens(self, tokens):
+        """Yeni token deposunu göster (yalnızca görünen satırlar biçimlendirilir)"""
+        self.tokens = tokens
+        self.row_count = len(tokens)
+        if self.row_count and tokens[-1].type == TokenType.EOF:
+            self.row_count -= 1
+        self.render()
+
+    def visible_rows(self) -> int:
+        """Listbox'a sığan satır sayısı"""
+        height = self.listbox.winfo_height()
+        if height <= 1:  # Henüz yerleşmedi
+            return int(self.listbox.cget('height'))
+        return max(1, height // self.row_height)
+
+    def render(self):
+        """Görünen satırları token deposundan üret ve kaydırma çubuğunu güncelle"""
+        rows = self.visible_rows()
+        self.first = max(0, min(self.first, self.row_count - rows))
+        last = min(self.row_count, self.first + rows)
+
+        self.listbox.delete(0, tk.END)
+        if last > self.first:
+            self.listbox.insert(tk.END, *[format_token_row(i, self.tokens[i]) for i in range(self.first, last)])
+
+        if self.row_count:
+            self.scrollbar.set(self.first / self.row_count, last / self.row_count)
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+    def scroll(self, rows: int):
+        """Görünümü verilen satır sayısı kadar kaydır"""
+        self.first += rows
+        self.render()
+        return 'break'
+
+    def on_scrollbar(self, action, value, unit=None):
+        """Kaydırma çubuğu komutu (moveto / scroll)"""
+        if action == 'moveto':
+            self.first = int(float(value) * self.row_count)
+            self.render()
+        elif action == 'scroll':
+            step = self.visible_rows() if unit == 'pages' else 1
+            self.scroll(int(value) * step)
+
+    def on_mouse_wheel(self, event):
+        """Fare tekerleği ile kaydır"""
+        return self.scroll(-3 if event.delta > 0 else 3)
@@ -0,0 +1,62 @@
+from array import array
+from bisect import bisect_right
+from typing import List, Optional
+from models.token import Token, SPELLING_KINDS
+
+# Açılış ayırıcısının kodu -> kapanışının kodu
+BRACKET_PAIRS = {SPELLING_KINDS[open_]: SPELLING_KINDS[close] for open_, close in (('(', ')'), ('[', ']'), ('{', '}'))}
+CLOSING_BRACKETS = frozenset(BRACKET_PAIRS.values())
+
+class BracketIndex:
+    """Token listesindeki parantez/köşeli parantez/süslü parantez eşleşmeleri
+
+    Yalnızca SEPARATOR token'larının kodlarına bakılır; string, karakter ve
+    yorum içindeki parantezler token olmadıkları için sayılmaz. Tablo tek
+    geçişte kurulur: her parantez token'ının indeksi eşinin indeksini tutar
+    (eşi yoksa -1), eşleşmeyenler ayrıca listelenir. Bir parantezin eşi O(1)
+    ile bulunur.
+    """
+
+    def __init__(self, tokens: List[Token]):
+        self.tokens = tokens
+        self.matches = array('i', [-1]) * len(tokens)  # Token indeksi -> eşinin indeksi
+        self.unmatched = []  # Eşleşmeyen parantez token'larının indeksleri (sıralı)
+
+        matches = self.matches
+        unmatched = self.unmatched
+        stack = []  # (açılış indeksi, beklenen kapanış kodu)
+        for index, token in enumerate(tokens):
+            kind = token.kind
+            closing = BRACKET_PAIRS.get(kind)
+            if closing is not None:
+                stack.append((index, closing))
+            elif kind in CLOSING_BRACKETS:
+                if stack and stack[-1][1] == kind:
+                    opening = stack.pop()[0]
+                    matches[opening] = index
+                    matches[index] = opening
+                else:
+                    unmatched.append(index)  # Eşleşmeyen kapanış açılışları tüketmez
+        if stack:
+            unmatched.extend(index for index, _ in stack)
+            unmatched.sort()
+
+    def match(self, index: int) -> Optional[int]:
+        """Parantez token'ının eşinin indeksi (eşi yoksa ya da parantez değilse None)"""
+        other = self.matches[index]
+        return other if other >= 0 else None
+
+    def skip(self, index: int) -> int:
+        """Açılış parantezindeyse dengeli bölgenin sonrasındaki indeks, değilse index + 1"""
+        other = self.matches[index]
+        return other + 1 if other > index else index + 1
+
+    def token_at(self, position: int) -> Optional[int]:
+        """Karakter pozisyonunu kapsayan token'ın indeksi (boşluktaysa None)"""
+        index = bisect_right(self.tokens, position, key=lambda t: t.position) - 1
+        if index < 0:
+            return None
+        token = self.tokens[index]
+        if position >= token.position + len(token.value):
+            return None
+        return index
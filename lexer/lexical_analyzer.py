@@ -1,6 +1,26 @@
+import mmap
+import re
+import sys
+from bisect import bisect_left, bisect_right
 from enum import Enum
-from typing import List, Optional
-from models.token import Token, TokenType
+from typing import Iterator, List, Optional, TextIO
+from models.token import Token, TokenType, TOKEN_TYPE_CODES, KEYWORDS, OPERATORS, SEPARATORS
+from models.token_buffer import TokenBuffer
+from models.analysis_cache import AnalysisCache
+from lexer.regex_engine import MasterPattern, RegexScanner
+from lexer.bracket_index import BracketIndex
+
+DEFAULT_CHUNK_SIZE = 64 * 1024  # iter_tokens için okuma parçası (karakter)
+CHECKPOINT_BYTES = 120  # Önbellekte bir satır başı kaydının yaklaşık boyutu
+NON_ASCII_BYTE = re.compile(rb"[\x80-\xff]")
+
+def map_file(path: str):
+    """Dosyayı salt okunur olarak belleğe eşle (boş dosya için b"")"""
+    with open(path, 'rb') as file:
+        try:
+            return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # Boş dosya eşlenemez
+            return b""
 
 class LexicalState(Enum):
     """Lexical analyzer için durumlar"""
@@ -15,30 +35,139 @@ class LexicalState(Enum):
     PREPROCESSOR = "PREPROCESSOR"
     ERROR = "ERROR"
 
+# Birden fazla satıra yayılabilen regex grupları ve satır başında kalınan durum
+MULTILINE_GROUP_STATES = {
+    'WHITESPACE': LexicalState.START,
+    'STRING': LexicalState.STRING,
+    'STRING_ERROR': LexicalState.STRING,
+    'CHAR': LexicalState.CHAR,
+    'CHAR_ERROR': LexicalState.CHAR,
+    'COMMENT_MULTI': LexicalState.COMMENT_MULTI,
+}
+
+class LineCheckpoint:
+    """Satır başındaki lexer durumu (artımlı analiz için)"""
+    def __init__(self, position, line, column, state, token_index):
+        self.position = position  # Satır başının metindeki pozisyonu
+        self.line = line  # Satır numarası
+        self.column = column  # Sütun numarası (satır başında her zaman 1)
+        self.state = state  # Satır başındaki LexicalState
+        self.token_index = token_index  # Bu noktaya kadar üretilmiş token sayısı
+
+    @property
+    def in_comment(self) -> bool:
+        """Satır başı çok satırlı bir yorumun içinde mi"""
+        return self.state == LexicalState.COMMENT_MULTI
+
+    @property
+    def in_string(self) -> bool:
+        """Satır başı bir string/karakter literalinin içinde mi"""
+        return self.state in (LexicalState.STRING, LexicalState.CHAR)
+
+    @property
+    def is_safe(self) -> bool:
+        """Yeniden analiz bu noktadan başlatılabilir mi"""
+        return self.state == LexicalState.START
+
+class LexSnapshot:
+    """Önbellekteki lexical analiz sonucu
+
+    Token'lar kompakt TokenBuffer'da, satır başları demet olarak saklanır.
+    Artımlı lexer token'ları yerinde kaydırdığından önbellek canlı token
+    nesnelerini paylaşmaz; geri yüklemede yeni Token nesneleri üretilir.
+    """
+    __slots__ = ('buffer', 'checkpoints', 'size')
+
+    def __init__(self, text: str, tokens: List[Token], checkpoints: List[LineCheckpoint]):
+        self.buffer = TokenBuffer(text)
+        for token in tokens:
+            self.buffer.append_token(token)
+        self.checkpoints = [(c.position, c.line, c.state, c.token_index) for c in checkpoints]
+        arrays = (self.buffer.kinds, self.buffer.starts, self.buffer.ends,
+                  self.buffer.lines, self.buffer.columns)
+        self.size = (sys.getsizeof(text) + sum(a.itemsize * len(a) for a in arrays) +
+                     CHECKPOINT_BYTES * len(checkpoints))
+
+    def tokens(self) -> List[Token]:
+        return list(self.buffer)
+
+    def line_checkpoints(self) -> List[LineCheckpoint]:
+        return [LineCheckpoint(position, line, 1, state, token_index)
+                for position, line, state, token_index in self.checkpoints]
+
+class TokenSplice:
+    """Son artımlı analizde token listesinde yapılan değişiklik"""
+    def __init__(self, start_index, removed, inserted_count, previous_tokens=None,
+                 edit_start=0, edit_line=1, edit_column=1, line_delta=None):
+        self.start_index = start_index  # Değişen ilk token'ın indeksi
+        self.removed = removed  # Listeden çıkarılan eski token'lar
+        self.inserted_count = inserted_count  # Yerine eklenen yeni token sayısı
+        self.previous_tokens = previous_tokens  # Değişiklikten önceki token listesi
+        self.edit_start = edit_start  # Düzenlemenin başladığı pozisyon
+        self.edit_line = edit_line  # Düzenleme başlangıcının satırı
+        self.edit_column = edit_column  # Düzenleme başlangıcının sütunu
+        self.line_delta = line_delta  # Kaydırılan token'ların satır farkı (hizalanmadıysa None)
+
+class TailShift:
+    """Artımlı analizde değişmeyen kuyruk token'larının bekleyen yerinde kaydırması"""
+    __slots__ = ('tokens', 'sync_line', 'position_delta', 'line_delta', 'column_delta')
+
+    def __init__(self, tokens: List[Token], sync_line: int, position_delta: int, line_delta: int,
+                 column_delta: int):
+        self.tokens = tokens
+        self.sync_line = sync_line  # Sütunu kayan (senkronizasyon token'ının) satırı
+        self.position_delta = position_delta
+        self.line_delta = line_delta
+        self.column_delta = column_delta
+
+    def apply(self):
+        sync_line, column_delta = self.sync_line, self.column_delta
+        position_delta, line_delta = self.position_delta, self.line_delta
+        for token in self.tokens:
+            if token.line == sync_line:
+                token.column += column_delta
+            token.position += position_delta
+            token.line += line_delta
+
 class LexicalAnalyzer:
     """State Diagram & Program Implementation yaklaşımı ile Lexical Analyzer"""
     
-    def __init__(self):
+    ENGINE_STATE = "state"  # Karakter karakter ilerleyen durum makinesi
+    ENGINE_REGEX = "regex"  # Derlenmiş ana regex ile tarama
+    
+    def __init__(self, engine: str = ENGINE_STATE, cache: Optional[AnalysisCache] = None,
+                 defer_shift: bool = False):
+        if engine not in (self.ENGINE_STATE, self.ENGINE_REGEX):
+            raise ValueError(f"Bilinmeyen lexer motoru: {engine}")
+        self.engine = engine
+        self.cache = cache  # Tam analiz sonuçlarının içerik anahtarlı önbelleği
+        # defer_shift: artımlı analiz kuyruk token'larını kaydırmaz, pending_shift'e bırakır;
+        # token'ları okuyan thread (GUI'de Tk) kaydırmayı apply_pending_shift() ile yapar
+        self.defer_shift = defer_shift
+        self.cache_namespace = f"lex-{engine}"
+        self._master_patterns = {}
+        
         # C Dili anahtar kelimeleri
-        self.keywords = {
-            'auto', 'break', 'case', 'char', 'const', 'continue', 'default', 'do',
-            'double', 'else', 'enum', 'extern', 'float', 'for', 'goto', 'if',
-            'int', 'long', 'register', 'return', 'short', 'signed', 'sizeof', 'static',
-            'struct', 'switch', 'typedef', 'union', 'unsigned', 'void', 'volatile', 'while'
-        }
+        self.keywords = set(KEYWORDS)
         
         # Operatörler
-        self.operators = {
-            '+', '-', '*', '/', '%', '=', '==', '!=', '<', '>', '<=', '>=',
-            '&&', '||', '!', '&', '|', '^', '~', '<<', '>>', '++', '--',
-            '+=', '-=', '*=', '/=', '%=', '&=', '|=', '^=', '<<=', '>>='
-        }
+        self.operators = set(OPERATORS)
         
         # Ayırıcılar
-        self.separators = {'(', ')', '{', '}', '[', ']', ';', ',', '.', ':', '?'}
+        self.separators = set(SEPARATORS)
         
         self.reset()
     
+    def apply_pending_shift(self):
+        """Ertelenmiş kuyruk kaydırmasını uygula (yoksa bir şey yapmaz)
+
+        Son analizin token'ları kullanılmadan (ya da sonuç atılırken) token'ları
+        okuyan thread'de çağrılmalıdır; sonraki analiz kaydırılmış token'larla başlar.
+        """
+        shift, self.pending_shift = self.pending_shift, None
+        if shift is not None:
+            shift.apply()
+
     def reset(self):
         """Analyzer'ı sıfırla"""
         self.input_text = ""
@@ -48,14 +177,47 @@ class LexicalAnalyzer:
         self.current_char = None
         self.state = LexicalState.START
         self.tokens = []
+        self.line_checkpoints = []  # Her satır başı için LineCheckpoint
+        self.last_splice = None  # Son artımlı analizin TokenSplice kaydı
+        self.pending_shift = None  # Tam analiz eski listeyi kullanmaz; bekleyen kaydırma atılır
+        self._brackets = None  # Son token listesinin BracketIndex'i (tembel)
     
     def analyze(self, text: str) -> List[Token]:
-        """Metni analiz et ve token listesi döndür"""
+        """Metni analiz et ve token listesi döndür (önbellek varsa önce ona bakılır)"""
+        if self.restore_cached(text):
+            return self.tokens
+        self.reset()
+        self.input_text = text
+        if self.engine == self.ENGINE_REGEX:
+            self.analyze_regex(text)
+        else:
+            self.analyze_states(text)
+        if self.cache is not None:
+            snapshot = LexSnapshot(text, self.tokens, self.line_checkpoints)
+            self.cache.put(self.cache_namespace, text, snapshot, snapshot.size)
+        return self.tokens
+    
+    def restore_cached(self, text: str) -> bool:
+        """Metnin önbellekteki analizini geri yükle; yoksa False"""
+        if self.cache is None:
+            return False
+        snapshot = self.cache.get(self.cache_namespace, text)
+        if snapshot is None:
+            return False
         self.reset()
         self.input_text = text
+        self.tokens = snapshot.tokens()
+        self.line_checkpoints = snapshot.line_checkpoints()
+        eof = self.tokens[-1]
+        self.position, self.line, self.column = eof.position, eof.line, eof.column
+        return True
+    
+    def analyze_states(self, text: str) -> List[Token]:
+        """Metni karakter karakter ilerleyen durum makinesiyle tara"""
         self.position = 0
         self.line = 1
         self.column = 1
+        self.line_checkpoints.append(LineCheckpoint(0, 1, 1, LexicalState.START, 0))
         
         if len(text) > 0:
             self.current_char = text[0]
@@ -67,6 +229,262 @@ class LexicalAnalyzer:
         self.tokens.append(Token(TokenType.EOF, "", self.line, self.column, self.position))
         return self.tokens
     
+    def bracket_index(self) -> BracketIndex:
+        """Son analizin parantez eşleşme tablosu (token listesi değişene kadar önbellekte)"""
+        if self._brackets is None or self._brackets.tokens is not self.tokens:
+            self._brackets = BracketIndex(self.tokens)
+        return self._brackets
+    
+    def master_pattern(self, unicode: bool = False, binary: bool = False) -> MasterPattern:
+        """Operatör/ayırıcı kümelerinden derlenen ana regex'i döndür"""
+        key = (unicode, binary)
+        pattern = self._master_patterns.get(key)
+        if pattern is None:
+            pattern = MasterPattern(self.operators, self.separators, unicode, binary)
+            self._master_patterns[key] = pattern
+        return pattern
+    
+    def analyze_regex(self, text: str) -> List[Token]:
+        """Metni tek bir ana regex ile tara (durum makinesiyle aynı token'ları üretir)"""
+        checkpoints = self.line_checkpoints
+        checkpoints.append(LineCheckpoint(0, 1, 1, LexicalState.START, 0))
+        
+        def on_line_start(position, line, group, token_index):
+            checkpoints.append(LineCheckpoint(position, line, 1, MULTILINE_GROUP_STATES[group], token_index))
+        
+        scanner = RegexScanner(self.keywords, on_line_start)
+        self.tokens.extend(scanner.scan(self.master_pattern(unicode=not text.isascii()), text))
+        
+        self.position = len(text)
+        self.line = scanner.line
+        self.column = len(text) - scanner.line_start + 1
+        
+        # EOF token ekle
+        self.tokens.append(Token(TokenType.EOF, "", self.line, self.column, self.position))
+        return self.tokens
+    
+    def analyze_to_buffer(self, text: str) -> TokenBuffer:
+        """Metni regex motoruyla tarayıp sonucu kompakt TokenBuffer olarak döndür
+        
+        Token nesneleri oluşturulmaz; içerikler gerektiğinde kaynaktan dilimlenir.
+        Artımlı analiz için satır checkpoint'leri tutulmaz.
+        """
+        self.reset()
+        self.input_text = text
+        buffer = TokenBuffer(text)
+        scanner = RegexScanner(self.keywords)
+        scanner.fill(self.master_pattern(unicode=not text.isascii()), text, buffer)
+        
+        self.position = len(text)
+        self.line = scanner.line
+        self.column = len(text) - scanner.line_start + 1
+        buffer.append(TOKEN_TYPE_CODES[TokenType.EOF], self.position, self.position, self.line, self.column)
+        return buffer
+    
+    def analyze_file(self, path: str, encoding: str = 'utf-8') -> TokenBuffer:
+        """Dosyayı belleğe eşleyerek (mmap) Python string'ine okumadan tara
+        
+        Token içerikleri eşlemedeki pozisyonlardır ve yalnızca erişildiğinde
+        çözülür; pozisyon ve sütunlar bayt cinsindendir. ASCII olmayan dosyalar
+        çözülüp str deseniyle taranır (bkz. analyze_bytes).
+        """
+        return self.analyze_bytes(map_file(path), encoding)
+    
+    def analyze_bytes(self, source, encoding: str = 'utf-8') -> TokenBuffer:
+        """bytes/mmap kaynağını bayt desenli ana regex ile TokenBuffer'a tara
+        
+        Bayt desenindeki karakter sınıfları ASCII'dir: 'ç' gibi bir tanımlayıcı
+        her UTF-8 baytı için bir ERROR token'ı olurdu. ASCII olmayan bayt içeren
+        kaynaklar bu yüzden çözülüp GUI'nin kullandığı str deseniyle taranır
+        (token'lar aynıdır; pozisyon ve sütunlar karakter cinsindendir).
+        """
+        if NON_ASCII_BYTE.search(source):
+            return self.analyze_to_buffer(str(source, encoding, errors='replace'))
+        self.reset()
+        buffer = TokenBuffer(source, encoding)
+        keywords = {keyword.encode('ascii') for keyword in self.keywords}
+        scanner = RegexScanner(keywords)
+        scanner.fill(self.master_pattern(binary=True), source, buffer)
+        
+        self.position = len(source)
+        self.line = scanner.line
+        self.column = len(source) - scanner.line_start + 1
+        buffer.append(TOKEN_TYPE_CODES[TokenType.EOF], self.position, self.position, self.line, self.column)
+        return buffer
+    
+    def iter_tokens(self, stream: TextIO, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Token]:
+        """Metin akışını parça parça okuyarak token'ları üret
+        
+        Yorumlar, string'ler ve iki karakterli operatörler parça sınırlarında
+        bölünebilir; sona değen eşleşme bir sonraki parça gelene kadar bekletilir.
+        Bellek kullanımı parça boyutu ve en uzun token ile sınırlıdır.
+        """
+        scanner = RegexScanner(self.keywords)
+        buffer = ""
+        base = 0  # buffer[0]'ın akıştaki pozisyonu
+        unicode = False
+        
+        while True:
+            chunk = stream.read(chunk_size)
+            final = not chunk
+            if chunk:
+                unicode = unicode or not chunk.isascii()
+                buffer = buffer + chunk if buffer else chunk
+            
+            yield from scanner.scan(self.master_pattern(unicode), buffer, base, final)
+            
+            if final:
+                break
+            buffer = buffer[scanner.consumed:]
+            base += scanner.consumed
+        
+        position = base + len(buffer)
+        yield Token(TokenType.EOF, "", scanner.line, position - scanner.line_start + 1, position)
+    
+    def analyze_incremental(self, text: str, edit_start: Optional[int] = None,
+                            old_end: Optional[int] = None, new_end: Optional[int] = None) -> List[Token]:
+        """Metni yalnızca değişiklik noktasından itibaren yeniden analiz et
+        
+        Düzenleme aralığı verilmezse önceki metinle karşılaştırılarak bulunur.
+        Analiz, düzenlemeden önceki son güvenli satır başından başlar ve yeni
+        token akışı eskisiyle yeniden hizalandığında durur; kalan eski token'lar
+        kaydırılarak listeye eklenir.
+        """
+        self.apply_pending_shift()  # Normalde token'ları okuyan thread'de uygulanmıştır
+        old_text = self.input_text
+        if not self.tokens or not self.line_checkpoints:
+            return self.analyze(text)
+        
+        if edit_start is None:
+            edit_start, old_end, new_end = self.find_edit_range(old_text, text)
+        if edit_start == old_end == new_end:
+            self.input_text = text
+            self.last_splice = TokenSplice(len(self.tokens) - 1, [], 0, self.tokens,
+                                           edit_start, self.line, self.column, 0)
+            return self.tokens
+        if edit_start == 0 and old_end == len(old_text):
+            return self.analyze(text)  # Metnin tamamı değişti (temizle-yapıştır, dosya değişimi)
+        if self.restore_cached(text):
+            return self.tokens  # Daha önce analiz edilmiş metin (geri al/yinele)
+        
+        delta = new_end - old_end
+        previous_tokens = self.tokens
+        old_tokens = self.tokens[:-1]  # EOF hariç
+        old_checkpoints = self.line_checkpoints
+        
+        # Düzenlemeden önceki son güvenli satır başını bul
+        cp_index = bisect_right(old_checkpoints, edit_start, key=lambda c: c.position) - 1
+        while cp_index > 0 and not old_checkpoints[cp_index].is_safe:
+            cp_index -= 1
+        checkpoint = old_checkpoints[cp_index]
+        start_index = checkpoint.token_index
+        
+        # Lexer durumunu checkpoint'e geri sar
+        self.input_text = text
+        self.position = checkpoint.position
+        self.line = checkpoint.line
+        self.column = checkpoint.column
+        self.state = LexicalState.START
+        self.current_char = text[self.position] if self.position < len(text) else None
+        self.tokens = old_tokens[:start_index]
+        self.line_checkpoints = old_checkpoints[:cp_index + 1]
+        
+        # Düzenlemeden sonra eski token'larla hizalanana kadar yeniden analiz et
+        tail_start = bisect_left(old_tokens, old_end, key=lambda t: t.position)
+        sync_index = None
+        while self.position < len(text):
+            if (self.state == LexicalState.START and self.position >= new_end and
+                    not self.current_char.isspace()):
+                old_pos = self.position - delta
+                j = bisect_left(old_tokens, old_pos, lo=tail_start, key=lambda t: t.position)
+                if j < len(old_tokens) and old_tokens[j].position == old_pos:
+                    sync_index = j
+                    break
+                tail_start = j
+            self.process_current_state()
+        
+        inserted_count = len(self.tokens) - start_index
+        line_delta = None
+        if sync_index is None:
+            removed = old_tokens[start_index:]
+        else:
+            removed = old_tokens[start_index:sync_index]
+            line_delta = self.splice_tail(old_tokens, sync_index, old_checkpoints, delta)
+        
+        # Düzenleme başlangıcının satır/sütunu (öncesi eski ve yeni metinde aynıdır)
+        edit_line = checkpoint.line + text.count('\n', checkpoint.position, edit_start)
+        edit_column = edit_start - (text.rfind('\n', 0, edit_start) + 1) + 1
+        self.last_splice = TokenSplice(start_index, removed, inserted_count, previous_tokens,
+                                       edit_start, edit_line, edit_column, line_delta)
+        
+        # EOF token ekle
+        self.tokens.append(Token(TokenType.EOF, "", self.line, self.column, self.position))
+        return self.tokens
+    
+    def splice_tail(self, old_tokens: List[Token], sync_index: int,
+                    old_checkpoints: List[LineCheckpoint], delta: int) -> int:
+        """Değişmeyen eski token'ları kaydırarak yeni listeye ekle, satır farkını döndür"""
+        sync_token = old_tokens[sync_index]
+        sync_line = sync_token.line
+        line_delta = self.line - sync_line
+        column_delta = self.column - sync_token.column
+        index_delta = len(self.tokens) - sync_index
+        old_sync_pos = sync_token.position  # Kaydırma ertelenebilir: eski konum şimdi okunur
+        
+        tail = old_tokens[sync_index:]
+        if delta or line_delta or column_delta:
+            shift = TailShift(tail, sync_line, delta, line_delta, column_delta)
+            if self.defer_shift:
+                self.pending_shift = shift
+            else:
+                shift.apply()
+        
+        # Senkronizasyon noktasından sonraki satır başları
+        cp_start = bisect_right(old_checkpoints, old_sync_pos, key=lambda c: c.position)
+        for checkpoint in old_checkpoints[cp_start:]:
+            checkpoint.position += delta
+            checkpoint.line += line_delta
+            checkpoint.token_index += index_delta
+            self.line_checkpoints.append(checkpoint)
+        
+        self.tokens.extend(tail)
+        
+        # Lexer konumunu metin sonuna taşı
+        self.position = len(self.input_text)
+        self.current_char = None
+        if tail:
+            last = self.line_checkpoints[-1]
+            self.line = last.line
+            self.column = self.position - last.position + 1
+        return line_delta
+    
+    @staticmethod
+    def find_edit_range(old_text: str, new_text: str):
+        """İki metin arasındaki değişen aralığı (start, old_end, new_end) olarak bul"""
+        limit = min(len(old_text), len(new_text))
+        
+        # Ortak önek (ikili arama ile, karşılaştırmalar C seviyesinde yapılır)
+        low, high = 0, limit
+        while low < high:
+            mid = (low + high + 1) // 2
+            if old_text[:mid] == new_text[:mid]:
+                low = mid
+            else:
+                high = mid - 1
+        prefix = low
+        
+        # Ortak sonek (önekle çakışmayacak şekilde)
+        low, high = 0, limit - prefix
+        while low < high:
+            mid = (low + high + 1) // 2
+            if old_text[len(old_text) - mid:] == new_text[len(new_text) - mid:]:
+                low = mid
+            else:
+                high = mid - 1
+        suffix = low
+        
+        return prefix, len(old_text) - suffix, len(new_text) - suffix
+    
     def process_current_state(self):
         """Mevcut duruma göre işlem yap"""
         if self.state == LexicalState.START:
@@ -271,8 +689,9 @@ class LexicalAnalyzer:
         start_col = self.column
         
         # İki karakterli operatörleri kontrol et
-        two_char = self.current_char + (self.peek() or '')
-        if two_char in self.operators:
+        next_char = self.peek()
+        two_char = self.current_char + (next_char or '')
+        if next_char and two_char in self.operators:
             self.tokens.append(Token(TokenType.OPERATOR, two_char, start_line, start_col, start_pos))
             self.advance()
             self.advance()
@@ -288,7 +707,8 @@ class LexicalAnalyzer:
     
     def advance(self):
         """Bir sonraki karaktere geç"""
-        if self.current_char == '\n':
+        new_line = self.current_char == '\n'
+        if new_line:
             self.line += 1
             self.column = 1
         else:
@@ -299,6 +719,10 @@ class LexicalAnalyzer:
             self.current_char = self.input_text[self.position]
         else:
             self.current_char = None
+        
+        if new_line:
+            self.line_checkpoints.append(
+                LineCheckpoint(self.position, self.line, 1, self.state, len(self.tokens)))
     
     def peek(self) -> Optional[str]:
         """Bir sonraki karakteri döndür (position'ı değiştirmeden)"""
@@ -0,0 +1,211 @@
+import re
+from functools import lru_cache
+from typing import Callable, Iterator, Optional
+from models.token import Token, TokenType, TOKEN_TYPE_CODES, SPELLING_KINDS
+
+# Grup adı -> üretilecek token türü
+GROUP_TOKEN_TYPES = {
+    'IDENTIFIER': TokenType.IDENTIFIER,
+    'NUMBER': TokenType.NUMBER,
+    'STRING': TokenType.STRING,
+    'STRING_ERROR': TokenType.ERROR,
+    'CHAR': TokenType.CHAR,
+    'CHAR_ERROR': TokenType.ERROR,
+    'COMMENT_SINGLE': TokenType.COMMENT,
+    'COMMENT_MULTI': TokenType.COMMENT,
+    'PREPROCESSOR': TokenType.PREPROCESSOR,
+    'SEPARATOR': TokenType.SEPARATOR,
+    'OPERATOR': TokenType.OPERATOR,
+    'ERROR': TokenType.ERROR,
+}
+
+# Grup adı -> TokenBuffer tür kodu
+GROUP_TYPE_CODES = {group: TOKEN_TYPE_CODES[token_type] for group, token_type in GROUP_TOKEN_TYPES.items()}
+
+# İçeriğine göre ayrı token kodu alan gruplar (anahtar kelime, operatör, ayırıcı)
+SPELLED_GROUPS = frozenset({'IDENTIFIER', 'OPERATOR', 'SEPARATOR'})
+
+# Birden fazla satıra yayılabilen gruplar
+MULTILINE_GROUPS = frozenset({
+    'WHITESPACE', 'STRING', 'STRING_ERROR', 'CHAR', 'CHAR_ERROR', 'COMMENT_MULTI'
+})
+
+def _char_ranges(predicate) -> str:
+    """Koşulu sağlayan tüm Unicode karakterleri için regex karakter sınıfı içeriği"""
+    parts = []
+    start = None
+    for code in range(0x110001):
+        matches = code < 0x110000 and predicate(chr(code))
+        if matches and start is None:
+            start = code
+        elif not matches and start is not None:
+            end = code - 1
+            if start == end:
+                parts.append(re.escape(chr(start)))
+            else:
+                parts.append(f"{re.escape(chr(start))}-{re.escape(chr(end))}")
+            start = None
+    return ''.join(parts)
+
+@lru_cache(maxsize=None)
+def unicode_classes():
+    """str.isalpha()/str.isdigit() ile birebir uyumlu karakter sınıfları (ilk kullanımda hesaplanır)"""
+    numeric = _char_ranges(lambda c: c.isnumeric() and not c.isalpha())
+    digits = _char_ranges(lambda c: c.isdigit())
+    # Tanımlayıcı başlangıcı: harf veya '_' (\\w içinden sayısal olanlar çıkarılır)
+    return f"[^\\W{numeric}]", f"[{digits}]"
+
+class MasterPattern:
+    """Tüm token türlerini tek bir alternation regex'inde birleştiren derlenmiş desen"""
+
+    def __init__(self, operators, separators, unicode: bool = False, binary: bool = False):
+        # binary: bytes/mmap üzerinde çalışan desen (karakter sınıfları ASCII'dir)
+        if unicode and not binary:
+            ident_start, digit = unicode_classes()
+        else:
+            ident_start, digit = r"[A-Za-z_]", r"[0-9]"
+        # bytes desenlerinde \s, str.isspace()'in boşluk saydığı \x1c-\x1f'i kapsamaz
+        whitespace = r"[\t\n\x0b\x0c\r\x1c-\x1f ]" if binary else r"\s"
+
+        # İki karakterli operatörler tek karakterlilerden önce denenir
+        two_char = sorted(op for op in operators if len(op) == 2)
+        single = sorted({op for op in operators if len(op) == 1} | set("+-*/%=<>!&|^~"))
+        operator = '|'.join(re.escape(op) for op in two_char) + '|[' + ''.join(re.escape(op) for op in single) + ']'
+        separator = '[' + ''.join(re.escape(sep) for sep in sorted(separators)) + ']'
+
+        # Sıralama, durum diyagramındaki START geçişleriyle aynıdır
+        source = '|'.join([
+            rf"(?P<WHITESPACE>{whitespace}+)",
+            rf"(?P<IDENTIFIER>{ident_start}\w*)",
+            rf"(?P<NUMBER>{digit}+(?:\.{digit}*)?)",
+            r'(?P<STRING>"(?:[^"\\]|\\.)*")',
+            r'(?P<STRING_ERROR>"(?:[^"\\]|\\.)*\\?\Z)',
+            r"(?P<CHAR>'(?:\\.|[^'\\]){0,2}')",
+            r"(?P<CHAR_ERROR>'(?:\\.|[^'\\]|\\\Z){0,2})",
+            r"(?P<COMMENT_SINGLE>//[^\n]*)",
+            r"(?P<COMMENT_MULTI>/\*.*?(?:\*/|\Z))",
+            r"(?P<PREPROCESSOR>#[^\n]*)",
+            rf"(?P<SEPARATOR>{separator})",
+            rf"(?P<OPERATOR>{operator})",
+            r"(?P<ERROR>.)",
+        ])
+        self.regex = re.compile(source.encode('ascii') if binary else source, re.DOTALL)
+
+class RegexScanner:
+    """Ana regex ile metni parça parça tarayan, satır/sütun durumunu parçalar arasında taşıyan tarayıcı"""
+
+    def __init__(self, keywords, on_line_start: Optional[Callable] = None):
+        self.keywords = keywords
+        self.on_line_start = on_line_start  # (pozisyon, satır, grup, token indeksi) ile çağrılır
+        self.line = 1
+        self.line_start = 0  # Mevcut satırın başlangıç pozisyonu
+        self.token_count = 0
+        self.consumed = 0  # Son taramada tüketilen karakter sayısı
+
+    def scan(self, pattern: MasterPattern, buffer: str, base: int = 0, final: bool = True) -> Iterator[Token]:
+        """buffer'daki token'ları üret
+
+        base, buffer'ın ilk karakterinin akıştaki pozisyonudur. final değilse
+        buffer sonuna değen eşleşme (devamı sonraki parçada olabilir) üretilmez;
+        tüketilen kısım consumed ile bildirilir.
+        """
+        keywords = self.keywords
+        keyword_code = TOKEN_TYPE_CODES[TokenType.KEYWORD]
+        identifier_code = TOKEN_TYPE_CODES[TokenType.IDENTIFIER]
+        on_line_start = self.on_line_start
+        find = buffer.find
+        limit = len(buffer)
+        line = self.line
+        line_start = self.line_start
+        token_count = self.token_count
+        consumed = 0
+
+        try:
+            for match in pattern.regex.finditer(buffer):
+                kind = match.lastgroup
+                start, end = match.span()
+                if end == limit and not final:
+                    break
+
+                if kind != 'WHITESPACE':
+                    value = match.group()
+                    if kind == 'IDENTIFIER':
+                        if value in keywords:
+                            token_type = TokenType.KEYWORD
+                            code = SPELLING_KINDS.get(value, keyword_code)
+                        else:
+                            token_type = TokenType.IDENTIFIER
+                            code = identifier_code
+                    else:
+                        token_type = GROUP_TOKEN_TYPES[kind]
+                        code = GROUP_TYPE_CODES[kind]
+                        if kind in SPELLED_GROUPS:
+                            code = SPELLING_KINDS.get(value, code)
+                    token_count += 1
+                    yield Token(token_type, value, line, base + start - line_start + 1, base + start, code)
+
+                # Token veya boşluk içindeki satır sonları
+                if kind in MULTILINE_GROUPS:
+                    newline = find('\n', start, end)
+                    if newline >= 0:
+                        token_index = token_count if kind == 'WHITESPACE' else token_count - 1
+                        while newline >= 0:
+                            line += 1
+                            line_start = base + newline + 1
+                            if on_line_start:
+                                on_line_start(line_start, line, kind, token_index)
+                            newline = find('\n', newline + 1, end)
+                consumed = end
+        finally:
+            self.line = line
+            self.line_start = line_start
+            self.token_count = token_count
+            self.consumed = consumed
+
+    def fill(self, pattern: MasterPattern, text, buffer) -> None:
+        """Metnin tamamını tarayıp token'ları Token nesnesi oluşturmadan TokenBuffer'a yaz"""
+        keywords = self.keywords
+        find = text.find
+        add_kind, add_start, add_end = buffer.kinds.append, buffer.starts.append, buffer.ends.append
+        add_line, add_column = buffer.lines.append, buffer.columns.append
+        keyword_code = TOKEN_TYPE_CODES[TokenType.KEYWORD]
+        identifier_code = TOKEN_TYPE_CODES[TokenType.IDENTIFIER]
+        if isinstance(text, str):
+            spelling_kinds = SPELLING_KINDS
+        else:
+            spelling_kinds = {spelling.encode('ascii'): code for spelling, code in SPELLING_KINDS.items()}
+        newline_char = '\n' if isinstance(text, str) else b'\n'
+        line = self.line
+        line_start = self.line_start
+
+        for match in pattern.regex.finditer(text):
+            kind = match.lastgroup
+            start, end = match.span()
+
+            if kind != 'WHITESPACE':
+                if kind in SPELLED_GROUPS:
+                    value = match.group()
+                    if kind != 'IDENTIFIER':
+                        code = spelling_kinds.get(value, GROUP_TYPE_CODES[kind])
+                    elif value in keywords:
+                        code = spelling_kinds.get(value, keyword_code)
+                    else:
+                        code = identifier_code
+                else:
+                    code = GROUP_TYPE_CODES[kind]
+                add_kind(code)
+                add_start(start)
+                add_end(end)
+                add_line(line)
+                add_column(start - line_start + 1)
+
+            if kind in MULTILINE_GROUPS:
+                newline = find(newline_char, start, end)
+                while newline >= 0:
+                    line += 1
+                    line_start = newline + 1
+                    newline = find(newline_char, line_start, end)
+
+        self.line = line
+        self.line_start = line_start
+        self.token_count += len(buffer)
@@ -0,0 +1,103 @@
+import json
+import os
+import subprocess
+import sys
+from lsp.protocol import read_message, write_message
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+class LanguageClient:
+    """Dil sunucusunu alt süreçte başlatan betiklenebilir istemci
+
+    request() yanıt gelene kadar bekler; arada gelen bildirimler
+    notifications listesine eklenir. on_message verilirse gelen her mesaj
+    (yanıt ya da bildirim) geliş sırasıyla ona da verilir.
+    """
+
+    def __init__(self, command=None, on_message=None):
+        self.command = command or [sys.executable, os.path.join(ROOT, 'main.py'), 'lsp']
+        self.on_message = on_message
+        self.process = subprocess.Popen(self.command, stdin=subprocess.PIPE, stdout=subprocess.PIPE, cwd=ROOT)
+        self.next_id = 0
+        self.notifications = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def send(self, message: dict):
+        write_message(self.process.stdin, message)
+
+    def notify(self, method: str, params: dict = None):
+        self.send({'jsonrpc': '2.0', 'method': method, 'params': params or {}})
+
+    def request(self, method: str, params: dict = None, request_id=None) -> dict:
+        """İsteği gönder ve yanıt mesajını döndür (hata yanıtları da döner)"""
+        if request_id is None:
+            self.next_id += 1
+            request_id = self.next_id
+        elif isinstance(request_id, int):
+            self.next_id = max(self.next_id, request_id)  # Betikteki kimliklerle çakışmasın
+        self.send({'jsonrpc': '2.0', 'id': request_id, 'method': method, 'params': params or {}})
+        while True:
+            message = self.receive()
+            if message is None:
+                raise ConnectionError("Sunucu yanıt vermeden kapandı")
+            if message.get('id') == request_id and 'method' not in message:
+                return message
+
+    def receive(self):
+        message = read_message(self.process.stdout)
+        if message is not None:
+            if 'method' in message:
+                self.notifications.append(message)
+            if self.on_message is not None:
+                self.on_message(message)
+        return message
+
+    def close(self) -> int:
+        """shutdown/exit gönder, kalan mesajları oku ve sunucunun çıkış kodunu döndür"""
+        if self.process.poll() is None and not self.process.stdin.closed:
+            try:
+                self.request('shutdown')
+                self.notify('exit')
+                self.process.stdin.close()
+                while self.receive() is not None:
+                    pass
+            except (BrokenPipeError, ConnectionError):
+                pass
+        return self.process.wait()
+
+def replay(path: str, output) -> int:
+    """JSON Lines betiğindeki mesajları sunucuya gönder, gelen tüm mesajları JSON Lines olarak yaz
+
+    Betikte her satır {"method": ..., "params": ...} biçimindedir; "id"
+    alanı olanlar istektir ve yanıtı beklenir, olmayanlar bildirimdir. Boş
+    ve # ile başlayan satırlar atlanır. Betik shutdown/exit içermiyorsa
+    sonunda gönderilir.
+    """
+    def write(message):
+        output.write(json.dumps(message, ensure_ascii=False) + '\n')
+
+    with open(path, encoding='utf-8') as script:
+        lines = [line for line in script if line.strip() and not line.lstrip().startswith('#')]
+
+    client = LanguageClient(on_message=write)
+    try:
+        for line in lines:
+            message = json.loads(line)
+            if message.get('method') == 'exit':
+                client.notify('exit')
+                client.process.stdin.close()
+                while client.receive() is not None:
+                    pass
+                break
+            if 'id' in message:
+                client.request(message['method'], message.get('params'), message['id'])
+            else:
+                client.notify(message['method'], message.get('params'))
+    finally:
+        code = client.close()
+    return code
@@ -0,0 +1,347 @@
+from array import array
+from bisect import bisect_right
+from operator import is_
+from typing import List, Optional
+from lexer.lexical_analyzer import LexicalAnalyzer
+from models.token import Token, TokenType
+from parser.incremental_parser import IncrementalParser
+
+# Semantik token türleri (LSP standart adları); listedeki sıra türün kodudur
+SEMANTIC_TOKEN_TYPES = ['keyword', 'variable', 'number', 'string', 'operator', 'comment', 'macro']
+TOKEN_TYPE_LEGEND = {
+    TokenType.KEYWORD: 0,
+    TokenType.IDENTIFIER: 1,
+    TokenType.NUMBER: 2,
+    TokenType.STRING: 3,
+    TokenType.CHAR: 3,
+    TokenType.OPERATOR: 4,
+    TokenType.COMMENT: 5,
+    TokenType.PREPROCESSOR: 6,
+}  # Ayırıcılar, hatalar ve EOF için semantik token üretilmez
+FIELDS = 5  # Semantik token başına tamsayı: satır farkı, başlangıç farkı, uzunluk, tür, niteleyiciler
+DIAGNOSTIC_SOURCE = 'c-highlighter'
+LEXICAL_ERROR = 'lexical-error'
+ERROR_SEVERITY = 1
+
+def has_astral(text: str) -> bool:
+    """Metinde UTF-16'da iki birim tutan (BMP dışı) karakter var mı"""
+    return bool(text) and max(text) > '\uffff'
+
+def utf16_length(text: str) -> int:
+    return len(text) + sum(1 for char in text if char > '\uffff')
+
+class SemanticTokens:
+    """Belgenin LSP semantik token dizisi, lexer'ın değişiklik kayıtlarıyla güncellenir
+
+    data, LSP'nin göreli kodlamasıyla (her token bir öncekine göre) düz bir
+    tamsayı dizisidir; offsets her lexer token'ının data'daki ilk kaydının
+    sırasıdır. Düzenlemede yalnızca değişen token'lar ile kaydırılan ilk
+    token yeniden kodlanır, geri kalan kayıtlar göreli oldukları için aynen
+    kalır. Son yayımlanan sonuçtan bu yana değişmeyen önek ve sonek uzunluğu
+    tutulur; delta isteği tek bir düzenleme olarak yanıtlanır.
+    """
+
+    def __init__(self, document: 'Document'):
+        self.document = document
+        self.data = array('I')
+        self.offsets = array('I', [0])  # Token indeksi -> ilk kaydın sırası (len(tokens) + 1 eleman)
+        self.result_id = None  # Son yayımlanan sonucun kimliği
+        self.result_length = 0  # ... ve data uzunluğu
+        self.next_id = 0
+        self.prefix = 0  # Son sonuçtan beri değişmeyen baştaki tamsayı sayısı
+        self.suffix = 0  # ... sondaki
+
+    def entries(self, token: Token):
+        """Token'ın mutlak (satır, karakter, uzunluk) kayıtları (çok satırlı token satır başına bölünür)"""
+        kind = TOKEN_TYPE_LEGEND.get(token.type)
+        if kind is None:
+            return []
+        document = self.document
+        length = document.length
+        value = token.value
+        line = token.line - 1
+        character = document.character(line, token.position)
+        if '\n' not in value:
+            return [(line, character, length(value), kind)]
+        entries = []
+        for offset, segment in enumerate(value.split('\n')):
+            if segment.endswith('\r'):
+                segment = segment[:-1]
+            if segment:
+                entries.append((line + offset, character if offset == 0 else 0, length(segment), kind))
+        return entries
+
+    def encode(self, tokens, data: array, offsets: array, base: int, previous: tuple) -> tuple:
+        """Token'ları data'ya göreli olarak ekle; offsets'e kayıt sıralarını yaz, son kaydın konumunu döndür"""
+        previous_line, previous_character = previous
+        for token in tokens:
+            offsets.append(base + len(data) // FIELDS)
+            for line, character, length, kind in self.entries(token):
+                if line == previous_line:
+                    data.extend((0, character - previous_character, length, kind, 0))
+                else:
+                    data.extend((line - previous_line, character, length, kind, 0))
+                previous_line, previous_character = line, character
+        return previous_line, previous_character
+
+    def rebuild(self, tokens: List[Token]):
+        """Tüm token'ları yeniden kodla"""
+        data = array('I')
+        offsets = array('I')
+        self.encode(tokens, data, offsets, 0, (0, 0))
+        offsets.append(len(data) // FIELDS)
+        self.data, self.offsets = data, offsets
+        self.prefix = self.suffix = 0
+
+    def previous_entry(self, tokens: List[Token], index: int) -> tuple:
+        """index'ten önceki son kaydın mutlak konumu (yoksa (0, 0))"""
+        offsets = self.offsets
+        while index > 0 and offsets[index] == offsets[index - 1]:
+            index -= 1
+        if index == 0:
+            return 0, 0
+        line, character, _, _ = self.entries(tokens[index - 1])[-1]
+        return line, character
+
+    def update(self, tokens: List[Token], splice):
+        """Lexer'ın TokenSplice kaydına göre güncelle"""
+        start = splice.start_index
+        old_tail = start + len(splice.removed)  # Kaydırılan ilk token'ın eski indeksi
+        new_tail = start + splice.inserted_count  # ... ve yeni indeksi
+        old_data, old_offsets = self.data, self.offsets
+        base = old_offsets[start]
+
+        # Eklenen token'lar ve kaydırılanlardan ilk kayıt üretene kadarki kısım yeniden kodlanır
+        # (ondan sonraki kayıtlar göreli olduğu için aynıdır)
+        middle, middle_offsets = array('I'), array('I')
+        previous = self.encode(tokens[start:new_tail], middle, middle_offsets, base,
+                               self.previous_entry(tokens, start))
+        last = len(tokens) - 1  # EOF
+        while new_tail < last:
+            before = len(middle)
+            previous = self.encode((tokens[new_tail],), middle, middle_offsets, base, previous)
+            new_tail += 1
+            old_tail += 1
+            if len(middle) > before:
+                break
+
+        kept = old_offsets[old_tail]  # Aynen kalan ilk eski kayıt
+        shift = base + len(middle) // FIELDS - kept
+        self.data = old_data[:base * FIELDS] + middle + old_data[kept * FIELDS:]
+        tail_offsets = old_offsets[old_tail:]
+        if shift:
+            tail_offsets = array('I', [offset + shift for offset in tail_offsets])
+        self.offsets = old_offsets[:start] + middle_offsets + tail_offsets
+
+        self.prefix = min(self.prefix, base * FIELDS)
+        self.suffix = min(self.suffix, len(old_data) - kept * FIELDS)
+
+    def full(self) -> dict:
+        """semanticTokens/full yanıtı; sonuç yeni temel olur"""
+        return {'resultId': self.publish(), 'data': self.data.tolist()}
+
+    def delta(self, previous_result_id: str) -> dict:
+        """semanticTokens/full/delta yanıtı (önceki sonuç bilinmiyorsa tam sonuç)"""
+        if previous_result_id is None or previous_result_id != self.result_id:
+            return self.full()
+        edits = []
+        length = len(self.data)
+        if self.prefix + self.suffix < max(length, self.result_length):
+            edits.append({'start': self.prefix,
+                          'deleteCount': self.result_length - self.prefix - self.suffix,
+                          'data': self.data[self.prefix:length - self.suffix].tolist()})
+        return {'resultId': self.publish(), 'edits': edits}
+
+    def publish(self) -> str:
+        self.next_id += 1
+        self.result_id = str(self.next_id)
+        self.result_length = len(self.data)
+        self.prefix = self.suffix = len(self.data)  # Değişiklik olana kadar tamamı aynı
+        return self.result_id
+
+class Document:
+    """Açık bir metin belgesinin durumu: metin, satır başları, lexer, parser ve semantik token'lar
+
+    Düzenlemeler aralıklarıyla artımlı lexer'a verilir; parser değişmeyen üst
+    düzey öğeleri yeniden kullanır. Böylece istekler belgenin tamamını
+    baştan analiz etmez. LSP konumları (satır, karakter) 0 tabanlıdır;
+    utf16 True ise karakter UTF-16 birimidir.
+    """
+
+    def __init__(self, uri: str, text: str, version: int = 0, utf16: bool = True):
+        self.uri = uri
+        self.version = version
+        self.utf16 = utf16
+        self.lexer = LexicalAnalyzer(LexicalAnalyzer.ENGINE_REGEX)
+        self.parser = IncrementalParser()
+        self.semantic_tokens = SemanticTokens(self)
+        self.parsed_tokens = None  # Parse edilen token listesi (parse tembel yapılır)
+        self.lexical_errors = []  # ERROR token'ları kaynak sırasıyla (lexer'ın splice'ıyla güncellenir)
+        self.published_diagnostics = None  # Son gönderilen tanılar
+        self.set_text(text)
+
+    @property
+    def tokens(self) -> List[Token]:
+        return self.lexer.tokens
+
+    def set_text(self, text: str):
+        """Metnin tamamını değiştir ve yeniden analiz et"""
+        self.text = text
+        self.astral = has_astral(text)
+        self.line_starts = [0]
+        index = text.find('\n')
+        while index >= 0:
+            self.line_starts.append(index + 1)
+            index = text.find('\n', index + 1)
+        self.lexer.analyze(text)
+        self.semantic_tokens.rebuild(self.tokens)
+        self.lexical_errors = [token for token in self.tokens if token.type == TokenType.ERROR]
+        self.splice = None
+
+    def apply_changes(self, changes: List[dict], version: Optional[int] = None):
+        """textDocument/didChange içerik değişikliklerini sırayla uygula"""
+        for change in changes:
+            if 'range' not in change:
+                self.set_text(change['text'])
+            else:
+                self.replace(self.offset(change['range']['start']), self.offset(change['range']['end']),
+                             change['text'])
+        if version is not None:
+            self.version = version
+
+    def replace(self, start: int, end: int, new_text: str):
+        """[start, end) aralığını new_text ile değiştir; yalnızca değişen bölge yeniden taranır"""
+        end = max(start, end)
+        text = self.text[:start] + new_text + self.text[end:]
+        self.text = text
+        self.astral = self.astral or has_astral(new_text)
+
+        # Satır başları: düzenleme öncesi aynı, sonrası kaydırılır
+        delta = len(new_text) - (end - start)
+        first = bisect_right(self.line_starts, start)
+        last = bisect_right(self.line_starts, end)
+        inserted = []
+        index = new_text.find('\n')
+        while index >= 0:
+            inserted.append(start + index + 1)
+            index = new_text.find('\n', index + 1)
+        self.line_starts[first:] = inserted + [line_start + delta for line_start in self.line_starts[last:]]
+
+        self.lexer.analyze_incremental(text, start, end, start + len(new_text))
+        splice = self.lexer.last_splice
+        if splice is None:
+            self.semantic_tokens.rebuild(self.tokens)
+            self.lexical_errors = [token for token in self.tokens if token.type == TokenType.ERROR]
+        else:
+            self.semantic_tokens.update(self.tokens, splice)
+            self.update_lexical_errors(splice)
+        self.splice = splice
+
+    def update_lexical_errors(self, splice):
+        """Hata token listesinde yalnızca lexer'ın değiştirdiği aralığı yenile
+
+        Değişmeyen token'lar aynı nesnelerdir (sonrakiler yerinde kaydırılır);
+        çıkarılan hata token'ları listede bitişiktir ve eklenenlerle değiştirilir.
+        """
+        tokens = self.tokens
+        start = splice.start_index
+        errors = self.lexical_errors
+        removed = [token for token in splice.removed if token.type == TokenType.ERROR]
+        inserted = [token for token in tokens[start:start + splice.inserted_count]
+                    if token.type == TokenType.ERROR]
+        # Değişmeyen önek: son değişmeyen token'a kadar olan hatalar
+        low = bisect_right(errors, tokens[start - 1].position, key=lambda t: t.position) if start else 0
+        high = low + len(removed)
+        if high <= len(errors) and all(map(is_, errors[low:high], removed)):
+            errors[low:high] = inserted
+        else:
+            self.lexical_errors = [token for token in tokens if token.type == TokenType.ERROR]
+
+    def offset(self, position: dict) -> int:
+        """LSP konumunun metindeki pozisyonu (satır sonunu aşan karakter satır sonuna düşer)"""
+        line = position['line']
+        if line >= len(self.line_starts):
+            return len(self.text)
+        start = self.line_starts[line]
+        end = self.line_starts[line + 1] - 1 if line + 1 < len(self.line_starts) else len(self.text)
+        character = position['character']
+        if not (self.utf16 and self.astral):
+            return min(start + character, end)
+        index, units = start, 0
+        while index < end and units < character:
+            units += 2 if self.text[index] > '\uffff' else 1
+            index += 1
+        return index
+
+    def character(self, line: int, position: int) -> int:
+        """Pozisyonun (0 tabanlı satırındaki) LSP karakter sütunu"""
+        line_start = self.line_starts[line]
+        if self.utf16 and self.astral:
+            return utf16_length(self.text[line_start:position])
+        return position - line_start
+
+    def length(self, text: str) -> int:
+        """Metnin LSP birimiyle uzunluğu"""
+        return utf16_length(text) if self.utf16 and self.astral else len(text)
+
+    def position(self, offset: int) -> dict:
+        """Metin pozisyonunun LSP konumu"""
+        line = bisect_right(self.line_starts, offset) - 1
+        return {'line': line, 'character': self.character(line, offset)}
+
+    def token_range(self, first: Token, last: Token) -> dict:
+        return {'start': self.position(first.position), 'end': self.position(last.position + len(last.value))}
+
+    def parse(self):
+        """Token'ları (değişmeyen üst düzey öğeleri yeniden kullanarak) parse et"""
+        if self.parsed_tokens is not self.tokens:
+            self.parser.parse(self.tokens, self.splice, self.lexer.bracket_index())
+            self.parsed_tokens = self.tokens
+
+    def diagnostics(self) -> List[dict]:
+        """Lexical hatalar ve parser tanıları (LSP Diagnostic listesi)
+
+        Token listesi taranmaz: hata token'ları düzenlemelerle güncel tutulur,
+        parser tanıları artımlı parser'dan gelir (yeniden kullanılan öğelerin tanıları dahil).
+        """
+        self.parse()
+        diagnostics = []
+        for token in self.lexical_errors:
+            diagnostics.append({'range': self.token_range(token, token), 'severity': ERROR_SEVERITY,
+                                'code': LEXICAL_ERROR, 'source': DIAGNOSTIC_SOURCE,
+                                'message': f"Geçersiz token '{token.value}' satır {token.line}"})
+        end = self.position(len(self.text))
+        for error in self.parser.errors:
+            error_range = self.token_range(error.first, error.last) if error.first else {'start': end, 'end': end}
+            diagnostics.append({'range': error_range, 'severity': ERROR_SEVERITY, 'code': error.code,
+                                'source': DIAGNOSTIC_SOURCE, 'message': error.message})
+        return diagnostics
+
+    def folding_ranges(self) -> List[dict]:
+        """Çok satırlı { } blokları, blok yorumları ve ardışık #include satırları"""
+        ranges = []
+        tokens = self.tokens
+        brackets = self.lexer.bracket_index()
+        include_start = include_end = None
+        for index, token in enumerate(tokens):
+            if token.type == TokenType.SEPARATOR and token.value == '{':
+                closing = brackets.match(index)
+                if closing is not None and tokens[closing].line - 1 > token.line:
+                    ranges.append({'startLine': token.line - 1, 'endLine': tokens[closing].line - 2})
+            elif token.type == TokenType.COMMENT and '\n' in token.value:
+                ranges.append({'startLine': token.line - 1,
+                               'endLine': token.line - 1 + token.value.count('\n'), 'kind': 'comment'})
+            if token.type == TokenType.PREPROCESSOR and token.value.startswith('#include'):
+                if include_end is not None and token.line == include_end + 1:
+                    include_end = token.line
+                    continue
+                self.add_imports(ranges, include_start, include_end)
+                include_start = include_end = token.line
+        self.add_imports(ranges, include_start, include_end)
+        ranges.sort(key=lambda folding: folding['startLine'])
+        return ranges
+
+    @staticmethod
+    def add_imports(ranges: list, start: Optional[int], end: Optional[int]):
+        if start is not None and end > start:
+            ranges.append({'startLine': start - 1, 'endLine': end - 1, 'kind': 'imports'})
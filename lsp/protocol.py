@@ -0,0 +1,51 @@
+import json
+from typing import BinaryIO, Optional
+
+# JSON-RPC hata kodları
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+SERVER_NOT_INITIALIZED = -32002
+
+class ProtocolError(Exception):
+    """İsteğe JSON-RPC hata yanıtı olarak dönen hata"""
+
+    def __init__(self, code: int, message: str):
+        super().__init__(message)
+        self.code = code
+        self.message = message
+
+def read_message(stream: BinaryIO) -> Optional[dict]:
+    """Content-Length başlıklı bir JSON-RPC mesajı oku (akış bittiyse None)
+
+    Gövde JSON olarak çözülemezse ProtocolError(PARSE_ERROR) fırlatılır;
+    mesaj sınırı korunduğundan okumaya devam edilebilir.
+    """
+    length = None
+    while True:
+        line = stream.readline()
+        if not line:
+            return None
+        line = line.strip()
+        if not line:
+            if length is None:
+                continue  # Başlıksız boş satır
+            break
+        name, _, value = line.decode('ascii', 'replace').partition(':')
+        if name.strip().lower() == 'content-length':
+            length = int(value.strip())
+    body = stream.read(length)
+    if len(body) < length:
+        return None
+    try:
+        return json.loads(body.decode('utf-8'))
+    except (UnicodeDecodeError, ValueError) as e:
+        raise ProtocolError(PARSE_ERROR, f"Geçersiz JSON: {e}")
+
+def write_message(stream: BinaryIO, message: dict):
+    """Mesajı Content-Length başlığıyla yaz"""
+    body = json.dumps(message, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    stream.write(b"Content-Length: %d\r\n\r\n" % len(body) + body)
+    stream.flush()
@@ -0,0 +1,165 @@
+import sys
+from typing import BinaryIO
+from lsp.document import Document, SEMANTIC_TOKEN_TYPES
+from lsp.protocol import (ProtocolError, read_message, write_message, INTERNAL_ERROR, INVALID_PARAMS,
+                          INVALID_REQUEST, METHOD_NOT_FOUND, SERVER_NOT_INITIALIZED)
+
+SERVER_NAME = 'c-highlighter'
+TEXT_DOCUMENT_SYNC_INCREMENTAL = 2
+
+class LanguageServer:
+    """stdio üzerinden JSON-RPC ile çalışan dil sunucusu
+
+    Belgeler açıkken durumları (metin, artımlı lexer/parser, semantik token
+    dizisi) saklanır; her düzenleme yalnızca değişen bölgeyi yeniden analiz
+    eder ve tanılar değiştiyse textDocument/publishDiagnostics ile gönderilir.
+    Desteklenenler: artımlı metin eşitleme, semantik token'lar (tam ve
+    delta), katlama aralıkları ve tanılar.
+    """
+
+    def __init__(self, output: BinaryIO):
+        self.output = output
+        self.documents = {}  # URI -> Document
+        self.utf16 = True  # İstemci utf-32 desteklemiyorsa konumlar UTF-16 birimidir
+        self.initialized = False
+        self.shutdown_requested = False
+        self.requests = {
+            'initialize': self.initialize,
+            'shutdown': self.shutdown,
+            'textDocument/semanticTokens/full': self.semantic_tokens_full,
+            'textDocument/semanticTokens/full/delta': self.semantic_tokens_delta,
+            'textDocument/foldingRange': self.folding_range,
+        }
+        self.notifications = {
+            'initialized': lambda params: None,
+            'textDocument/didOpen': self.did_open,
+            'textDocument/didChange': self.did_change,
+            'textDocument/didClose': self.did_close,
+        }
+
+    def serve(self, stream: BinaryIO) -> int:
+        """Mesajları akış bitene ya da exit gelene kadar işle; çıkış kodunu döndür"""
+        while True:
+            try:
+                message = read_message(stream)
+            except ProtocolError as e:
+                self.send({'jsonrpc': '2.0', 'id': None, 'error': {'code': e.code, 'message': e.message}})
+                continue
+            if message is None:
+                return 1
+            if message.get('method') == 'exit':
+                return 0 if self.shutdown_requested else 1
+            self.handle(message)
+
+    def handle(self, message: dict):
+        """Tek bir istek ya da bildirimi işle"""
+        method = message.get('method')
+        if 'id' not in message:
+            handler = self.notifications.get(method)
+            if handler is not None and self.initialized:
+                try:
+                    handler(message.get('params') or {})
+                except Exception as e:
+                    print(f"{method} işlenemedi: {type(e).__name__}: {e}", file=sys.stderr)
+            return  # Bilinmeyen bildirimler ($/...) yok sayılır
+
+        request_id = message['id']
+        try:
+            if not isinstance(method, str):
+                raise ProtocolError(INVALID_REQUEST, "method eksik")
+            handler = self.requests.get(method)
+            if handler is None:
+                raise ProtocolError(METHOD_NOT_FOUND, f"Bilinmeyen metot: {method}")
+            if not self.initialized and method != 'initialize':
+                raise ProtocolError(SERVER_NOT_INITIALIZED, "Sunucu henüz başlatılmadı")
+            result = handler(message.get('params') or {})
+        except ProtocolError as e:
+            self.send({'jsonrpc': '2.0', 'id': request_id, 'error': {'code': e.code, 'message': e.message}})
+            return
+        except Exception as e:
+            self.send({'jsonrpc': '2.0', 'id': request_id,
+                       'error': {'code': INTERNAL_ERROR, 'message': f"{type(e).__name__}: {e}"}})
+            return
+        self.send({'jsonrpc': '2.0', 'id': request_id, 'result': result})
+
+    def send(self, message: dict):
+        write_message(self.output, message)
+
+    def notify(self, method: str, params: dict):
+        self.send({'jsonrpc': '2.0', 'method': method, 'params': params})
+
+    def document(self, params: dict) -> Document:
+        uri = params.get('textDocument', {}).get('uri')
+        document = self.documents.get(uri)
+        if document is None:
+            raise ProtocolError(INVALID_PARAMS, f"Açık olmayan belge: {uri}")
+        return document
+
+    def initialize(self, params: dict) -> dict:
+        encodings = params.get('capabilities', {}).get('general', {}).get('positionEncodings', [])
+        self.utf16 = 'utf-32' not in encodings
+        self.initialized = True
+        return {
+            'capabilities': {
+                'positionEncoding': 'utf-16' if self.utf16 else 'utf-32',
+                'textDocumentSync': {'openClose': True, 'change': TEXT_DOCUMENT_SYNC_INCREMENTAL},
+                'semanticTokensProvider': {
+                    'legend': {'tokenTypes': SEMANTIC_TOKEN_TYPES, 'tokenModifiers': []},
+                    'full': {'delta': True},
+                },
+                'foldingRangeProvider': True,
+            },
+            'serverInfo': {'name': SERVER_NAME},
+        }
+
+    def shutdown(self, params: dict):
+        self.shutdown_requested = True
+        self.documents.clear()
+        return None
+
+    def did_open(self, params: dict):
+        item = params['textDocument']
+        document = Document(item['uri'], item['text'], item.get('version', 0), self.utf16)
+        self.documents[item['uri']] = document
+        self.publish_diagnostics(document)
+
+    def did_change(self, params: dict):
+        document = self.document(params)
+        document.apply_changes(params['contentChanges'], params['textDocument'].get('version'))
+        self.publish_diagnostics(document)
+
+    def did_close(self, params: dict):
+        uri = params['textDocument']['uri']
+        if self.documents.pop(uri, None) is not None:
+            self.notify('textDocument/publishDiagnostics', {'uri': uri, 'diagnostics': []})
+
+    def publish_diagnostics(self, document: Document):
+        """Tanılar son gönderilenden farklıysa gönder"""
+        diagnostics = document.diagnostics()
+        if diagnostics != document.published_diagnostics:
+            document.published_diagnostics = diagnostics
+            self.notify('textDocument/publishDiagnostics',
+                        {'uri': document.uri, 'version': document.version, 'diagnostics': diagnostics})
+
+    def semantic_tokens_full(self, params: dict) -> dict:
+        return self.document(params).semantic_tokens.full()
+
+    def semantic_tokens_delta(self, params: dict) -> dict:
+        return self.document(params).semantic_tokens.delta(params.get('previousResultId'))
+
+    def folding_range(self, params: dict) -> list:
+        return self.document(params).folding_ranges()
+
+def run(args) -> int:
+    """lsp komutu"""
+    if args.replay:
+        from lsp.client import replay
+        return replay(args.replay, sys.stdout)
+    return LanguageServer(sys.stdout.buffer).serve(sys.stdin.buffer)
+
+def add_parser(subparsers):
+    """lsp alt komutunu kaydet"""
+    command = subparsers.add_parser('lsp', help="stdio üzerinden JSON-RPC dil sunucusu")
+    command.add_argument('--replay', metavar='SCRIPT',
+                         help="Sunucuyu alt süreçte başlatıp JSON Lines betiğindeki mesajları gönder, yanıtları yazdır")
+    command.set_defaults(handler=run)
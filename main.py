@@ -1,10 +1,31 @@
-from tkinter import Tk
-from gui.highlighter_gui import CSyntaxHighlighterGUI
+import argparse
+from cli import analyze, batch, bench, render
+from lsp import server as lsp_server
+
+def run_gui(show_performance=False):
+    from tkinter import Tk
+    from gui.highlighter_gui import CSyntaxHighlighterGUI
 
-def main():
     root = Tk()
-    app = CSyntaxHighlighterGUI(root)
+    app = CSyntaxHighlighterGUI(root, show_performance)
     root.mainloop()
 
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description="C Syntax Highlighter")
+    arg_parser.add_argument('--performance', action='store_true',
+                            help="GUI'de analiz aşamalarının sürelerini gösteren Performans sekmesini aç")
+    subparsers = arg_parser.add_subparsers(dest='command')
+    analyze.add_parser(subparsers)
+    batch.add_parser(subparsers)
+    bench.add_parser(subparsers)
+    render.add_parser(subparsers)
+    lsp_server.add_parser(subparsers)
+
+    args = arg_parser.parse_args(argv)
+    if args.command is None:
+        run_gui(args.performance)
+        return 0
+    return args.handler(args)
+
 if __name__ == '__main__':
-    main()
+    raise SystemExit(main())
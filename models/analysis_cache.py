@@ -0,0 +1,86 @@
+import threading
+from collections import Counter, OrderedDict
+
+DEFAULT_BUDGET = 64 * 1024 * 1024  # Varsayılan bellek bütçesi (bayt)
+
+class CacheEntry:
+    """Önbellek kaydı: anahtarın metni (çakışma denetimi için), değer ve tahmini boyut"""
+    __slots__ = ('text', 'value', 'size')
+
+    def __init__(self, text: str, value, size: int):
+        self.text = text
+        self.value = value
+        self.size = size
+
+class AnalysisCache:
+    """İçerik özetiyle anahtarlanan, bellek bütçeli LRU analiz önbelleği
+
+    Anahtar, ad alanı ('lex-state', 'parse'...) ile metnin hash'i ve
+    uzunluğudur; Python str nesnesi hash'ini bir kez hesaplayıp sakladığından
+    aynı metin nesnesiyle tekrar aramak ücretsizdir. Çakışmalara karşı kayıt
+    metni de tutulur ve eşitliği denetlenir. Toplam tahmini boyut bütçeyi
+    aşınca en uzun süredir kullanılmayan kayıtlar atılır. Lexer (işçi
+    thread) ve parser (Tk thread) aynı önbelleği paylaşabilir.
+    """
+
+    def __init__(self, budget: int = DEFAULT_BUDGET):
+        self.budget = budget  # Bayt
+        self.size = 0  # Kayıtların toplam tahmini boyutu
+        self.entries = OrderedDict()  # Anahtar -> CacheEntry (en eski başta)
+        self.hits = Counter()  # Ad alanı -> isabet sayısı
+        self.misses = Counter()  # Ad alanı -> ıskalama sayısı
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(namespace: str, text: str) -> tuple:
+        return namespace, hash(text), len(text)
+
+    def get(self, namespace: str, text: str):
+        """Metnin önbellekteki değeri (yoksa None); bulunan kayıt en yeni olur"""
+        key = self.key(namespace, text)
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry is None or entry.text != text:
+                self.misses[namespace] += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits[namespace] += 1
+            return entry.value
+
+    def put(self, namespace: str, text: str, value, size: int):
+        """Değeri sakla; bütçeyi aşan eski kayıtları at (bütçeden büyük değer saklanmaz)"""
+        if size > self.budget:
+            return
+        key = self.key(namespace, text)
+        with self._lock:
+            old = self.entries.pop(key, None)
+            if old is not None:
+                self.size -= old.size
+            self.entries[key] = CacheEntry(text, value, size)
+            self.size += size
+            while self.size > self.budget:
+                _, evicted = self.entries.popitem(last=False)
+                self.size -= evicted.size
+                self.evictions += 1
+
+    def clear(self):
+        """Tüm kayıtları at (sayaçlar korunur)"""
+        with self._lock:
+            self.entries.clear()
+            self.size = 0
+
+    def stats(self) -> dict:
+        """İsabet/ıskalama sayaçları ve doluluk"""
+        with self._lock:
+            return {
+                'entries': len(self.entries),
+                'size': self.size,
+                'budget': self.budget,
+                'hits': dict(self.hits),
+                'misses': dict(self.misses),
+                'evictions': self.evictions,
+            }
+
+    def __len__(self):
+        return len(self.entries)
@@ -15,10 +15,47 @@ class TokenType(Enum):  # Token türlerini tanımlayan Enum sınıfı
     ERROR = "ERROR"  # Hatalı token'lar
     EOF = "EOF"  # Dosya sonu
 
+# Kompakt depolarda kullanılan tamsayı tür kodları
+TOKEN_TYPES = list(TokenType)  # Kod -> TokenType
+TOKEN_TYPE_CODES = {token_type: code for code, token_type in enumerate(TOKEN_TYPES)}  # TokenType -> kod
+
+# C dili anahtar kelimeleri, operatörleri ve ayırıcıları
+KEYWORDS = (
+    'auto', 'break', 'case', 'char', 'const', 'continue', 'default', 'do',
+    'double', 'else', 'enum', 'extern', 'float', 'for', 'goto', 'if',
+    'int', 'long', 'register', 'return', 'short', 'signed', 'sizeof', 'static',
+    'struct', 'switch', 'typedef', 'union', 'unsigned', 'void', 'volatile', 'while'
+)
+OPERATORS = (
+    '+', '-', '*', '/', '%', '=', '==', '!=', '<', '>', '<=', '>=',
+    '&&', '||', '!', '&', '|', '^', '~', '<<', '>>', '++', '--',
+    '+=', '-=', '*=', '/=', '%=', '&=', '|=', '^=', '<<=', '>>='
+)
+SEPARATORS = ('(', ')', '{', '}', '[', ']', ';', ',', '.', ':', '?')
+
+# Token kodları (kind): önce tür kodları (TOKEN_TYPE_CODES ile aynı), ardından her
+# anahtar kelime, operatör ve ayırıcı için ayrı bir kod. Parser token türü ve
+# içeriği yerine tek bir tamsayıyı karşılaştırır.
+KIND_TYPES = (TOKEN_TYPES + [TokenType.KEYWORD] * len(KEYWORDS) +
+              [TokenType.OPERATOR] * len(OPERATORS) + [TokenType.SEPARATOR] * len(SEPARATORS))  # Kod -> TokenType
+SPELLING_KINDS = {spelling: code for code, spelling in
+                  enumerate(KEYWORDS + OPERATORS + SEPARATORS, len(TOKEN_TYPES))}  # İçerik -> kod
+SPELLED_TYPES = frozenset({TokenType.KEYWORD, TokenType.OPERATOR, TokenType.SEPARATOR})
+
+def token_kind(token_type: TokenType, value) -> int:
+    """Token'ın kodu: bilinen anahtar kelime/operatör/ayırıcıysa kendi kodu, değilse tür kodu"""
+    code = TOKEN_TYPE_CODES[token_type]
+    if token_type in SPELLED_TYPES:
+        return SPELLING_KINDS.get(value, code)
+    return code
+
 class Token:  # Token nesnesini temsil eden sınıf
-    def __init__(self, type, value, line, column, position):  # Token oluşturucu
+    __slots__ = ('type', 'value', 'line', 'column', 'position', 'kind')  # Token başına __dict__ ayrılmaz
+
+    def __init__(self, type, value, line, column, position, kind=None):  # Token oluşturucu
         self.type = type  # Token türü
         self.value = value  # Token içeriği
+        self.kind = token_kind(type, value) if kind is None else kind  # Tamsayı token kodu
         self.line = line  # Satır numarası
         self.column = column  # Sütun numarası
         self.position = position  # Kod içindeki pozisyon
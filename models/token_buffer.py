@@ -0,0 +1,70 @@
+from array import array
+from models.token import Token, TokenType, KIND_TYPES
+
+class TokenBuffer:  # Token'ları paralel tamsayı dizilerinde tutan kompakt depo
+    """Sütun tabanlı token deposu
+
+    Her token için yalnızca token kodu (kind), başlangıç/bitiş pozisyonu, satır ve sütun
+    saklanır; token içeriği istendiğinde kaynak metinden dilimlenir. İndeksleme
+    ve iterasyon, mevcut kodun kullanabilmesi için Token görünümleri üretir.
+    """
+
+    def __init__(self, source, encoding=None):  # source: token pozisyonlarının işaret ettiği metin (str, bytes veya mmap)
+        self.source = source
+        self.encoding = encoding  # Bayt kaynaklarda içerik yalnızca erişildiğinde çözülür
+        offset_type = 'i' if len(source) < 2 ** 31 else 'q'  # 2 GB üstü kaynaklar için 64 bit pozisyon
+        self.kinds = array('i')  # Token kodu (models.token.KIND_TYPES ile türe çevrilir)
+        self.starts = array(offset_type)  # Başlangıç pozisyonu
+        self.ends = array(offset_type)  # Bitiş pozisyonu (hariç)
+        self.lines = array('i')  # Satır numarası
+        self.columns = array('i')  # Sütun numarası
+
+    def append(self, kind, start, end, line, column):  # Yeni token ekle (kind: token kodu)
+        self.kinds.append(kind)
+        self.starts.append(start)
+        self.ends.append(end)
+        self.lines.append(line)
+        self.columns.append(column)
+
+    def append_token(self, token: Token):  # Token nesnesini depoya ekle
+        self.append(token.kind, token.position,
+                    token.position + len(token.value), token.line, token.column)
+
+    def type(self, index) -> TokenType:  # Token türü
+        return KIND_TYPES[self.kinds[index]]
+
+    def value(self, index) -> str:  # Token içeriği (kaynaktan tembel dilimleme)
+        value = self.source[self.starts[index]:self.ends[index]]
+        if self.encoding:
+            value = value.decode(self.encoding, errors='replace')
+        return value
+
+    def token(self, index) -> Token:  # Tek bir token için Token görünümü
+        kind = self.kinds[index]
+        return Token(KIND_TYPES[kind], self.value(index),
+                     self.lines[index], self.columns[index], self.starts[index], kind)
+
+    def __len__(self):
+        return len(self.kinds)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.token(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("TokenBuffer indeksi aralık dışında")
+        return self.token(index)
+
+    def __iter__(self):
+        source = self.source
+        encoding = self.encoding
+        for kind, start, end, line, column in zip(self.kinds, self.starts, self.ends,
+                                                  self.lines, self.columns):
+            value = source[start:end]
+            if encoding:
+                value = value.decode(encoding, errors='replace')
+            yield Token(KIND_TYPES[kind], value, line, column, start, kind)
+
+    def __repr__(self):
+        return f"TokenBuffer({len(self)} token)"
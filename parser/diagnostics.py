@@ -0,0 +1,66 @@
+from typing import Optional
+from models.token import Token
+
+# Tanı kodları
+EXPECTED_SEMICOLON = "expected-semicolon"
+EXPECTED_BRACE = "expected-brace"
+EXPECTED_PAREN = "expected-paren"
+UNEXPECTED_TOKEN = "unexpected-token"
+UNDEFINED_IDENTIFIER = "undefined-identifier"
+PARSE_FAILURE = "parse-failure"
+
+# Kod -> mesaj şablonu ({line}: ilk token'ın satırı, {value}: içeriği, {detail}: ek bilgi)
+MESSAGES = {
+    EXPECTED_SEMICOLON: "Beklenen ';' satır {line}",
+    EXPECTED_BRACE: "Beklenen '{{' satır {line}",
+    EXPECTED_PAREN: "Beklenen ')' satır {line}",
+    UNEXPECTED_TOKEN: "Beklenmeyen veya tanımsız token '{value}' satır {line}",
+    UNDEFINED_IDENTIFIER: "Beklenmeyen/tanımsız tanımlayıcı kullanımı '{value}' satır {line}",
+    PARSE_FAILURE: "Parse hatası: {detail}",
+}
+
+class Diagnostic:
+    """Bir hata bölgesi için yapılandırılmış tanı
+
+    Bölge ilk ve son token ile tutulur; pozisyonlar ve mesaj metni yalnızca
+    istendiğinde token'lardan hesaplanır. Artımlı lexer kaydırdığı token'ları
+    yerinde güncellediği için yeniden kullanılan tanılar da güncel kalır.
+    """
+    __slots__ = ('code', 'first', 'last', 'detail')
+
+    def __init__(self, code: str, first: Optional[Token], last: Optional[Token] = None, detail: str = ""):
+        self.code = code
+        self.first = first  # None ise dosya sonu (EOF sonrası)
+        self.last = last or first
+        self.detail = detail
+
+    @property
+    def start(self) -> Optional[int]:
+        """Bölgenin başlangıç pozisyonu"""
+        return self.first.position if self.first else None
+
+    @property
+    def end(self) -> Optional[int]:
+        """Bölgenin bitiş pozisyonu (hariç)"""
+        return self.last.position + len(self.last.value) if self.last else None
+
+    @property
+    def line(self):
+        return self.first.line if self.first else 'EOF'
+
+    @property
+    def message(self) -> str:
+        """Gösterilecek mesaj (her erişimde biçimlendirilir)"""
+        value = self.first.value if self.first else ''
+        return MESSAGES[self.code].format(line=self.line, value=value, detail=self.detail)
+
+    def extend(self, token: Optional[Token]):
+        """Bölgeyi verilen token'a kadar genişlet"""
+        if token is not None and self.first is not None:
+            self.last = token
+
+    def __str__(self):
+        return self.message
+
+    def __repr__(self):
+        return f"Diagnostic({self.code}, {self.start}-{self.end})"
@@ -0,0 +1,277 @@
+import math
+import sys
+import time
+from bisect import bisect_left
+from operator import is_
+from typing import List, Optional
+from parser.parse_tree import ParseNode, serialize_tree, deserialize_tree
+from parser.diagnostics import Diagnostic, PARSE_FAILURE
+from parser.topdown_parser import TopDownParser
+from parser.symbol_index import SymbolIndex
+from lexer.lexical_analyzer import Token, TokenType
+from models.analysis_cache import AnalysisCache
+
+LOOKAHEAD = 2  # parse_statement/parse_factor bir öğenin sonundan en fazla bu kadar token ileriye bakar
+CACHE_NAMESPACE = "parse"
+ITEM_BYTES = 200  # Önbellekte bir üst düzey öğe kaydının yaklaşık boyutu
+
+class TopLevelItem:
+    """Üst düzey öğe: düğüm, kapsadığı token aralığı, ürettiği hatalar ve sembol kayıtları"""
+    __slots__ = ('node', 'start', 'end', 'first', 'errors', 'symbols', 'tree')
+
+    def __init__(self, node: Optional[ParseNode], start: int, end: int, first: Token,
+                 errors: List[Diagnostic], symbols: List[tuple] = (), tree: Optional[tuple] = None):
+        self.node = node  # None ise atlanan token'lar (düğüm üretmeyen deyim)
+        self.start = start  # İlk token indeksi
+        self.end = end  # Son token'dan sonraki indeks
+        self.first = first  # İlk token nesnesi (aralık kimliği)
+        self.errors = errors
+        self.symbols = symbols  # SymbolRecord'lar; indeksler start'a göreli (öğeyle birlikte taşınır)
+        self.tree = tree  # Önbellek için serialize_tree çıktısı (token indeksleri start'a göreli; tembel)
+
+    def moved(self, shift: int) -> 'TopLevelItem':
+        """Aynı öğenin token indeksleri kaydırılmış kopyası"""
+        return TopLevelItem(self.node, self.start + shift, self.end + shift, self.first, self.errors,
+                            self.symbols, self.tree)
+
+class ParseSnapshot:
+    """Önbellekteki parse sonucu: öğeler token indeksleriyle saklanır
+
+    Alt ağaçlar (öğeye göreli token indeksli düz dizilere) ve tanıların
+    token'ları indekse çevrilir; geri yüklemede aynı metnin yeni token
+    listesine bağlanırlar. Böylece lexer'ın token'ları yerinde kaydırması
+    önbellekteki sonucu bozmaz. Bir öğenin ağacı bir kez dizilir ve öğe
+    yeniden kullanıldıkça sonraki anlık görüntülerle paylaşılır.
+    """
+    __slots__ = ('items', 'size')
+
+    def __init__(self, text: str, tokens: List[Token], items: List[TopLevelItem]):
+        self.size = sys.getsizeof(text) + ITEM_BYTES * len(items)
+        for item in items:
+            if item.tree is None and item.node is not None:
+                item.tree = self.serialize_item(tokens, item)
+                self.size += sum(len(part) for part in item.tree[1:])
+        self.items = [(item.tree, item.start, item.end,
+                       [self.error_spec(tokens, error) for error in item.errors], item.symbols)
+                      for item in items]
+
+    @staticmethod
+    def serialize_item(tokens: List[Token], item: TopLevelItem) -> tuple:
+        """Öğenin alt ağacını öğeye göreli token indeksleriyle diz"""
+        token_indices = {id(token): index for index, token in enumerate(tokens[item.start:item.end])}
+        return serialize_tree(item.node, token_indices)
+
+    @staticmethod
+    def error_spec(tokens: List[Token], error: Diagnostic) -> tuple:
+        """Tanının (kod, ilk indeks, son indeks, ek bilgi) demeti"""
+        if error.first is None:
+            return error.code, None, None, error.detail
+        first = bisect_left(tokens, error.first.position, key=lambda t: t.position)
+        last = bisect_left(tokens, error.last.position, lo=first, key=lambda t: t.position)
+        return error.code, first, last, error.detail
+
+    def reusable_items(self, tokens: List[Token]) -> dict:
+        """Aynı metnin token listesinde başlangıç indeksi -> öğe"""
+        reusable = {}
+        for tree, start, end, specs, symbols in self.items:
+            errors = [Diagnostic(code, tokens[first], tokens[last], detail) if first is not None
+                      else Diagnostic(code, None, detail=detail)
+                      for code, first, last, detail in specs]
+            node = deserialize_tree(tree, tokens[start:end]) if tree is not None else None
+            reusable[start] = TopLevelItem(node, start, end, tokens[start], errors, symbols, tree)
+        return reusable
+
+class IncrementalParser:
+    """Değişmeyen üst düzey alt ağaçları yeniden kullanan parser
+
+    Her üst düzey öğe (fonksiyon tanımı, bildirim, önişlemci satırı...)
+    kapsadığı token aralığıyla saklanır. Artımlı lexer düzenleme dışındaki
+    token nesnelerini korur (sonrakileri yerinde kaydırır); bu yüzden aralığı
+    değişmeyen öğeler token kimliğiyle tanınır ve yeniden çözümlenmez.
+    Yalnızca değişikliğe değen öğeler parse edilir, parser kalan ilk öğenin
+    başına ulaştığında eski öğelere geri döner. Hatalı öğeler her seferinde
+    yeniden çözümlenir: kurtarma parantez tablosuyla öğenin dışına bakabilir.
+    """
+
+    def __init__(self, cache: Optional[AnalysisCache] = None):
+        self.cache = cache  # Tamamlanan parse'ların metin anahtarlı önbelleği
+        self.source = None  # Son parse edilen token listesi (lexer'ın listesi)
+        self.tokens = []  # Parser'ın boşluksuz token listesi
+        self.items = []
+        self.errors = []
+        self.reparsed = 0  # Son parse'ta yeniden çözümlenen öğe sayısı
+        self.symbols = None  # Son parse'ın SymbolIndex'i (ilk istekte kurulur)
+
+    def parse(self, tokens, splice=None, brackets=None, text=None) -> ParseNode:
+        """Token'ları tek seferde parse et; splice verilirse lexer'ın değişen aralığı kullanılır"""
+        run = self.start(tokens, splice, brackets, text)
+        run.step()
+        return run.root
+
+    def start(self, tokens, splice=None, brackets=None, text=None) -> 'ParseRun':
+        """Dilimler halinde ilerletilebilen bir parse başlat
+
+        brackets, lexer'ın aynı token listesi için kurduğu BracketIndex'tir.
+        text verilirse (token'ların kaynak metni) önbellekteki sonuç kullanılır
+        ve tamamlanan parse önbelleğe eklenir.
+        """
+        if self.cache is not None and text is not None:
+            snapshot = self.cache.get(CACHE_NAMESPACE, text)
+            if snapshot is not None:
+                # Tüm öğeler yeniden kullanılır; step() yalnızca onları sırayla ekler
+                parser = TopDownParser(tokens, brackets=brackets)
+                return ParseRun(self, tokens, parser, snapshot.reusable_items(parser.tokens), text)
+        if self.follows(splice):
+            # Yalnızca değişen aralık filtrelenir, kalanı önceki listeden dilimlenir
+            start = splice.start_index
+            inserted = [t for t in tokens[start:start + splice.inserted_count]
+                        if t.type != TokenType.WHITESPACE]
+            parser_tokens = self.tokens[:start] + inserted + self.tokens[start + len(splice.removed):-1]
+            parser_tokens.append(tokens[-1])  # Yeni EOF
+            parser = TopDownParser(parser_tokens, filtered=True, brackets=brackets)
+        else:
+            parser = TopDownParser(tokens, brackets=brackets)
+        return ParseRun(self, tokens, parser, self.reusable_items(parser.tokens, splice), text)
+
+    def commit(self, run: 'ParseRun'):
+        """Tamamlanan parse'ı sonraki parse'ların temeli yap"""
+        self.source = run.source
+        self.tokens = run.parser.tokens
+        self.items = run.items
+        self.errors = run.errors
+        self.reparsed = run.reparsed
+        self.symbols = None
+        if self.cache is not None and run.text is not None and run.reparsed:
+            snapshot = ParseSnapshot(run.text, run.parser.tokens, run.items)
+            self.cache.put(CACHE_NAMESPACE, run.text, snapshot, snapshot.size)
+
+    def symbol_index(self) -> SymbolIndex:
+        """Son tamamlanan parse'ın tanımlayıcı tablosu
+
+        Yeniden kullanılan öğeler sembol kayıtlarını (öğeye göreli indekslerle)
+        taşır; tablo bu kayıtlardan ilk istekte bir kez kurulur, böylece
+        istenmeyen düzenlemelerde maliyet eklenmez.
+        """
+        if self.symbols is None:
+            self.symbols = SymbolIndex.from_items(self.tokens, self.items)
+        return self.symbols
+
+    def reusable_items(self, tokens: List[Token], splice=None) -> dict:
+        """Yeni listede başlangıç indeksi -> yeniden kullanılabilir öğe"""
+        if not self.items:
+            return {}
+
+        reusable = {}
+        if self.follows(splice):
+            # Lexer'ın değiştirdiği aralık: öncesi aynı indekste, sonrası kaydırılmış
+            changed_start = splice.start_index
+            changed_end = changed_start + len(splice.removed)
+            shift = splice.inserted_count - len(splice.removed)
+            for item in self.items:
+                if item.errors or self.touches_eof(item):
+                    continue
+                if item.end + LOOKAHEAD <= changed_start:
+                    reusable[item.start] = item
+                elif item.start >= changed_end:
+                    moved = item.moved(shift)
+                    reusable[moved.start] = moved
+            return reusable
+
+        # Değişiklik bilgisi yok: aralığındaki token nesneleri aynı kalan öğeler
+        old_tokens = self.tokens
+        for item in self.items:
+            if item.errors or self.touches_eof(item):
+                continue
+            index = bisect_left(tokens, item.first.position, key=lambda t: t.position)
+            if index >= len(tokens) or tokens[index] is not item.first:
+                continue
+            end = index + item.end - item.start
+            if not all(map(is_, old_tokens[item.start:item.end], tokens[index:end])):
+                continue
+            if not self.same_lookahead(old_tokens, item.end, tokens, end):
+                continue
+            reusable[index] = item.moved(index - item.start)
+        return reusable
+
+    def follows(self, splice) -> bool:
+        """Lexer'ın değişiklik kaydı son parse edilen listeye mi ait (indeksler örtüşüyor mu)"""
+        return (splice is not None and self.source is not None and
+                splice.previous_tokens is self.source and len(self.tokens) == len(self.source))
+
+    def touches_eof(self, item: TopLevelItem) -> bool:
+        """EOF token'ı her analizde yeniden üretilir: onu kapsayan öğeler yeniden kullanılmaz"""
+        return item.end > len(self.tokens) - 1
+
+    @staticmethod
+    def same_lookahead(old_tokens: List[Token], old_index: int, tokens: List[Token], index: int) -> bool:
+        """Öğeden sonraki LOOKAHEAD token aynı tür ve değerde mi"""
+        old_next = [(t.type, t.value) for t in old_tokens[old_index:old_index + LOOKAHEAD]]
+        new_next = [(t.type, t.value) for t in tokens[index:index + LOOKAHEAD]]
+        return old_next == new_next
+
+class ParseRun:
+    """Üst düzey öğeleri zaman bütçesiyle dilimler halinde çözümleyen parse işlemi
+
+    Her step() çağrısı bütçe dolana kadar üst düzey öğe ekler; kök düğüm ve
+    hata listesi her dilimden sonra o ana kadarki kısmi sonucu gösterir.
+    Tamamlanmadan bırakılan (iptal edilen) bir işlem parser'ın önbelleğini
+    değiştirmez.
+    """
+
+    def __init__(self, owner: IncrementalParser, source, parser: TopDownParser, reusable: dict,
+                 text: Optional[str] = None):
+        self.owner = owner
+        self.source = source
+        self.text = text  # Token'ların kaynak metni (önbellek anahtarı)
+        self.parser = parser
+        self.reusable = reusable
+        self.root = ParseNode("program")
+        self.items = []
+        self.errors = []
+        self.reparsed = 0  # Yeniden çözümlenen öğe sayısı
+        self.done = False
+
+    def step(self, budget: float = math.inf) -> bool:
+        """Bütçe (saniye) dolana kadar parse et; bittiyse True döndür"""
+        if self.done:
+            return True
+        parser = self.parser
+        deadline = time.perf_counter() + budget
+        error_count = len(parser.errors)
+        try:
+            while parser.current_token and parser.current_token.type != TokenType.EOF:
+                index = parser.current_token_index
+                item = self.reusable.get(index)
+                if item is not None:
+                    parser.seek(item.end)
+                else:
+                    error_count = len(parser.errors)
+                    symbol_count = len(parser.symbols)
+                    node = parser.run(parser.parse_statement())
+                    end = parser.current_token_index
+                    symbols = [(position - index, is_definition,
+                                None if definition is None else definition - index)
+                               for position, is_definition, definition in parser.symbols[symbol_count:]]
+                    item = TopLevelItem(node, index, end, parser.tokens[index], parser.errors[error_count:],
+                                        symbols)
+                    self.reparsed += 1
+                self.items.append(item)
+                self.errors.extend(item.errors)
+                if item.node:
+                    self.root.add_child(item.node)
+                if time.perf_counter() >= deadline:
+                    return False
+        except Exception as e:
+            # TopDownParser.parse() ile aynı davranış; önbellek sıfırlanır
+            self.errors.extend(parser.errors[error_count:])  # Yarım kalan öğenin hataları
+            self.errors.append(Diagnostic(PARSE_FAILURE, None, detail=str(e)))
+            self.root = ParseNode("ERROR")
+            self.done = True
+            self.owner.source, self.owner.tokens, self.owner.items = None, [], []
+            self.owner.symbols = None
+            self.owner.errors = self.errors
+            return True
+
+        self.done = True
+        self.owner.commit(self)
+        return True
@@ -1,4 +1,6 @@
+from array import array
 from typing import List
+from models.token import Token
 
 class ParseNode:
     """Parse tree düğümü"""
@@ -12,3 +14,64 @@ class ParseNode:
     
     def __str__(self):
         return self.name
+
+def count_nodes(root) -> int:
+    """Parse tree düğüm sayısı (özyinelemesiz)"""
+    count = 0
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        if node is not None:
+            count += 1
+            stack.extend(node.children)
+    return count
+
+def serialize_tree(root: ParseNode, token_indices: dict) -> tuple:
+    """Parse tree'yi ön-sıralı düz dizilere çevir (özyinelemesiz; derinlik sınırı yok)
+
+    Her düğüm için ad kodu (None çocuk için -1), çocuk sayısı ve token indeksi
+    (token yoksa -1) saklanır.
+    """
+    names = {}
+    codes, counts, tokens = array('i'), array('i'), array('i')
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        if node is None:
+            codes.append(-1)
+            counts.append(0)
+            tokens.append(-1)
+            continue
+        codes.append(names.setdefault(node.name, len(names)))
+        counts.append(len(node.children))
+        tokens.append(token_indices.get(id(node.token), -1) if node.token is not None else -1)
+        stack.extend(reversed(node.children))
+    return list(names), codes.tobytes(), counts.tobytes(), tokens.tobytes()
+
+def deserialize_tree(data: tuple, tokens: List[Token]) -> ParseNode:
+    """serialize_tree çıktısından parse tree'yi yeniden kur"""
+    names, code_bytes, count_bytes, token_bytes = data
+    codes, counts, token_ids = array('i'), array('i'), array('i')
+    codes.frombytes(code_bytes)
+    counts.frombytes(count_bytes)
+    token_ids.frombytes(token_bytes)
+
+    root = None
+    open_nodes = []  # [düğüm, eksik çocuk sayısı]
+    for code, count, token_id in zip(codes, counts, token_ids):
+        node = None
+        if code >= 0:
+            node = ParseNode(names[code])
+            if token_id >= 0:
+                node.token = tokens[token_id]
+        if open_nodes:
+            parent = open_nodes[-1]
+            parent[0].children.append(node)
+            parent[1] -= 1
+        else:
+            root = node
+        if count:
+            open_nodes.append([node, count])
+        while open_nodes and open_nodes[-1][1] == 0:
+            open_nodes.pop()
+    return root
@@ -0,0 +1,72 @@
+from typing import Iterable, List, Optional, Tuple
+from models.token import Token
+
+# Parser'ın sembol kaydı: (token indeksi, tanım mı, tanımın token indeksi)
+# Tanımın indeksi blok/parametre kapsamında çözümlenen adlar için doludur
+# (tanımlar kendilerini gösterir); dosya kapsamındaki adlar için None'dır ve
+# tablo kurulurken adla eşlenir.
+SymbolRecord = Tuple[int, bool, Optional[int]]
+
+class Symbol:
+    """Bir kapsamdaki tanımlayıcı: tanımları ve tüm kullanımları"""
+    __slots__ = ('name', 'scoped', 'definitions', 'uses')
+
+    def __init__(self, name: str, scoped: bool):
+        self.name = name
+        self.scoped = scoped  # Blok/parametre kapsamında mı (False: dosya kapsamı)
+        self.definitions = []  # Tanım token'ları
+        self.uses = []  # Tanımlar dahil tüm geçişler, kaynak sırasıyla
+
+    @property
+    def definition(self) -> Optional[Token]:
+        """Atlanacak tanım (ilk tanım; tanımsız adlar için None)"""
+        return self.definitions[0] if self.definitions else None
+
+class SymbolIndex:
+    """Token -> Symbol tablosu
+
+    Parser kayıtları bir kez gezilerek kurulur; sonra bir tanımlayıcı
+    token'ının sembolü, tanımı ve tüm kullanımları tek sözlük aramasıyla
+    bulunur. Blok kapsamındaki adlar tanım token'larıyla, dosya kapsamındaki
+    adlar (global değişkenler, fonksiyonlar, tanımsız adlar) adlarıyla
+    gruplanır; böylece farklı bloklardaki aynı adlı yerel değişkenler ayrı
+    sembollerdir.
+    """
+
+    def __init__(self):
+        self.symbols = {}  # Tanımlayıcı token'ı -> Symbol
+        self.globals = {}  # Ad -> dosya kapsamındaki Symbol
+
+    @classmethod
+    def from_items(cls, tokens: List[Token], items: Iterable) -> 'SymbolIndex':
+        """Üst düzey öğelerin (öğe başına göreli indeksli) kayıtlarından tablo kur"""
+        index = cls()
+        for item in items:
+            index.add(tokens, item.symbols, item.start)
+        return index
+
+    def add(self, tokens: List[Token], records: Iterable[SymbolRecord], base: int = 0):
+        """Kayıtları ekle; indeksler base'e göredir"""
+        symbols = self.symbols
+        scoped = {}  # Tanım indeksi -> Symbol (yerel tanımlar aynı öğededir)
+        for index, is_definition, definition in records:
+            token = tokens[base + index]
+            if definition is None:
+                symbol = self.globals.get(token.value)
+                if symbol is None:
+                    symbol = self.globals[token.value] = Symbol(token.value, False)
+            else:
+                symbol = scoped.get(definition)
+                if symbol is None:
+                    symbol = scoped[definition] = Symbol(token.value, True)
+            if is_definition:
+                symbol.definitions.append(token)
+            symbol.uses.append(token)
+            symbols[token] = symbol
+
+    def lookup(self, token: Token) -> Optional[Symbol]:
+        """Token'ın sembolü (tanımlayıcı kaydı yoksa None)"""
+        return self.symbols.get(token)
+
+    def __len__(self):
+        return len(self.symbols)
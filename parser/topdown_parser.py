@@ -1,75 +1,155 @@
-from typing import List, Optional
+from typing import Generator, List, Optional, Union
 from parser.parse_tree import ParseNode
+from parser.diagnostics import (Diagnostic, EXPECTED_SEMICOLON, EXPECTED_BRACE, EXPECTED_PAREN,
+                                UNEXPECTED_TOKEN, UNDEFINED_IDENTIFIER, PARSE_FAILURE)
 from lexer.lexical_analyzer import Token, TokenType
+from lexer.bracket_index import BracketIndex
+from models.token import KIND_TYPES, SPELLING_KINDS, TOKEN_TYPE_CODES
+from models.token_buffer import TokenBuffer
+
+# İkili operatörler: öncelik (büyük olan sıkı bağlar) ve düğüm adı
+ASSIGNMENT_PRECEDENCE = 1
+BINARY_OPERATORS = {
+    '=': (1, "assignment_op"), '+=': (1, "assignment_op"), '-=': (1, "assignment_op"),
+    '*=': (1, "assignment_op"), '/=': (1, "assignment_op"), '%=': (1, "assignment_op"),
+    '&=': (1, "assignment_op"), '|=': (1, "assignment_op"), '^=': (1, "assignment_op"),
+    '<<=': (1, "assignment_op"), '>>=': (1, "assignment_op"),
+    '||': (2, "logical_op"),
+    '&&': (3, "logical_op"),
+    '|': (4, "binary_op"),
+    '^': (5, "binary_op"),
+    '&': (6, "binary_op"),
+    '==': (7, "comparison_op"), '!=': (7, "comparison_op"),
+    '<': (8, "comparison_op"), '>': (8, "comparison_op"),
+    '<=': (8, "comparison_op"), '>=': (8, "comparison_op"),
+    '<<': (9, "binary_op"), '>>': (9, "binary_op"),
+    '+': (10, "binary_op"), '-': (10, "binary_op"),
+    '*': (11, "binary_op"), '/': (11, "binary_op"), '%': (11, "binary_op"),
+}
+PREFIX_OPERATORS = {'!', '~', '-', '+', '++', '--', '*', '&'}
+POSTFIX_OPERATORS = {'++', '--'}
+
+# Parser'ın karşılaştırdığı token kodları (models.token.SPELLING_KINDS)
+BINARY_KINDS = {SPELLING_KINDS[op]: entry for op, entry in BINARY_OPERATORS.items()}
+PREFIX_KINDS = frozenset(SPELLING_KINDS[op] for op in PREFIX_OPERATORS)
+POSTFIX_KINDS = frozenset(SPELLING_KINDS[op] for op in POSTFIX_OPERATORS)
+TYPE_KINDS = frozenset(SPELLING_KINDS[name] for name in ('int', 'char', 'float', 'double', 'void'))
+LITERAL_KINDS = frozenset(TOKEN_TYPE_CODES[t] for t in (TokenType.NUMBER, TokenType.STRING, TokenType.CHAR))
+IDENTIFIER_FOLLOW_KINDS = frozenset(  # Tanımlayıcıdan sonra hata sayılmayan token'lar
+    code for code, token_type in enumerate(KIND_TYPES)
+    if token_type in (TokenType.OPERATOR, TokenType.SEPARATOR, TokenType.EOF))
+IDENTIFIER = TOKEN_TYPE_CODES[TokenType.IDENTIFIER]
+PREPROCESSOR = TOKEN_TYPE_CODES[TokenType.PREPROCESSOR]
+EOF = TOKEN_TYPE_CODES[TokenType.EOF]
+IF, ELSE, WHILE, FOR, RETURN = (SPELLING_KINDS[name] for name in ('if', 'else', 'while', 'for', 'return'))
+ASSIGN, SEMICOLON, COMMA = SPELLING_KINDS['='], SPELLING_KINDS[';'], SPELLING_KINDS[',']
+LEFT_PAREN, RIGHT_PAREN = SPELLING_KINDS['('], SPELLING_KINDS[')']
+LEFT_BRACE, RIGHT_BRACE = SPELLING_KINDS['{'], SPELLING_KINDS['}']
+SYNC_KINDS = frozenset({SEMICOLON, RIGHT_BRACE, EOF}) | TYPE_KINDS  # Panik kipinde durulan token'lar
+CLOSING_KINDS = SYNC_KINDS | {RIGHT_PAREN}  # Beklenmeyen olsa da tüketilmeyen token'lar
+SKIPPED_KINDS = frozenset({LEFT_PAREN, SPELLING_KINDS['[']})  # Panik kipinde eşiyle birlikte atlanan açılışlar
+
+# Bir kural fonksiyonunun adımları: alt kuralları yield eder, sonucu geri alır
+ParseSteps = Generator['ParseSteps', Optional[ParseNode], Optional[ParseNode]]
 
 class TopDownParser:
-    """Yukarıdan-Aşağı (Özyinelemeli İniş) Parser"""
+    """Yukarıdan-Aşağı (Özyinelemeli İniş) Parser
+
+    Kural fonksiyonları (parse_statement, parse_expression...) üreteçtir:
+    bir alt kuralı çağırmak yerine onun üretecini yield eder ve sonucunu
+    geri alır. run() bu üreteçleri Python çağrı yığını yerine açık bir iş
+    yığınında sürer; böylece iç içe blok ve parantez derinliği özyineleme
+    sınırına takılmaz ve parse süresi derinlikten bağımsız olarak token
+    sayısıyla doğrusal kalır.
+    """
     
-    def __init__(self, tokens: List[Token]):
-        self.tokens = [t for t in tokens if t.type != TokenType.WHITESPACE]
+    def __init__(self, tokens: Union[List[Token], TokenBuffer], filtered: bool = False,
+                 brackets: Optional[BracketIndex] = None):
+        # TokenBuffer da kabul edilir; iterasyon Token görünümleri üretir.
+        # filtered: liste zaten boşluk token'ı içermiyor, kopyalanmadan kullanılır
+        # brackets: aynı token dizisi için lexer'ın parantez tablosu (yoksa ilk hatada kurulur)
+        self.tokens = tokens if filtered else [t for t in tokens if t.type != TokenType.WHITESPACE]
+        self.brackets = brackets
         self.current_token_index = 0
         self.current_token = self.tokens[0] if self.tokens else None
-        self.errors = []
+        self.errors = []  # Diagnostic listesi (hata bölgesi başına bir tane)
+        self.panic = None  # Kurtarma sürerken açık hata bölgesi
+        self.symbols = []  # Tanımlayıcı kayıtları (parser.symbol_index.SymbolRecord)
+        self.visible = {}  # Blok/parametre kapsamında görünen ad -> tanımın token indeksi
+        self.scopes = []  # Açık kapsam başına gölgelenen (ad, önceki tanım) listesi (boşsa dosya kapsamı)
+        
+        # Deyimin ilk token kodu -> kural fonksiyonu
+        self.statement_rules = {
+            IF: self.parse_if_statement,
+            WHILE: self.parse_while_statement,
+            FOR: self.parse_for_statement,
+            RETURN: self.parse_return_statement,
+            IDENTIFIER: self.parse_assignment_or_expression,  # Atama veya ifade
+            LEFT_BRACE: self.parse_block,
+        }
+        for kind in PREFIX_KINDS:  # Önek operatörüyle başlayan ifade (++i; *p = 0;)
+            self.statement_rules[kind] = self.parse_expression_statement
     
     def parse(self) -> ParseNode:
         """Ana parse fonksiyonu"""
         try:
-            return self.parse_program()
+            return self.run(self.parse_program())
         except Exception as e:
-            self.errors.append(f"Parse hatası: {str(e)}")
+            self.errors.append(Diagnostic(PARSE_FAILURE, None, detail=str(e)))
             return ParseNode("ERROR")
     
-    def parse_program(self) -> ParseNode:
+    def run(self, steps: ParseSteps) -> Optional[ParseNode]:
+        """Kural üretecini açık bir yığınla sonuna kadar sür ve sonucunu döndür"""
+        stack = [steps]
+        result = None
+        while stack:
+            try:
+                # yield from kullanılmaz: iç içe zincirin her adımı derinlikle orantılı sürerdi
+                child = stack[-1].send(result)
+            except StopIteration as stop:
+                stack.pop()
+                result = stop.value
+                continue
+            stack.append(child)
+            result = None
+        return result
+
+    def parse_program(self) -> ParseSteps:
         """program -> statement_list"""
         node = ParseNode("program")
         
-        while self.current_token and self.current_token.type != TokenType.EOF:
-            stmt = self.parse_statement()
+        while self.current_token and self.current_token.kind != EOF:
+            stmt = (yield self.parse_statement())
             if stmt:
                 node.add_child(stmt)
         
         return node
     
-    def parse_statement(self) -> Optional[ParseNode]:
+    def parse_statement(self) -> ParseSteps:
         """statement -> declaration | function_definition | assignment | if_stmt | while_stmt | for_stmt | expression_stmt"""
         if not self.current_token:
             return None
+        self.panic = None  # Yeni deyim: önceki hata bölgesi kapandı
 
         # Önişlemci direktifi
-        if self.current_token.type == TokenType.PREPROCESSOR:
+        kind = self.current_token.kind
+        if kind == PREPROCESSOR:
             return self.parse_preprocessor()
 
         # Değişken veya fonksiyon tanımlama/bildirimi
-        if (self.current_token.type == TokenType.KEYWORD and 
-            self.current_token.value in ['int', 'char', 'float', 'double', 'void']):
+        if kind in TYPE_KINDS:
             # İleriye bak: IDENTIFIER + '(' ise fonksiyon tanımı/bildirimi
             if (self.current_token_index + 2 < len(self.tokens) and
-                self.tokens[self.current_token_index + 1].type == TokenType.IDENTIFIER and
-                self.tokens[self.current_token_index + 2].type == TokenType.SEPARATOR and
-                self.tokens[self.current_token_index + 2].value == '('):
-                return self.parse_function_definition()
+                self.tokens[self.current_token_index + 1].kind == IDENTIFIER and
+                self.tokens[self.current_token_index + 2].kind == LEFT_PAREN):
+                return (yield self.parse_function_definition())
             else:
-                return self.parse_declaration()
+                return (yield self.parse_declaration())
 
-        # Kontrol yapıları
-        if self.current_token.type == TokenType.KEYWORD:
-            if self.current_token.value == 'if':
-                return self.parse_if_statement()
-            elif self.current_token.value == 'while':
-                return self.parse_while_statement()
-            elif self.current_token.value == 'for':
-                return self.parse_for_statement()
-            elif self.current_token.value == 'return':
-                return self.parse_return_statement()
-        
-        # Atama veya ifade
-        if self.current_token.type == TokenType.IDENTIFIER:
-            return self.parse_assignment_or_expression()
-        
-        # Blok ifadesi
-        if (self.current_token.type == TokenType.SEPARATOR and 
-            self.current_token.value == '{'):
-            return self.parse_block()
+        # Kontrol yapıları, atama/ifade ve bloklar: ilk token'ın koduna göre
+        rule = self.statement_rules.get(kind)
+        if rule is not None:
+            return (yield rule())
         
         # Bilinmeyen ifadeleri atla
         self.advance()
@@ -78,441 +158,472 @@ class TopDownParser:
     def parse_preprocessor(self) -> ParseNode:
         """preprocessor -> PREPROCESSOR"""
         node = ParseNode("preprocessor")
-        if self.current_token.type == TokenType.PREPROCESSOR:
+        if self.current_token.kind == PREPROCESSOR:
             child = ParseNode(self.current_token.value)
             child.token = self.current_token
             node.add_child(child)
             self.advance()
         return node
     
-    def parse_declaration(self) -> ParseNode:
+    def parse_declaration(self) -> ParseSteps:
         """declaration -> type IDENTIFIER [= expression] ;"""
         node = ParseNode("declaration")
         
         # Tip
-        if (self.current_token.type == TokenType.KEYWORD and 
-            self.current_token.value in ['int', 'char', 'float', 'double', 'void']):
+        if self.current_token.kind in TYPE_KINDS:
             type_node = ParseNode(self.current_token.value)
             type_node.token = self.current_token
             node.add_child(type_node)
             self.advance()
         
         # Tanımlayıcı
-        if self.current_token.type == TokenType.IDENTIFIER:
+        if self.current_token.kind == IDENTIFIER:
             id_node = ParseNode(self.current_token.value)
             id_node.token = self.current_token
             node.add_child(id_node)
+            self.define()
             self.advance()
         
         # İsteğe bağlı başlangıç değeri
-        if (self.current_token and self.current_token.type == TokenType.OPERATOR and 
-            self.current_token.value == '='):
+        if self.current_token and self.current_token.kind == ASSIGN:
             self.advance()  # =
-            expr = self.parse_expression()
+            expr = (yield self.parse_expression())
             if expr:
                 node.add_child(expr)
         
         # Noktalı virgül
-        if (self.current_token and self.current_token.type == TokenType.SEPARATOR and 
-            self.current_token.value == ';'):
-            self.advance()
-        else:
-            # Hata mesajı ve bir sonraki token'a geç
-            self.errors.append(f"Beklenen ';' satır {self.current_token.line if self.current_token else 'EOF'}")
-            if self.current_token:
-                self.advance()
+        self.expect_semicolon()
         return node
     
-    def parse_function_definition(self) -> ParseNode:
+    def parse_function_definition(self) -> ParseSteps:
         """function_definition -> type IDENTIFIER ( [params] ) block"""
         node = ParseNode("function_definition")
         # Tip
-        if (self.current_token.type == TokenType.KEYWORD and 
-            self.current_token.value in ['int', 'char', 'float', 'double', 'void']):
+        if self.current_token.kind in TYPE_KINDS:
             type_node = ParseNode(self.current_token.value)
             type_node.token = self.current_token
             node.add_child(type_node)
             self.advance()
         # Tanımlayıcı
-        if self.current_token and self.current_token.type == TokenType.IDENTIFIER:
+        if self.current_token and self.current_token.kind == IDENTIFIER:
             id_node = ParseNode(self.current_token.value)
             id_node.token = self.current_token
             node.add_child(id_node)
+            self.define()
             self.advance()
+        self.open_scope()  # Parametreler gövdeden görünür
         # (
-        if self.current_token and self.current_token.type == TokenType.SEPARATOR and self.current_token.value == '(':
+        if self.current_token and self.current_token.kind == LEFT_PAREN:
             self.advance()
             # Parametreleri parse et (basit: ')' ye kadar atla)
             params_node = ParseNode("params")
-            while self.current_token and not (self.current_token.type == TokenType.SEPARATOR and self.current_token.value == ')'):
+            while self.current_token and self.current_token.kind != RIGHT_PAREN:
                 # İsteğe bağlı olarak, burada parametre bildirimlerini parse et
                 param_token = self.current_token
                 param_node = ParseNode(param_token.value)
                 param_node.token = param_token
                 params_node.add_child(param_node)
+                if param_token.kind == IDENTIFIER:  # Tipler anahtar kelimedir: tanımlayıcılar parametre adıdır
+                    self.define()
                 self.advance()
             node.add_child(params_node)
-            if self.current_token and self.current_token.type == TokenType.SEPARATOR and self.current_token.value == ')':
+            if self.current_token and self.current_token.kind == RIGHT_PAREN:
                 self.advance()
         # Blok
-        if self.current_token and self.current_token.type == TokenType.SEPARATOR and self.current_token.value == '{':
-            block = self.parse_block()
+        if self.current_token and self.current_token.kind == LEFT_BRACE:
+            block = (yield self.parse_block())
             if block:
                 node.add_child(block)
         else:
-            self.errors.append(f"Beklenen '{{' satır {self.current_token.line if self.current_token else 'EOF'}")
+            self.report(EXPECTED_BRACE, self.current_token)
+        self.close_scope()
         return node
     
-    def parse_assignment_or_expression(self) -> ParseNode:
+    def parse_assignment_or_expression(self) -> ParseSteps:
         """assignment -> IDENTIFIER = expression ; | expression ;"""
         # Atama olup olmadığını görmek için ileriye bak
         if (self.current_token_index + 1 < len(self.tokens) and
-            self.tokens[self.current_token_index + 1].type == TokenType.OPERATOR and
-            self.tokens[self.current_token_index + 1].value == '='):
-            return self.parse_assignment()
+            self.tokens[self.current_token_index + 1].kind == ASSIGN):
+            return (yield self.parse_assignment())
         else:
-            return self.parse_expression_statement()
+            return (yield self.parse_expression_statement())
     
-    def parse_assignment(self) -> ParseNode:
+    def parse_assignment(self) -> ParseSteps:
         """assignment -> IDENTIFIER = expression ;"""
         node = ParseNode("assignment")
         
         # Tanımlayıcı
-        if self.current_token.type == TokenType.IDENTIFIER:
+        if self.current_token.kind == IDENTIFIER:
             id_node = ParseNode(self.current_token.value)
             id_node.token = self.current_token
             node.add_child(id_node)
+            self.reference()
             self.advance()
         
         # =
-        if (self.current_token and self.current_token.type == TokenType.OPERATOR and 
-            self.current_token.value == '='):
+        if self.current_token and self.current_token.kind == ASSIGN:
             self.advance()
         
         # İfade
-        expr = self.parse_expression()
+        expr = (yield self.parse_expression())
         if expr:
             node.add_child(expr)
         
         # Noktalı virgül
-        if (self.current_token and self.current_token.type == TokenType.SEPARATOR and 
-            self.current_token.value == ';'):
-            self.advance()
-        else:
-            self.errors.append(f"Beklenen ';' satır {self.current_token.line if self.current_token else 'EOF'}")
-            if self.current_token:
-                self.advance()
+        self.expect_semicolon()
         return node
     
-    def parse_expression_statement(self) -> ParseNode:
+    def parse_expression_statement(self) -> ParseSteps:
         """expression_statement -> expression ;"""
         node = ParseNode("expression_statement")
-        expr = self.parse_expression()
+        expr = (yield self.parse_expression())
         if expr:
             node.add_child(expr)
-        if (self.current_token and self.current_token.type == TokenType.SEPARATOR and 
-            self.current_token.value == ';'):
-            self.advance()
-        else:
-            self.errors.append(f"Beklenen ';' satır {self.current_token.line if self.current_token else 'EOF'}")
-            if self.current_token:
-                self.advance()
+        self.expect_semicolon()
         return node
     
-    def parse_expression(self) -> ParseNode:
-        """expression -> simple_expression ([comparison_op] simple_expression)*"""
-        node = self.parse_simple_expression()
-        
-        # Karşılaştırma operatörleri desteği
-        comparison_ops = ['>', '<', '>=', '<=', '==', '!=']
-        while (self.current_token and self.current_token.type == TokenType.OPERATOR and 
-               self.current_token.value in comparison_ops):
-            op_node = ParseNode("comparison_op")
-            op_node.add_child(node)
-            
-            op_token = ParseNode(self.current_token.value)
-            op_token.token = self.current_token
-            op_node.add_child(op_token)
-            self.advance()
-            
-            right = self.parse_simple_expression()
-            if right:
-                op_node.add_child(right)
-            
-            node = op_node
-        
-        return node
-    
-    def parse_simple_expression(self) -> ParseNode:
-        """simple_expression -> term ((+|-) term)*"""
-        node = self.parse_term()
-        
-        while (self.current_token and self.current_token.type == TokenType.OPERATOR and 
-               self.current_token.value in ['+', '-']):
-            op_node = ParseNode("binary_op")
-            op_node.add_child(node)
-            
-            op_token = ParseNode(self.current_token.value)
-            op_token.token = self.current_token
-            op_node.add_child(op_token)
-            self.advance()
-            
-            right = self.parse_term()
-            if right:
-                op_node.add_child(right)
-            
-            node = op_node
-        
-        return node
-    
-    def parse_term(self) -> ParseNode:
-        """term -> factor ((*|/) factor)*"""
-        node = self.parse_factor()
-        
-        while (self.current_token and self.current_token.type == TokenType.OPERATOR and 
-               self.current_token.value in ['*', '/']):
-            op_node = ParseNode("binary_op")
-            op_node.add_child(node)
-            
-            op_token = ParseNode(self.current_token.value)
-            op_token.token = self.current_token
+    def parse_expression(self) -> ParseSteps:
+        """expression -> unary (binary_op unary)*
+        unary -> prefix_op unary | factor postfix_op*
+
+        Öncelik tırmanma (Pratt): operatörler BINARY_OPERATORS tablosundan
+        okunur ve bir operatör yığınında tutulur. Her yeni operatör, yığındaki
+        daha sıkı bağlayan operatörleri işlenenleriyle birleştirir; böylece
+        öncelik seviyesi başına değil operatör başına tek adım atılır.
+        """
+        operands = []
+        operators = []  # (öncelik, operatör düğümü)
+        while True:
+            # Önek operatörleri işlenene (ve son ek operatörlerine) sondan başa uygulanır
+            prefixes = []
+            token = self.current_token
+            while token and token.kind in PREFIX_KINDS:
+                op_node = ParseNode(token.value)
+                op_node.token = token
+                prefixes.append(op_node)
+                self.advance()
+                token = self.current_token
+
+            node = self.parse_atom()
+            if node is None:
+                node = (yield self.parse_factor())
+            token = self.current_token
+            while token and token.kind in POSTFIX_KINDS:
+                op_node = ParseNode(token.value)
+                op_node.token = token
+                node = ParseNode("postfix_op", [node, op_node] if node else [op_node])
+                self.advance()
+                token = self.current_token
+            for op_node in reversed(prefixes):
+                node = ParseNode("unary_op", [op_node, node] if node else [op_node])
+            operands.append(node)
+
+            entry = BINARY_KINDS.get(token.kind) if token else None
+            precedence = entry[0] if entry else 0
+            # Atamalar sağdan, diğerleri soldan birleşir
+            while operators and (operators[-1][0] > precedence or (
+                    operators[-1][0] == precedence and precedence != ASSIGNMENT_PRECEDENCE)):
+                self.reduce_operator(operands, operators.pop()[1])
+            if entry is None:
+                return operands[0]
+
+            op_node = ParseNode(entry[1])
+            op_token = ParseNode(token.value)
+            op_token.token = token
             op_node.add_child(op_token)
+            operators.append((precedence, op_node))
             self.advance()
-            
-            right = self.parse_factor()
-            if right:
-                op_node.add_child(right)
-            
-            node = op_node
-        
-        return node
-    
-    def parse_factor(self) -> ParseNode:
-        """factor -> NUMBER | IDENTIFIER | STRING | CHAR | function_call | ( expression )"""
-        if self.current_token.type == TokenType.NUMBER:
+
+    @staticmethod
+    def reduce_operator(operands: List[Optional[ParseNode]], op_node: ParseNode):
+        """Yığındaki son iki işleneni ikili operatör düğümünde birleştir"""
+        right = operands.pop()
+        op_node.children.insert(0, operands[-1])
+        if right:
+            op_node.add_child(right)
+        operands[-1] = op_node
+
+    def parse_atom(self) -> Optional[ParseNode]:
+        """atom -> NUMBER | IDENTIFIER | STRING | CHAR (fonksiyon çağrısı değilse None)
+
+        Alt kural çağırmayan işlenenler üreteç açılmadan doğrudan çözümlenir.
+        """
+        if self.current_token.kind in LITERAL_KINDS:
             node = ParseNode(self.current_token.value)
             node.token = self.current_token
             self.advance()
             return node
-        elif self.current_token.type == TokenType.STRING:
+        elif self.current_token.kind == IDENTIFIER:
+            # Fonksiyon çağrısı kontrolü: IDENTIFIER '(' ... ')'
+            if (self.current_token_index + 1 < len(self.tokens) and
+                self.tokens[self.current_token_index + 1].kind == LEFT_PAREN):
+                return None
             node = ParseNode(self.current_token.value)
             node.token = self.current_token
+            self.reference()
             self.advance()
+            # Tanımlayıcı sonrası hata kontrolü
+            if self.current_token and self.current_token.kind not in IDENTIFIER_FOLLOW_KINDS:
+                self.report(UNDEFINED_IDENTIFIER, node.token)
             return node
-        elif self.current_token.type == TokenType.CHAR:
-            node = ParseNode(self.current_token.value)
-            node.token = self.current_token
-            self.advance()
+        return None
+
+    def parse_factor(self) -> ParseSteps:
+        """factor -> NUMBER | IDENTIFIER | STRING | CHAR | function_call | ( expression )"""
+        node = self.parse_atom()
+        if node is not None:
             return node
-        elif self.current_token.type == TokenType.IDENTIFIER:
-            # Fonksiyon çağrısı kontrolü: IDENTIFIER '(' ... ')'
-            if (self.current_token_index + 1 < len(self.tokens) and
-                self.tokens[self.current_token_index + 1].type == TokenType.SEPARATOR and
-                self.tokens[self.current_token_index + 1].value == '('):
-                return self.parse_function_call()
-            else:
-                node = ParseNode(self.current_token.value)
-                node.token = self.current_token
-                self.advance()
-                # Tanımlayıcı sonrası hata kontrolü
-                if (self.current_token and
-                    self.current_token.type not in [
-                        TokenType.OPERATOR, TokenType.SEPARATOR, TokenType.EOF
-                    ]):
-                    self.errors.append(
-                        f"Beklenmeyen/tanımsız tanımlayıcı kullanımı '{node.name}' satır {node.token.line}"
-                    )
-                return node
-        elif (self.current_token.type == TokenType.SEPARATOR and 
-              self.current_token.value == '('):
+        elif self.current_token.kind == IDENTIFIER:
+            return (yield self.parse_function_call())
+        elif self.current_token.kind == LEFT_PAREN:
             self.advance()  # (
-            node = self.parse_expression()
-            if (self.current_token and self.current_token.type == TokenType.SEPARATOR and 
-                self.current_token.value == ')'):
+            node = (yield self.parse_expression())
+            if self.current_token and self.current_token.kind == RIGHT_PAREN:
                 self.advance()  # )
             else:
-                self.errors.append(f"Beklenen ')' satır {self.current_token.line if self.current_token else 'EOF'}")
-                if self.current_token:
-                    self.advance()
+                # Token tüketilmez; deyim sonundaki eşitleme bölgeyi kapatır
+                self.report(EXPECTED_PAREN, self.current_token)
             return node
 
-        # Hata durumu: Tanımsız/geçersiz token
+        # Hata durumu: Tanımsız/geçersiz token (eşitleme ve kapanış token'ları çevreye bırakılır)
         if self.current_token:
-            self.errors.append(
-                f"Beklenmeyen veya tanımsız token '{self.current_token.value}' satır {self.current_token.line}"
-            )
-            self.advance()
+            self.report(UNEXPECTED_TOKEN, self.current_token)
+            if self.current_token.kind not in CLOSING_KINDS:
+                self.advance()
         return None
 
-    def parse_function_call(self) -> ParseNode:
+    def parse_function_call(self) -> ParseSteps:
         """function_call -> IDENTIFIER ( [args] )"""
         node = ParseNode("function_call")
         # Fonksiyon adı
-        if self.current_token.type == TokenType.IDENTIFIER:
+        if self.current_token.kind == IDENTIFIER:
             func_node = ParseNode(self.current_token.value)
             func_node.token = self.current_token
             node.add_child(func_node)
+            self.reference()
             self.advance()
         # (
-        if self.current_token and self.current_token.type == TokenType.SEPARATOR and self.current_token.value == '(':
+        if self.current_token and self.current_token.kind == LEFT_PAREN:
             self.advance()
             # Argümanları parse et (virgülle ayrılmış ifadeler)
             args_node = ParseNode("args")
-            while self.current_token and not (self.current_token.type == TokenType.SEPARATOR and self.current_token.value == ')'):
-                arg = self.parse_expression()
+            while self.current_token and self.current_token.kind != RIGHT_PAREN:
+                arg = (yield self.parse_expression())
                 if arg:
                     args_node.add_child(arg)
-                if self.current_token and self.current_token.type == TokenType.SEPARATOR and self.current_token.value == ',':
+                if self.current_token and self.current_token.kind == COMMA:
                     self.advance()
                 else:
                     break
             node.add_child(args_node)
-            if self.current_token and self.current_token.type == TokenType.SEPARATOR and self.current_token.value == ')':
+            if self.current_token and self.current_token.kind == RIGHT_PAREN:
                 self.advance()
             else:
-                self.errors.append(f"Beklenen ')' satır {self.current_token.line if self.current_token else 'EOF'}")
-                if self.current_token:
-                    self.advance()
+                # Token tüketilmez; deyim sonundaki eşitleme bölgeyi kapatır
+                self.report(EXPECTED_PAREN, self.current_token)
         return node
     
-    def parse_if_statement(self) -> ParseNode:
+    def parse_if_statement(self) -> ParseSteps:
         """if_stmt -> if ( expression ) statement [else statement]"""
         node = ParseNode("if_statement")
         
         self.advance()  # if
         
-        if (self.current_token and self.current_token.type == TokenType.SEPARATOR and 
-            self.current_token.value == '('):
+        if self.current_token and self.current_token.kind == LEFT_PAREN:
             self.advance()  # (
             
-            condition = self.parse_expression()
+            condition = (yield self.parse_expression())
             if condition:
                 node.add_child(condition)
             
-            if (self.current_token and self.current_token.type == TokenType.SEPARATOR and 
-                self.current_token.value == ')'):
+            if self.current_token and self.current_token.kind == RIGHT_PAREN:
                 self.advance()  # )
         
         # Then ifadesi
-        then_stmt = self.parse_statement()
+        then_stmt = (yield self.parse_statement())
         if then_stmt:
             node.add_child(then_stmt)
         
         # İsteğe bağlı else
-        if (self.current_token and self.current_token.type == TokenType.KEYWORD and 
-            self.current_token.value == 'else'):
+        if self.current_token and self.current_token.kind == ELSE:
             self.advance()  # else
-            else_stmt = self.parse_statement()
+            else_stmt = (yield self.parse_statement())
             if else_stmt:
                 node.add_child(else_stmt)
         
         return node
     
-    def parse_while_statement(self) -> ParseNode:
+    def parse_while_statement(self) -> ParseSteps:
         """while_stmt -> while ( expression ) statement"""
         node = ParseNode("while_statement")
         
         self.advance()  # while
         
-        if (self.current_token and self.current_token.type == TokenType.SEPARATOR and 
-            self.current_token.value == '('):
+        if self.current_token and self.current_token.kind == LEFT_PAREN:
             self.advance()  # (
             
-            condition = self.parse_expression()
+            condition = (yield self.parse_expression())
             if condition:
                 node.add_child(condition)
             
-            if (self.current_token and self.current_token.type == TokenType.SEPARATOR and 
-                self.current_token.value == ')'):
+            if self.current_token and self.current_token.kind == RIGHT_PAREN:
                 self.advance()  # )
         
         # Gövde ifadesi
-        body = self.parse_statement()
+        body = (yield self.parse_statement())
         if body:
             node.add_child(body)
         
         return node
     
-    def parse_for_statement(self) -> ParseNode:
+    def parse_for_statement(self) -> ParseSteps:
         """for_stmt -> for ( statement ; expression ; statement ) statement"""
         node = ParseNode("for_statement")
         
         self.advance()  # for
+        self.open_scope()  # Başlıkta bildirilen değişken döngüye aittir
         
-        if (self.current_token and self.current_token.type == TokenType.SEPARATOR and 
-            self.current_token.value == '('):
+        if self.current_token and self.current_token.kind == LEFT_PAREN:
             self.advance()  # (
             
             # Başlangıç
-            init = self.parse_statement()
+            init = (yield self.parse_statement())
             if init:
                 node.add_child(init)
             
             # Koşul
-            condition = self.parse_expression()
+            condition = (yield self.parse_expression())
             if condition:
                 node.add_child(condition)
             
-            if (self.current_token and self.current_token.type == TokenType.SEPARATOR and 
-                self.current_token.value == ';'):
+            if self.current_token and self.current_token.kind == SEMICOLON:
                 self.advance()  # ;
             
             # Güncelleme
-            update = self.parse_expression()
+            update = (yield self.parse_expression())
             if update:
                 node.add_child(update)
             
-            if (self.current_token and self.current_token.type == TokenType.SEPARATOR and 
-                self.current_token.value == ')'):
+            if self.current_token and self.current_token.kind == RIGHT_PAREN:
                 self.advance()  # )
         
         # Gövde
-        body = self.parse_statement()
+        body = (yield self.parse_statement())
         if body:
             node.add_child(body)
         
+        self.close_scope()
         return node
     
-    def parse_return_statement(self) -> ParseNode:
+    def parse_return_statement(self) -> ParseSteps:
         """return_stmt -> return [expression] ;"""
         node = ParseNode("return_statement")
         
         self.advance()  # return
         
         # İsteğe bağlı ifade
-        if (self.current_token and 
-            not (self.current_token.type == TokenType.SEPARATOR and self.current_token.value == ';')):
-            expr = self.parse_expression()
+        if self.current_token and self.current_token.kind != SEMICOLON:
+            expr = (yield self.parse_expression())
             if expr:
                 node.add_child(expr)
         
         # Noktalı virgül
-        if (self.current_token and self.current_token.type == TokenType.SEPARATOR and 
-            self.current_token.value == ';'):
+        if self.current_token and self.current_token.kind == SEMICOLON:
             self.advance()
         
         return node
     
-    def parse_block(self) -> ParseNode:
+    def parse_block(self) -> ParseSteps:
         """block -> { statement_list }"""
         node = ParseNode("block")
         
-        if (self.current_token and self.current_token.type == TokenType.SEPARATOR and 
-            self.current_token.value == '{'):
+        if self.current_token and self.current_token.kind == LEFT_BRACE:
             self.advance()  # {
+            self.open_scope()
             
-            while (self.current_token and 
-                   not (self.current_token.type == TokenType.SEPARATOR and self.current_token.value == '}')):
-                stmt = self.parse_statement()
+            while self.current_token and self.current_token.kind != RIGHT_BRACE:
+                stmt = (yield self.parse_statement())
                 if stmt:
                     node.add_child(stmt)
             
-            if (self.current_token and self.current_token.type == TokenType.SEPARATOR and 
-                self.current_token.value == '}'):
+            self.close_scope()
+            if self.current_token and self.current_token.kind == RIGHT_BRACE:
                 self.advance()  # }
         
         return node
     
+    def open_scope(self):
+        """Blok/parametre kapsamı aç"""
+        self.scopes.append([])
+
+    def close_scope(self):
+        """Kapsamı kapat: gölgelenen tanımları geri yükle"""
+        visible = self.visible
+        for name, previous in reversed(self.scopes.pop()):
+            if previous is None:
+                del visible[name]
+            else:
+                visible[name] = previous
+
+    def define(self):
+        """Geçerli tanımlayıcı token'ını açık kapsamda (yoksa dosya kapsamında) tanım olarak kaydet"""
+        index = self.current_token_index
+        if self.scopes:
+            name = self.current_token.value
+            self.scopes[-1].append((name, self.visible.get(name)))
+            self.visible[name] = index
+            self.symbols.append((index, True, index))
+        else:
+            self.symbols.append((index, True, None))
+
+    def reference(self):
+        """Geçerli tanımlayıcı token'ını en içteki görünür tanıma bağlı kullanım olarak kaydet
+
+        Görünür tanım yoksa ad dosya kapsamındadır (None); tablo kurulurken adla eşlenir.
+        """
+        self.symbols.append((self.current_token_index, False, self.visible.get(self.current_token.value)))
+
+    def report(self, code: str, token: Optional[Token]):
+        """Hata bildir: kurtarma sürüyorsa yeni tanı açmak yerine açık bölgeyi genişlet"""
+        if self.panic is not None:
+            self.panic.extend(token)
+            return
+        self.panic = Diagnostic(code, token)
+        self.errors.append(self.panic)
+
+    def expect_semicolon(self):
+        """Deyim sonu: ';' yoksa hata bildir ve eşitleme token'ına kadar atla"""
+        if self.current_token and self.current_token.kind == SEMICOLON:
+            self.advance()
+            self.panic = None
+        else:
+            self.report(EXPECTED_SEMICOLON, self.current_token)
+            self.synchronize()
+
+    def synchronize(self):
+        """Panik kipi: ';' (tüketilir), '}' veya tip anahtar kelimesine kadar token'ları atla
+
+        Dengeli ( ) ve [ ] bölgeleri parantez tablosuyla tek adımda atlanır;
+        içlerindeki ';' ve tip anahtar kelimeleri (for başlığı, cast) eşitleme
+        noktası sayılmaz. Atlanan token'lar tek bir tanının bölgesine eklenir.
+        """
+        if self.brackets is None:
+            self.brackets = BracketIndex(self.tokens)
+        while self.current_token and self.current_token.kind not in SYNC_KINDS:
+            index = self.current_token_index
+            end = self.brackets.skip(index) if self.current_token.kind in SKIPPED_KINDS else index + 1
+            self.panic.extend(self.tokens[end - 1])
+            self.seek(end)
+        if self.current_token and self.current_token.kind == SEMICOLON:
+            self.panic.extend(self.current_token)
+            self.advance()
+        self.panic = None
+
+    def seek(self, index: int):
+        """Verilen token indeksine atla (yeniden kullanılan alt ağaçların sonuna)"""
+        self.current_token_index = index
+        self.current_token = self.tokens[index] if index < len(self.tokens) else None
+    
     def advance(self):
         """Bir sonraki token'a geç"""
         self.current_token_index += 1
@@ -0,0 +1,87 @@
+"""İçerik anahtarlı LRU analiz önbelleği: isabetler ıskalamalarla aynı sonucu verir"""
+import random
+
+from cli.corpus import generate_corpus
+from lexer.lexical_analyzer import LexicalAnalyzer
+from models.analysis_cache import AnalysisCache
+from parser.incremental_parser import IncrementalParser
+from parser.topdown_parser import TopDownParser
+
+
+def token_shape(tokens):
+    return [(token.type, token.value, token.line, token.column, token.position) for token in tokens]
+
+
+def checkpoints(lexer):
+    return [(checkpoint.position, checkpoint.line, checkpoint.state, checkpoint.token_index)
+            for checkpoint in lexer.line_checkpoints]
+
+
+def tree_shape(root):
+    shape, stack = [], [(root, 0)]
+    while stack:
+        node, depth = stack.pop()
+        if node is None:
+            shape.append(None)
+            continue
+        token = node.token
+        shape.append((depth, node.name, None if token is None else
+                      (token.value, token.line, token.column, token.position)))
+        stack.extend((child, depth + 1) for child in reversed(node.children))
+    return shape
+
+
+def error_shape(errors):
+    return [(error.code, error.start, error.end, str(error)) for error in errors]
+
+
+def test_lexer_hit_matches_miss():
+    cache = AnalysisCache()
+    text = generate_corpus(size=3000, seed=3)
+    miss = LexicalAnalyzer(cache=cache)
+    expected = token_shape(miss.analyze(text))
+    hit = LexicalAnalyzer(cache=cache)
+    assert token_shape(hit.analyze(text)) == expected
+    assert checkpoints(hit) == checkpoints(miss)
+    assert (hit.line, hit.column, hit.position) == (miss.line, miss.column, miss.position)
+    assert cache.stats()['hits'] == {'lex-state': 1}
+    # Geri yüklenen liste önbellekteki kaydı paylaşmaz: artımlı analiz onu değiştirmemeli
+    hit.analyze_incremental(text.replace('int', 'long', 1))
+    assert token_shape(LexicalAnalyzer(cache=cache).analyze(text)) == expected
+
+
+def test_parse_hit_matches_fresh_parse_across_undo():
+    """Geri al/yinele ile önbellekten gelen lex ve parse sonuçları taze analizle aynıdır"""
+    rnd = random.Random(19)
+    for seed in range(6):
+        cache = AnalysisCache()
+        lexer = LexicalAnalyzer(cache=cache)
+        parser = IncrementalParser(cache=cache)
+        history = [generate_corpus(size=1200, seed=seed)]
+        text = history[0]
+        for step in range(25):
+            if len(history) > 1 and rnd.random() < 0.35:
+                text = rnd.choice(history)  # Geri al / yinele
+            else:
+                start = rnd.randrange(len(text) + 1)
+                end = min(len(text), start + rnd.choice([0, 1, 3]))
+                text = text[:start] + rnd.choice(['x', 'aaaa', '\n', ';', ' ', '(', '']) + text[end:]
+                history.append(text)
+            root = parser.parse(lexer.analyze_incremental(text), lexer.last_splice, lexer.bracket_index(), text)
+            fresh = TopDownParser(LexicalAnalyzer().analyze(text))
+            assert tree_shape(root) == tree_shape(fresh.parse())
+            assert error_shape(parser.errors) == error_shape(fresh.errors)
+        assert cache.stats()['hits'].get('parse', 0) > 0
+
+
+def test_eviction_keeps_results_correct():
+    cache = AnalysisCache(budget=64 * 1024)
+    texts = [generate_corpus(size=2000, seed=seed) for seed in range(8)]
+    expected = [token_shape(LexicalAnalyzer().analyze(text)) for text in texts]
+    lexer = LexicalAnalyzer(cache=cache)
+    for round_ in range(2):
+        for text, tokens in zip(texts, expected):
+            assert token_shape(lexer.analyze(text)) == tokens
+    stats = cache.stats()
+    assert stats['size'] <= stats['budget']
+    assert cache.evictions > 0
@@ -0,0 +1,153 @@
+"""Kalıcı disk önbelleği (cli.disk_cache.DiskCache) testleri"""
+import os
+import time
+
+import pytest
+
+from cli.analyze import analyze_path
+from cli.disk_cache import CACHE_DIRNAME, MARKER_NAME, TEMP_PREFIX, DiskCache
+
+VERSION = '0123456789abcdef'
+OTHER_VERSION = 'fedcba9876543210'
+RESULT = {'bytes': 11, 'tokens': 5, 'lexical_error_samples': [{'line': 1, 'column': 9, 'value': 'ç'}]}
+
+
+def stored(directory, key, result=RESULT, version=VERSION):
+    cache = DiskCache(str(directory), version)
+    cache.store(key, result, parsed=True)
+    return cache
+
+
+def cache_files(directory):
+    return sorted(os.path.relpath(os.path.join(base, name), directory)
+                  for base, _, files in os.walk(directory) for name in files)
+
+
+def test_store_load_round_trip(tmp_path):
+    key = DiskCache.key('int a = 1;\n')
+    cache = stored(tmp_path, key)
+    entry = cache.load(key)
+    assert entry.result == RESULT and entry.parsed is True
+    assert cache.load(DiskCache.key('başka')) is None
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert (tmp_path / CACHE_DIRNAME / MARKER_NAME).is_file()
+    assert cache.path(key) == str(tmp_path / CACHE_DIRNAME / VERSION / key[:2] / key)
+
+
+def test_store_replaces_atomically(tmp_path, monkeypatch):
+    key = DiskCache.key('x')
+    cache = stored(tmp_path, key)
+    cache.store(key, {'tokens': 7}, parsed=False)
+    assert cache.load(key).result == {'tokens': 7}
+
+    def failing_replace(source, target):
+        raise OSError("disk dolu")
+    monkeypatch.setattr(os, 'replace', failing_replace)
+    cache.store(key, {'tokens': 8})  # Hata yutulur, eski kayıt bozulmaz
+    assert cache.load(key).result == {'tokens': 7}
+    assert not any(name.startswith(TEMP_PREFIX) for name in os.listdir(os.path.dirname(cache.path(key))))
+
+
+@pytest.mark.parametrize('content', [
+    b'',
+    b'\x80\x03}q\x00.',  # pickle
+    b'{"result": {"tokens": 5}, "parsed": tr',  # Yarım yazılmış kayıt
+    b'{"result": {"tokens": 5}}',  # Eksik alan
+    b'{"result": [1, 2], "parsed": false}',  # Sözlük olmayan sonuç
+    b'null',
+    b'[]',
+])
+def test_corrupted_entries_are_misses(tmp_path, content):
+    key = DiskCache.key('bozuk')
+    cache = stored(tmp_path, key)
+    with open(cache.path(key), 'wb') as file:
+        file.write(content)
+    assert cache.load(key) is None
+    assert cache.misses == 1
+    cache.store(key, RESULT)  # Sonraki yazım üzerine yazar
+    assert cache.load(key).result == RESULT
+
+
+def test_version_change_invalidates(tmp_path):
+    key = DiskCache.key('int a;')
+    old = stored(tmp_path, key, version=OTHER_VERSION)
+    new = DiskCache(str(tmp_path), VERSION)
+    assert new.load(key) is None
+    new.store(key, RESULT)
+    assert new.prune(max_bytes=1 << 20) == 1  # Eski sürümün kaydı
+    assert old.load(key) is None and new.load(key) is not None
+    assert not (tmp_path / CACHE_DIRNAME / OTHER_VERSION).exists()
+
+
+def test_prune_removes_least_recently_used(tmp_path):
+    keys = [DiskCache.key(str(number)) for number in range(3)]
+    cache = DiskCache(str(tmp_path), VERSION)
+    now = time.time()
+    for age, key in zip((30, 20, 10), keys):
+        cache.store(key, RESULT)
+        os.utime(cache.path(key), (now - age, now - age))
+    size = os.path.getsize(cache.path(keys[0]))
+    assert cache.prune(max_bytes=2 * size) == 1
+    assert [cache.load(key) is not None for key in keys] == [False, True, True]
+
+
+def test_prune_removes_only_stale_temp_files(tmp_path):
+    key = DiskCache.key('y')
+    cache = stored(tmp_path, key)
+    shard = os.path.dirname(cache.path(key))
+    stale, fresh = os.path.join(shard, TEMP_PREFIX + 'eski'), os.path.join(shard, TEMP_PREFIX + 'yeni')
+    for path in (stale, fresh):
+        open(path, 'wb').close()
+    old = time.time() - 2 * 3600
+    os.utime(stale, (old, old))
+    assert cache.prune(max_bytes=1 << 20) == 1
+    assert not os.path.exists(stale) and os.path.exists(fresh)
+
+
+def test_prune_leaves_non_cache_files_alone(tmp_path):
+    """--cache-dir analiz edilen projenin üst dizini olsa bile kullanıcı dosyaları silinmez"""
+    project = tmp_path / 'proj'
+    project.mkdir()
+    (project / 'a.c').write_text('int a = 1;\n')
+    (tmp_path / 'notes.txt').write_text('notlar')
+    (tmp_path / OTHER_VERSION).mkdir()  # Önbellek dışında, sürüm adına benzeyen dizin
+    (tmp_path / OTHER_VERSION / 'ab').mkdir()
+    (tmp_path / OTHER_VERSION / 'ab' / ('ab' * 20)).write_text('kullanıcı')
+
+    cache = DiskCache(str(tmp_path), VERSION)
+    analyze_path(str(project / 'a.c'), parse=True, cache=cache)
+    root = tmp_path / CACHE_DIRNAME
+    (root / 'README').write_text('önbellek içinde ama kayıt değil')
+    (root / VERSION / 'alt').mkdir()
+    (root / VERSION / 'alt' / 'dosya').write_text('kayıt değil')
+    before = cache_files(tmp_path)
+
+    assert cache.prune(max_bytes=0) == 1  # Yalnızca analiz kaydı
+    after = cache_files(tmp_path)
+    assert sorted(set(before) - set(after)) == [os.path.relpath(cache.path(DiskCache.key(b'int a = 1;\n')), tmp_path)]
+
+
+def test_prune_refuses_directory_without_marker(tmp_path):
+    key = DiskCache.key('z')
+    cache = stored(tmp_path, key)
+    os.unlink(tmp_path / CACHE_DIRNAME / MARKER_NAME)
+    assert cache.prune(max_bytes=0) == 0
+    assert cache.load(key) is not None
+
+
+def test_analyze_path_hit_matches_miss(tmp_path):
+    source = tmp_path / 'a.c'
+    source.write_text('int main() {\n    int ç = 1 @;\n    return 0\n}\n', encoding='utf-8')
+    cache = DiskCache(str(tmp_path / 'cache'), VERSION)
+    miss = analyze_path(str(source), parse=True, max_errors=1, cache=cache)
+    hit = analyze_path(str(source), parse=True, max_errors=1, cache=cache)
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert 'cached' not in miss and hit.pop('cached') is True
+    for result in (miss, hit):
+        result.pop('lex_seconds'), result.pop('parse_seconds')
+    assert hit == miss
+    # Ayrıştırılmamış kayıt parse isteğini karşılamaz
+    other = tmp_path / 'b.c'
+    other.write_text('int b;\n')
+    analyze_path(str(other), parse=False, cache=cache)
+    assert 'cached' not in analyze_path(str(other), parse=True, cache=cache)
@@ -0,0 +1,78 @@
+"""Artımlı parser'ın (alt ağaç yeniden kullanımı) taze parse ile uyumu"""
+import random
+
+from lexer.lexical_analyzer import LexicalAnalyzer
+from parser.incremental_parser import IncrementalParser
+from parser.topdown_parser import TopDownParser
+
+ALPHABET = list("ab1 2\n\n;;;{}}{()=+-*<>,") + [
+    'if', 'int ', 'while ', 'for', 'return ', 'void ', '/* c */', '"s"', '\n', 'int f(){', '}\n',
+    '#include <x>\n', 'x = 1;', 'int a = 2;',
+]
+
+
+def random_text(rnd, length):
+    return ''.join(rnd.choice(ALPHABET) for _ in range(length))
+
+
+def tree_shape(root):
+    """Düğüm adları ve token konumlarının ön sıralı listesi (derinlik sınırsız)"""
+    shape, stack = [], [(root, 0)]
+    while stack:
+        node, depth = stack.pop()
+        if node is None:
+            shape.append(None)
+            continue
+        token = node.token
+        shape.append((depth, node.name, None if token is None else
+                      (token.value, token.line, token.column, token.position)))
+        stack.extend((child, depth + 1) for child in reversed(node.children))
+    return shape
+
+
+def error_shape(errors):
+    return [(error.code, error.start, error.end, str(error)) for error in errors]
+
+
+def fresh_parse(text):
+    parser = TopDownParser(LexicalAnalyzer().analyze(text))
+    return tree_shape(parser.parse()), error_shape(parser.errors)
+
+
+def test_edits_match_fresh_parse():
+    """Her düzenlemeden sonra (lexer splice'ıyla ya da splice'sız) sonuç taze TopDownParser ile aynıdır"""
+    rnd = random.Random(12)
+    for trial in range(150):
+        text = random_text(rnd, rnd.randint(0, 200))
+        lexer = LexicalAnalyzer()
+        parser = IncrementalParser()
+        parser.parse(lexer.analyze(text))
+        for step in range(6):
+            start = rnd.randint(0, len(text))
+            end = rnd.randint(start, min(len(text), start + 5))
+            text = text[:start] + random_text(rnd, rnd.randint(0, 3)) + text[end:]
+            tokens = lexer.analyze_incremental(text)
+            splice = lexer.last_splice if step % 3 else None
+            root = parser.parse(tokens, splice, lexer.bracket_index())
+            assert (tree_shape(root), error_shape(parser.errors)) == fresh_parse(text), text
+
+
+def test_sliced_and_cancelled_runs_match_fresh_parse():
+    """Dilimlerle ilerletilen ya da yarıda bırakılan parse'lar sonraki sonucu bozmaz"""
+    rnd = random.Random(13)
+    for trial in range(80):
+        text = random_text(rnd, rnd.randint(0, 200))
+        lexer = LexicalAnalyzer()
+        parser = IncrementalParser()
+        parser.parse(lexer.analyze(text))
+        for step in range(5):
+            start = rnd.randint(0, len(text))
+            end = rnd.randint(start, min(len(text), start + 5))
+            text = text[:start] + random_text(rnd, rnd.randint(0, 3)) + text[end:]
+            run = parser.start(lexer.analyze_incremental(text), lexer.last_splice)
+            if rnd.random() < 0.3:
+                run.step(0)  # Yeni düzenleme geldi; bu parse bırakılır
+                continue
+            while not run.step(0):
+                pass
+            assert (tree_shape(run.root), error_shape(parser.errors)) == fresh_parse(text), text
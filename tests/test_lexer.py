@@ -0,0 +1,81 @@
+"""Lexer motorlarının birbirleriyle ve tam analizle uyumu"""
+import random
+
+from lexer.lexical_analyzer import LexicalAnalyzer
+
+SAMPLE = '''#include <stdio.h>
+/* Çok satırlı
+   yorum */
+int toplam(int a, int b) { return a + b; }
+int main() {
+    char *s = "ğüş\\"x"; char c = '\\n';
+    float f = 3.14; int ç = 1;
+    if (a <= b && b != 0) { x += 2; } // satır yorumu
+    y = 1 @ 2 $ `; "kapanmamış
+}
+'''
+
+
+def snapshot(tokens):
+    return [(token.type, token.value, token.line, token.column, token.position) for token in tokens]
+
+
+def test_bytes_lexer_matches_str_lexer():
+    """Headless analyze (bayt deseni) GUI'nin str lexer'ıyla aynı token'ları üretir"""
+    texts = [SAMPLE, 'int ç = 1;\n', 'a\x1cb\x1f c;\n', 'x = "€" + €;\n', ''.join(map(chr, range(128)))]
+    for text in texts:
+        expected = snapshot(LexicalAnalyzer().analyze(text))
+        assert snapshot(LexicalAnalyzer().analyze_bytes(text.encode('utf-8'))) == expected
+
+
+def test_bytes_lexer_reports_no_errors_for_unicode_identifiers():
+    buffer = LexicalAnalyzer().analyze_bytes('int ç = 1;\n'.encode('utf-8'))
+    assert [(token.type.name, token.value) for token in buffer][:2] == [('KEYWORD', 'int'), ('IDENTIFIER', 'ç')]
+    assert all(token.type.name != 'ERROR' for token in buffer)
+
+
+ALPHABET = list("ab1 2.\n\n  /*\"'\\+=-<>(){};,#xyz\t@ş") + ['if', 'int ', '<<=', '->', '*/', '//']
+
+
+def random_text(rnd, length):
+    return ''.join(rnd.choice(ALPHABET) for _ in range(length))
+
+
+def checkpoints(lexer):
+    return [(checkpoint.position, checkpoint.line, checkpoint.state, checkpoint.token_index)
+            for checkpoint in lexer.line_checkpoints]
+
+
+def test_incremental_matches_full_analysis():
+    """Rastgele düzenlemelerden sonra artımlı analiz, aynı metnin tam analiziyle aynıdır"""
+    rnd = random.Random(1)
+    for trial in range(300):
+        text = random_text(rnd, rnd.randint(0, 80))
+        lexer = LexicalAnalyzer()
+        lexer.analyze(text)
+        for step in range(5):
+            start = rnd.randint(0, len(text))
+            end = rnd.randint(start, min(len(text), start + 5))
+            inserted = random_text(rnd, rnd.randint(0, 4))
+            new_text = text[:start] + inserted + text[end:]
+            if step % 2:
+                tokens = lexer.analyze_incremental(new_text, start, end, start + len(inserted))
+            else:
+                tokens = lexer.analyze_incremental(new_text)  # Aralık metin farkından bulunur
+            fresh = LexicalAnalyzer()
+            assert snapshot(tokens) == snapshot(fresh.analyze(new_text)), (text, new_text)
+            assert checkpoints(lexer) == checkpoints(fresh)
+            text = new_text
+
+
+def test_regex_engine_matches_state_machine():
+    """ENGINE_REGEX, durum makinesiyle aynı token'ları, checkpoint'leri ve son konumu üretir"""
+    rnd = random.Random(2)
+    texts = [SAMPLE, '', '"', "'a", '/* açık', 'a\\\n"b', '²½一 ş1.5.']
+    texts += [random_text(rnd, rnd.randint(0, 100)) for _ in range(1000)]
+    for text in texts:
+        state = LexicalAnalyzer(engine=LexicalAnalyzer.ENGINE_STATE)
+        regex = LexicalAnalyzer(engine=LexicalAnalyzer.ENGINE_REGEX)
+        assert snapshot(regex.analyze(text)) == snapshot(state.analyze(text)), text
+        assert checkpoints(regex) == checkpoints(state)
+        assert (regex.line, regex.column, regex.position) == (state.line, state.column, state.position)
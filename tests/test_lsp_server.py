@@ -0,0 +1,66 @@
+"""Dil sunucusunun kayıtlı oturum betiği üzerinden uçtan uca testi
+
+tests/lsp_session.jsonl `main.py lsp --replay` ile oynatılır ve stdout'a
+yazılan JSON Lines yanıtları doğrulanır.
+"""
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+SCRIPT = Path(__file__).resolve().parent / 'lsp_session.jsonl'
+
+
+def replay():
+    completed = subprocess.run(
+        [sys.executable, 'main.py', 'lsp', '--replay', str(SCRIPT)],
+        cwd=ROOT, capture_output=True, text=True, encoding='utf-8', timeout=60)
+    assert completed.returncode == 0, completed.stderr
+    messages = [json.loads(line) for line in completed.stdout.splitlines() if line.strip()]
+    responses = {message['id']: message for message in messages if 'id' in message}
+    notifications = [message for message in messages if 'id' not in message]
+    return responses, notifications
+
+
+def apply_edits(data, edits):
+    """SemanticTokensDelta düzenlemelerini (sondan başa) tam diziye uygula"""
+    data = list(data)
+    for edit in sorted(edits, key=lambda edit: edit['start'], reverse=True):
+        data[edit['start']:edit['start'] + edit['deleteCount']] = edit.get('data', [])
+    return data
+
+
+def test_lsp_replay_session():
+    responses, notifications = replay()
+
+    capabilities = responses[1]['result']['capabilities']
+    assert capabilities['textDocumentSync']['change'] == 2
+    assert capabilities['semanticTokensProvider']['full'] == {'delta': True}
+    assert capabilities['foldingRangeProvider'] is True
+
+    diagnostics = [n['params'] for n in notifications
+                   if n['method'] == 'textDocument/publishDiagnostics']
+    assert [d['version'] for d in diagnostics] == [1, 2]
+    opened = diagnostics[0]['diagnostics']
+    assert [d['code'] for d in opened] == ['lexical-error', 'expected-semicolon']
+    assert opened[0]['range'] == {'start': {'line': 6, 'character': 14},
+                                  'end': {'line': 6, 'character': 15}}
+    assert diagnostics[1]['diagnostics'] == []  # Düzenleme '@' hatasını siler
+
+    first = responses[2]['result']
+    assert first['resultId'] == '1'
+    assert len(first['data']) % 5 == 0
+
+    delta = responses[3]['result']
+    second = responses[4]['result']
+    assert delta['resultId'] == '2' and second['resultId'] == '3'
+    assert len(second['data']) % 5 == 0
+    assert apply_edits(first['data'], delta['edits']) == second['data']
+
+    assert responses[5]['result'] == [
+        {'startLine': 0, 'endLine': 1, 'kind': 'imports'},
+        {'startLine': 3, 'endLine': 4, 'kind': 'comment'},
+        {'startLine': 5, 'endLine': 8},
+    ]
+    assert responses[6]['result'] is None